@@ -0,0 +1,269 @@
+"""
+Benchmark de desempenho das funções de tratamento e de gráficos.
+
+Usa os CSVs do projeto e painéis sintéticos (o gapminder replicado 10x, 100x e 1000x, com
+nomes de país distintos por cópia). Para cada caso mede o tempo (mediana e mínimo de
+várias repetições) e o pico de memória alocada (tracemalloc, em uma execução separada),
+e grava o resultado em JSON para comparar execuções.
+
+Uso:
+    python benchmarks/desempenho.py --saida resultado.json
+    python benchmarks/desempenho.py --escalas 1 10 --filtro integrar
+    python benchmarks/desempenho.py --comparar base.json --tolerancia 0.25
+
+Sai com código 1 se algum caso ficar mais lento que a base além da tolerância.
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+
+import matplotlib
+matplotlib.use('Agg')  # renderização sem interface gráfica, antes de qualquer pyplot
+
+import numpy as np
+import pandas as pd
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import tratamento  # noqa: E402
+from graficos import plotagem  # noqa: E402
+
+ESCALAS = (1, 10, 100, 1000)
+
+# Gráficos a partir desta escala são pulados por padrão (o seaborn agrega todas as linhas)
+ESCALA_MAXIMA_GRAFICOS = 10
+
+
+# --- Dados de entrada ---
+_dados = {}
+_pasta_temporaria = tempfile.TemporaryDirectory(prefix='benchmark_puc_')
+
+
+def _carregar(arquivo):
+    if arquivo not in _dados:
+        with contextlib.redirect_stdout(io.StringIO()):
+            _dados[arquivo] = tratamento.import_data(os.path.join(RAIZ, arquivo))
+    return _dados[arquivo]
+
+
+def painel_sintetico(base, escala, coluna_pais):
+    """
+    Replica um DataFrame 'escala' vezes; a cópia k>0 tem os países renomeados para '<país> k'.
+    A cópia 0 mantém os nomes originais (ex.: 'Brazil' continua existindo).
+    """
+    if escala == 1:
+        return base
+    chave = (id(base), escala, coluna_pais)
+    if chave not in _dados:
+        n = len(base)
+        copias = np.repeat(np.arange(escala), n)
+        sufixos = np.where(copias == 0, '', ' ' + copias.astype(str))
+        df = pd.DataFrame({c: np.tile(base[c].to_numpy(), escala) for c in base.columns})
+        df[coluna_pais] = np.char.add(df[coluna_pais].to_numpy().astype(str), sufixos).astype(object)
+        _dados[chave] = df
+    return _dados[chave]
+
+
+def gapminder(escala):
+    return painel_sintetico(_carregar('gapminder_full.csv'), escala, 'country')
+
+
+def idh(escala):
+    return painel_sintetico(_carregar('human-development-index.csv'), escala, 'Entity')
+
+
+def csv_gapminder(escala):
+    # Caminho de um CSV com o gapminder na escala pedida (gravado uma vez por execução)
+    if escala == 1:
+        return os.path.join(RAIZ, 'gapminder_full.csv')
+    caminho = os.path.join(_pasta_temporaria.name, f'gapminder_{escala}x.csv')
+    if not os.path.exists(caminho):
+        gapminder(escala).to_csv(caminho, index=False)
+    return caminho
+
+
+# --- Casos ---
+def _metadados_pandas(dataframe):
+    # Referência: a versão de gerar_metadados anterior ao perfil em uma passada (isnull + nunique).
+    # 'gerar_metadados' deve ficar na mesma ordem de grandeza deste caso em todas as escalas.
+    qt_nulos = dataframe.isnull().sum()
+    return pd.DataFrame({
+        'nome_variavel': dataframe.columns,
+        'tipo': dataframe.dtypes.values,
+        'qt_nulos': qt_nulos.values,
+        'percent_nulos': round((qt_nulos / len(dataframe)) * 100, 2).values,
+        'cardinalidade': dataframe.nunique().values,
+    })
+
+
+def _renderizar(nome, *args):
+    def executar(escala):
+        df = gapminder(escala)
+        argumentos = args[0](df) if callable(args[0]) else (df, *args)
+        arquivo = os.path.join(_pasta_temporaria.name, f'{nome}.png')
+        plotagem._arquivo_saida = arquivo
+        try:
+            getattr(plotagem, nome)(*argumentos)
+        finally:
+            plotagem._arquivo_saida = None
+            plotagem.plt.close('all')
+    return executar
+
+
+CASOS = {
+    'import_data': lambda escala: tratamento.import_data(csv_gapminder(escala)),
+    'gerar_metadados': lambda escala: tratamento.gerar_metadados(gapminder(escala)),
+    'gerar_metadados.pandas': lambda escala: _metadados_pandas(gapminder(escala)),
+    'verificar_NaN': lambda escala: tratamento.verificar_NaN(idh(escala)),
+    'verifica_dados_duplicados': lambda escala: tratamento.verifica_dados_duplicados(gapminder(escala)),
+    'integrar_dataframes_por_pais': lambda escala: tratamento.integrar_dataframes_por_pais(
+        gapminder(escala), idh(escala), 'country', 'Entity',
+        resolvedor=tratamento.ResolvedorPaises(tratamento.MAPA_PAISES),
+    ),
+    'correlacoes': lambda escala: tratamento.AnaliseRelacoes(gapminder(escala)).correlacoes(
+        ['lifeExp', 'gdpPercap', 'pop'], log=['gdpPercap', 'pop']),
+    'grafico.graficos_linhas_continente': _renderizar('graficos_linhas_continente', 'Asia', 'lifeExp'),
+    'grafico.graficos_linhas_pais': _renderizar('graficos_linhas_pais', 'Brazil', 'lifeExp'),
+    'grafico.comparando_cont': _renderizar('comparando_cont', 'lifeExp'),
+    'grafico.distribuicao_por_continente': _renderizar('distribuicao_por_continente', 2007, 'lifeExp'),
+    'grafico.plotar_comparacao_dois_continentes': _renderizar(
+        'plotar_comparacao_dois_continentes', ['Asia', 'Europe'], 'lifeExp'),
+    'grafico.graficos_mundos': _renderizar('graficos_mundos', lambda df: (df, 'year', 'lifeExp')),
+    'grafico.plotar_comparacao_multiplos_paises': _renderizar(
+        'plotar_comparacao_multiplos_paises', ['Brazil', 'Chile'], 'lifeExp'),
+    'grafico.plotar_pais_vs_media_continente': _renderizar('plotar_pais_vs_media_continente', 'Brazil', 'lifeExp'),
+    # Visão geral de 50 países: uma grade de pequenos múltiplos contra 50 figuras separadas
+    'grafico.graficos_facetas[50]': _renderizar(
+        'graficos_facetas', lambda df: (df, 'lifeExp', df['country'].unique()[:50].tolist())),
+    'grafico.graficos_linhas_pais[50]': lambda escala: [
+        _renderizar('graficos_linhas_pais', pais, 'lifeExp')(escala)
+        for pais in gapminder(escala)['country'].unique()[:50]
+    ],
+}
+
+
+def medir(funcao, escala, repeticoes=3):
+    """
+    Executa funcao(escala) 'repeticoes' vezes medindo o tempo e uma vez a mais sob tracemalloc.
+
+    Returns:
+        dict: mediana_s, minimo_s e pico_mb (pico de memória alocada durante a chamada).
+    """
+    with contextlib.redirect_stdout(io.StringIO()), warnings.catch_warnings():
+        warnings.simplefilter('ignore', FutureWarning)  # avisos de depreciação do seaborn
+        funcao(escala)  # aquecimento: prepara os dados da escala e os caches de importação do Python
+        tempos = []
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            funcao(escala)
+            tempos.append(time.perf_counter() - inicio)
+        tracemalloc.start()
+        try:
+            funcao(escala)
+            _, pico = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return {
+        'mediana_s': round(statistics.median(tempos), 5),
+        'minimo_s': round(min(tempos), 5),
+        'pico_mb': round(pico / 2**20, 2),
+    }
+
+
+def executar(escalas=ESCALAS, filtro=None, repeticoes=3, escala_maxima_graficos=ESCALA_MAXIMA_GRAFICOS):
+    """
+    Mede todos os casos (que contenham 'filtro' no nome) em todas as escalas.
+
+    Returns:
+        dict: {'<caso>[<escala>x]': {'caso', 'escala', 'mediana_s', 'minimo_s', 'pico_mb'}}.
+    """
+    resultados = {}
+    for escala in escalas:
+        for nome, funcao in CASOS.items():
+            if filtro and filtro not in nome:
+                continue
+            if nome.startswith('grafico.') and escala > escala_maxima_graficos:
+                continue
+            medicao = medir(funcao, escala, repeticoes)
+            resultados[f'{nome}[{escala}x]'] = {'caso': nome, 'escala': escala, **medicao}
+            print(f"{nome:<46}{escala:>6}x{medicao['mediana_s']:>12.4f} s{medicao['pico_mb']:>12.1f} MB",
+                  flush=True)
+    return resultados
+
+
+def comparar(resultados, base, tolerancia):
+    """
+    Compara a mediana de cada caso com a da base.
+
+    Returns:
+        list: Casos mais lentos que base * (1 + tolerancia), com as duas medianas e a razão.
+    """
+    lentos = []
+    for chave, atual in resultados.items():
+        anterior = base.get(chave)
+        if anterior is None or anterior['mediana_s'] <= 0:
+            continue
+        razao = atual['mediana_s'] / anterior['mediana_s']
+        if razao > 1 + tolerancia:
+            lentos.append({'caso': chave, 'base_s': anterior['mediana_s'], 'atual_s': atual['mediana_s'],
+                           'razao': round(razao, 2)})
+    return lentos
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--escalas', type=int, nargs='+', default=list(ESCALAS))
+    parser.add_argument('--filtro', help='Mede apenas os casos que contenham este texto no nome.')
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--escala-maxima-graficos', type=int, default=ESCALA_MAXIMA_GRAFICOS,
+                        help=f'Maior escala usada nos gráficos (padrão: {ESCALA_MAXIMA_GRAFICOS}).')
+    parser.add_argument('--saida', help='Arquivo JSON para gravar o resultado.')
+    parser.add_argument('--comparar', help='JSON de uma execução anterior (gerado com --saida).')
+    parser.add_argument('--tolerancia', type=float, default=0.25,
+                        help='Aumento relativo aceito na mediana antes de acusar regressão (padrão: 0.25).')
+    args = parser.parse_args(argv)
+
+    print(f"{'caso':<46}{'escala':>7}{'mediana':>14}{'pico':>15}")
+    resultados = executar(args.escalas, args.filtro, args.repeticoes, args.escala_maxima_graficos)
+
+    if args.saida:
+        saida = {
+            'metadados': {
+                'data': datetime.datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'pandas': pd.__version__,
+                'numpy': np.__version__,
+                'plataforma': platform.platform(),
+                'repeticoes': args.repeticoes,
+            },
+            'resultados': resultados,
+        }
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(saida, arquivo, indent=2, ensure_ascii=False)
+
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as arquivo:
+            base = json.load(arquivo)['resultados']
+        lentos = comparar(resultados, base, args.tolerancia)
+        for caso in lentos:
+            print(f"REGRESSÃO {caso['caso']}: {caso['base_s']:.4f} s -> {caso['atual_s']:.4f} s ({caso['razao']}x)")
+        if lentos:
+            return 1
+        print(f"Sem regressões acima de {args.tolerancia:.0%} em relação a {args.comparar}.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
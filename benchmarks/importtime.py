@@ -0,0 +1,113 @@
+"""
+Benchmark de tempo de importação (no estilo de `python -X importtime`).
+
+Executa cada importação em um processo novo (partida a frio), soma o tempo cumulativo
+informado pelo -X importtime e verifica se módulos pesados de gráfico foram carregados
+por pacotes que não deveriam carregá-los.
+
+Uso:
+    python benchmarks/importtime.py
+    python benchmarks/importtime.py --repeticoes 5 --saida importtime.json
+    python benchmarks/importtime.py --limites benchmarks/limites_importtime.json
+
+Sai com código 1 se algum limite for ultrapassado ou se um módulo proibido for carregado.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Importação -> módulos que ela NÃO pode carregar
+CENARIOS = {
+    'tratamento': ('matplotlib', 'seaborn'),
+    'graficos': ('matplotlib', 'seaborn'),
+    'graficos.plotagem': (),
+}
+
+
+def medir(importacao):
+    """
+    Importa o módulo em um processo novo com -X importtime.
+
+    Args:
+        importacao (str): Nome do módulo (ex.: 'tratamento').
+
+    Returns:
+        dict: total_ms (tempo cumulativo do módulo importado) e modulos (conjunto de módulos carregados).
+    """
+    resultado = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {importacao}'],
+        cwd=RAIZ,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modulos = set()
+    total_us = 0
+    for linha in resultado.stderr.splitlines():
+        # Formato: "import time: self [us] | cumulative | imported package"
+        if not linha.startswith('import time:') or 'cumulative' in linha:
+            continue
+        _, cumulativo, nome = linha[len('import time:'):].split('|')
+        nome_limpo = nome.strip()
+        modulos.add(nome_limpo)
+        if nome_limpo == importacao:
+            total_us = int(cumulativo)
+    return {'total_ms': total_us / 1000, 'modulos': modulos}
+
+
+def executar(repeticoes=3):
+    """
+    Mede todos os cenários e retorna o resumo (mediana do tempo e módulos proibidos carregados).
+    """
+    resumo = {}
+    for importacao, proibidos in CENARIOS.items():
+        medicoes = [medir(importacao) for _ in range(repeticoes)]
+        carregados = medicoes[0]['modulos']
+        resumo[importacao] = {
+            'mediana_ms': round(statistics.median(m['total_ms'] for m in medicoes), 2),
+            'minimo_ms': round(min(m['total_ms'] for m in medicoes), 2),
+            'proibidos_carregados': sorted(p for p in proibidos if p in carregados),
+        }
+    return resumo
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--saida', help='Arquivo JSON para gravar o resultado.')
+    parser.add_argument('--limites', help='JSON {importacao: limite_ms} para acusar regressões.')
+    args = parser.parse_args(argv)
+
+    resumo = executar(args.repeticoes)
+    limites = {}
+    if args.limites:
+        with open(args.limites, encoding='utf-8') as arquivo:
+            limites = json.load(arquivo)
+
+    falhou = False
+    print(f"{'importação':<22}{'mediana (ms)':>14}{'limite (ms)':>14}  situação")
+    for importacao, dados in resumo.items():
+        limite = limites.get(importacao)
+        problemas = []
+        if dados['proibidos_carregados']:
+            problemas.append(f"carregou {', '.join(dados['proibidos_carregados'])}")
+        if limite is not None and dados['mediana_ms'] > limite:
+            problemas.append('acima do limite')
+        falhou = falhou or bool(problemas)
+        situacao = '; '.join(problemas) or 'ok'
+        print(f"{importacao:<22}{dados['mediana_ms']:>14.1f}{limite if limite is not None else '-':>14}  {situacao}")
+
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(resumo, arquivo, indent=2, ensure_ascii=False)
+    return 1 if falhou else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,44 @@
+"""
+Gráficos do projeto.
+
+As funções de gráfico ficam em graficos.plotagem, que só é carregado (junto com matplotlib e
+seaborn) no primeiro acesso a uma delas. CuboAgregado, o renderizador em lote e as funções de
+redução (graficos.reducao) não dependem do matplotlib para serem importados.
+"""
+
+from .cubo import CuboAgregado
+from .lote import gerar_tarefas, renderizar_lote
+from .reducao import agregar_media_desvio, lttb, reduzir_series, ticks_anos
+
+# Funções definidas em graficos.plotagem, carregadas sob demanda
+_FUNCOES_GRAFICOS = (
+    'graficos_linhas_continente',
+    'graficos_linhas_pais',
+    'comparando_cont',
+    'distribuicao_por_continente',
+    'plotar_comparacao_dois_continentes',
+    'graficos_mundos',
+    'plotar_comparacao_multiplos_paises',
+    'plotar_pais_vs_media_continente',
+    'graficos_facetas',
+    'plotar_dispersao_ajuste',
+)
+
+__all__ = [
+    'CuboAgregado', 'gerar_tarefas', 'renderizar_lote',
+    'agregar_media_desvio', 'lttb', 'reduzir_series', 'ticks_anos',
+    *_FUNCOES_GRAFICOS,
+]
+
+
+def __getattr__(nome):
+    if nome in _FUNCOES_GRAFICOS:
+        from . import plotagem
+        funcao = getattr(plotagem, nome)
+        globals()[nome] = funcao  # os próximos acessos não passam mais por aqui
+        return funcao
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_FUNCOES_GRAFICOS))
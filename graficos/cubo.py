@@ -0,0 +1,179 @@
+"""Cubo de agregados por (continente, ano) compartilhado pelos gráficos."""
+
+import numpy as np
+import pandas as pd
+
+from tratamento.instrumentacao import instrumentar
+
+
+class CuboAgregado:
+    """
+    Cubo de agregados por (continente, ano), calculado uma vez e compartilhado pelos gráficos.
+
+    Guarda contagem, soma, soma dos quadrados, mínimo e máximo de cada variável numérica, de modo
+    que média e desvio padrão (amostral, como o errorbar='sd' do seaborn) saem do cubo sem
+    reagrupar o DataFrame. O total mundial é derivado dos continentes e novas linhas podem ser
+    incorporadas com adicionar().
+
+    Args:
+        df (pd.DataFrame): O DataFrame original.
+        coluna_continente (str): Nome da coluna do continente. Padrão é 'continent'.
+        coluna_ano (str): Nome da coluna do tempo. Padrão é 'year'.
+        colunas (list): Variáveis agregadas. Padrão: todas as numéricas (exceto o ano).
+    """
+
+    MUNDO = 'Mundo'
+
+    @instrumentar(nome='graficos.CuboAgregado')
+    def __init__(self, df, coluna_continente: str = 'continent', coluna_ano: str = 'year', colunas: list = None):
+        self.coluna_continente = coluna_continente
+        self.coluna_ano = coluna_ano
+        if colunas is None:
+            colunas = [c for c in df.select_dtypes('number').columns if c != coluna_ano]
+        self.colunas = list(colunas)
+        self.tabela = self._agregar(df)
+
+    def _agregar(self, df):
+        # Um único agrupamento: as colunas ao quadrado entram no mesmo groupby das originais
+        chaves = [self.coluna_continente, self.coluna_ano]
+        valores = df[self.colunas].astype('float64')
+        quadrados = (valores ** 2).add_suffix('__quad')
+        base = pd.concat([df[chaves], valores, quadrados], axis=1)
+        grupos = base.groupby(chaves, observed=True, sort=True)
+        quad = [f'{c}__quad' for c in self.colunas]
+        somas = grupos.sum(min_count=1)
+        tabela = pd.concat({
+            'n': grupos[self.colunas].count(),
+            'soma': somas[self.colunas],
+            'soma_quad': somas[quad].set_axis(self.colunas, axis=1),
+            'minimo': grupos[self.colunas].min(),
+            'maximo': grupos[self.colunas].max(),
+        }, axis=1)
+        return tabela
+
+    @instrumentar
+    def adicionar(self, df_novo):
+        """
+        Incorpora novas linhas ao cubo sem recalcular as já agregadas.
+
+        Args:
+            df_novo (pd.DataFrame): Linhas novas, com as mesmas colunas do DataFrame original.
+        """
+        novo = self._agregar(df_novo)
+        indice = self.tabela.index.union(novo.index)
+        atual = self.tabela.reindex(indice)
+        novo = novo.reindex(indice)
+        partes = {}
+        for estatistica in ('n', 'soma', 'soma_quad'):
+            partes[estatistica] = atual[estatistica].add(novo[estatistica], fill_value=0)
+        partes['minimo'] = np.fmin(atual['minimo'], novo['minimo'])
+        partes['maximo'] = np.fmax(atual['maximo'], novo['maximo'])
+        self.tabela = pd.concat(partes, axis=1)
+
+    @instrumentar
+    def atualizar(self, antigas, novas, painel):
+        """
+        Substitui linhas já agregadas (antigas) pelas suas versões novas, e incorpora linhas
+        inéditas (presentes só em novas), sem reagrupar o DataFrame inteiro.
+
+        Contagem, soma e soma dos quadrados são atualizadas por diferença. Mínimo e máximo só
+        podem ser atualizados assim quando o valor substituído não era o extremo do grupo; os
+        grupos (continente, ano) em que era são recalculados a partir de 'painel'. Compatível com
+        PainelIncremental.inscrever(cubo.atualizar).
+
+        Args:
+            antigas (pd.DataFrame): Linhas como estavam quando foram agregadas.
+            novas (pd.DataFrame): Linhas atualizadas e linhas novas.
+            painel (pd.DataFrame): Dados atuais completos (obrigatório), usados apenas para recalcular
+                extremos; sem ele, o mínimo e o máximo dos grupos alterados ficariam desatualizados.
+        """
+        novo = self._agregar(novas)
+        antigo = self._agregar(antigas)
+        indice = self.tabela.index.union(novo.index)
+        atual = self.tabela.reindex(indice)
+        novo = novo.reindex(indice)
+        antigo = antigo.reindex(indice)
+        partes = {}
+        for estatistica in ('n', 'soma', 'soma_quad'):
+            partes[estatistica] = (
+                atual[estatistica].add(novo[estatistica], fill_value=0).sub(antigo[estatistica], fill_value=0)
+            )
+        partes['minimo'] = np.fmin(atual['minimo'], novo['minimo'])
+        partes['maximo'] = np.fmax(atual['maximo'], novo['maximo'])
+
+        # Grupos em que um extremo foi substituído: o novo extremo só sai das linhas atuais
+        extremo_removido = (antigo['minimo'] <= atual['minimo']) | (antigo['maximo'] >= atual['maximo'])
+        grupos = extremo_removido.any(axis=1)
+        if grupos.any():
+            alvo = indice[grupos.to_numpy()]
+            # O ano pode estar no índice (painel de montar_painel) ou nas colunas
+            if self.coluna_ano in painel.columns:
+                anos = painel[self.coluna_ano].to_numpy()
+            else:
+                anos = painel.index.get_level_values(self.coluna_ano).to_numpy()
+            mascara = (painel[self.coluna_continente].isin(alvo.get_level_values(0).unique()).to_numpy()
+                       & np.isin(anos, alvo.get_level_values(1).unique()))
+            linhas = painel.loc[mascara, self.colunas]
+            chaves = [painel[self.coluna_continente].to_numpy()[mascara], anos[mascara]]
+            extremos = linhas.groupby(chaves, observed=True)
+            for estatistica, calculado in (('minimo', extremos.min()), ('maximo', extremos.max())):
+                partes[estatistica].loc[grupos] = calculado.reindex(alvo.to_flat_index()).to_numpy()
+        self.tabela = pd.concat(partes, axis=1)
+
+    def _mundo(self):
+        # Total mundial por ano, a partir dos agregados dos continentes
+        tabela = self.tabela
+        ano = tabela.index.get_level_values(self.coluna_ano)
+        tabela = pd.concat({
+            'n': tabela['n'].groupby(ano).sum(),
+            'soma': tabela['soma'].groupby(ano).sum(min_count=1),
+            'soma_quad': tabela['soma_quad'].groupby(ano).sum(min_count=1),
+            'minimo': tabela['minimo'].groupby(ano).min(),
+            'maximo': tabela['maximo'].groupby(ano).max(),
+        }, axis=1)
+        tabela.index = pd.MultiIndex.from_product([[self.MUNDO], tabela.index], names=self.tabela.index.names)
+        return tabela
+
+    @instrumentar
+    def estatisticas(self, variavel: str, continentes: list = None):
+        """
+        Média, desvio padrão, contagem, mínimo e máximo de uma variável por continente e ano.
+
+        Args:
+            variavel (str): Nome da coluna agregada.
+            continentes (list): Continentes desejados (use CuboAgregado.MUNDO para o total mundial).
+                Padrão: todos os continentes.
+
+        Returns:
+            pd.DataFrame: Colunas (continente, ano, media, desvio, n, minimo, maximo).
+        """
+        tabela = self.tabela
+        if continentes is not None:
+            continentes = list(continentes)
+            if self.MUNDO in continentes:
+                tabela = pd.concat([tabela, self._mundo()])
+            tabela = tabela[tabela.index.get_level_values(0).isin(continentes)]
+        tabela = tabela.xs(variavel, axis=1, level=1)
+        n = tabela['n']
+        media = tabela['soma'] / n
+        with np.errstate(invalid='ignore', divide='ignore'):
+            variancia = (tabela['soma_quad'] - tabela['soma'] * media) / (n - 1)
+        desvio = np.sqrt(variancia.clip(lower=0)).where(n > 1)
+        resultado = pd.DataFrame({
+            'media': media,
+            'desvio': desvio,
+            'n': n,
+            'minimo': tabela['minimo'],
+            'maximo': tabela['maximo'],
+        })
+        return resultado.reset_index()
+
+    def media(self, variavel: str, continente: str):
+        # Série (indexada pelo ano) da média da variável no continente
+        est = self.estatisticas(variavel, [continente])
+        return est.set_index(self.coluna_ano)['media']
+
+    def desvio(self, variavel: str, continente: str):
+        # Série (indexada pelo ano) do desvio padrão da variável no continente
+        est = self.estatisticas(variavel, [continente])
+        return est.set_index(self.coluna_ano)['desvio']
@@ -0,0 +1,150 @@
+"""Renderização de gráficos em lote, sem interface gráfica e em paralelo."""
+
+import inspect
+import itertools
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from tratamento.instrumentacao import instrumentar
+
+from .cubo import CuboAgregado
+
+
+# --- Renderização em lote (sem interface gráfica, em paralelo) ---
+# Dados compartilhados com os processos de renderização (definidos uma vez por processo)
+_dados_lote = {}
+
+
+def gerar_tarefas(grafico: str, **parametros):
+    """
+    Monta a lista de tarefas de renderizar_lote a partir do produto cartesiano dos parâmetros.
+
+    Args:
+        grafico (str): Nome da função de gráfico do pacote (ex.: 'graficos_linhas_pais').
+        **parametros: Argumentos da função; listas são expandidas (ex.: pais=[...], observado=[...]).
+
+    Returns:
+        list: Lista de dicionários {'grafico': ..., 'parametros': {...}}.
+    """
+    nomes = list(parametros)
+    valores = [v if isinstance(v, (list, tuple)) and nome not in ('continentes', 'paises') else [v]
+               for nome, v in parametros.items()]
+    return [{'grafico': grafico, 'parametros': dict(zip(nomes, combinacao))}
+            for combinacao in itertools.product(*valores)]
+
+
+def _nome_arquivo(tarefa, formato):
+    # Nome do arquivo a partir da função e dos parâmetros (ex.: graficos_linhas_pais_Brazil_lifeExp.png)
+    partes = [tarefa['grafico']]
+    for valor in tarefa['parametros'].values():
+        valor = '-'.join(map(str, valor)) if isinstance(valor, (list, tuple)) else str(valor)
+        partes.append(re.sub(r'[^0-9A-Za-z.-]+', '-', valor).strip('-'))
+    return '_'.join(partes) + f'.{formato}'
+
+
+def _iniciar_trabalhador(df, cubo):
+    # Executado uma vez em cada processo: backend não interativo e dados compartilhados.
+    # O backend é escolhido antes de carregar o pyplot (no processo atual, se já carregado, é trocado).
+    import matplotlib
+    matplotlib.use('Agg')
+    if isinstance(df, str):
+        # Pasta de um armazém: cada processo mapeia os mesmos arquivos (uma única cópia física)
+        from tratamento import abrir_painel
+        df = abrir_painel(df)
+    _dados_lote['df'] = df
+    _dados_lote['cubo'] = cubo
+
+
+def _consulta_lote():
+    # Índices por país/continente/ano, construídos na primeira tarefa do processo que os usa
+    if 'consulta' not in _dados_lote:
+        from tratamento import ConsultaPainel
+        df = _dados_lote['df']
+        padrao = {'country', 'year'}.issubset(df.columns)
+        _dados_lote['consulta'] = ConsultaPainel(df) if padrao else None
+    return _dados_lote['consulta']
+
+
+def _renderizar_tarefa(tarefa):
+    # Renderiza uma tarefa e devolve o resumo (arquivo, sucesso, tempo, erro)
+    from . import plotagem
+    inicio = time.perf_counter()
+    funcao = getattr(plotagem, tarefa['grafico'])
+    parametros = dict(tarefa['parametros'])
+    aceitos = inspect.signature(funcao).parameters
+    cubo = _dados_lote.get('cubo')
+    if cubo is not None and 'cubo' in aceitos:
+        parametros.setdefault('cubo', cubo)
+    # Os índices usam as colunas padrão; tarefas com outros nomes de coluna filtram o DataFrame
+    if 'consulta' in aceitos and not any(p == 'consulta' or p.startswith('coluna_') for p in parametros):
+        parametros['consulta'] = _consulta_lote()
+    plotagem._arquivo_saida = tarefa['arquivo']
+    erro = None
+    try:
+        funcao(_dados_lote['df'], **parametros)
+    except Exception as e:
+        erro = f'{type(e).__name__}: {e}'
+    finally:
+        plotagem._arquivo_saida = None
+        plotagem.plt.close('all')  # figuras não salvas (ex.: sem dados) também são liberadas
+    return {
+        'grafico': tarefa['grafico'],
+        'arquivo': tarefa['arquivo'],
+        'sucesso': erro is None and os.path.exists(tarefa['arquivo']),
+        'segundos': round(time.perf_counter() - inicio, 3),
+        'erro': erro,
+    }
+
+
+@instrumentar
+def renderizar_lote(df, tarefas: list, pasta: str = 'graficos_gerados', formato: str = 'png', processos: int = None,
+                    cubo: CuboAgregado = None):
+    """
+    Renderiza vários gráficos sem interface gráfica, salvando cada um em arquivo, em paralelo.
+
+    Cada processo usa o backend 'Agg', recebe o DataFrame uma única vez e fecha cada figura
+    depois de salvá-la, então a memória não cresce com o número de gráficos.
+
+    Args:
+        df (pd.DataFrame ou str): O DataFrame original, ou a pasta de um painel gravado com
+            tratamento.gravar_painel: nesse caso cada processo abre o painel por memory map, em vez
+            de receber uma cópia serializada, e todos compartilham a mesma memória física.
+        tarefas (list): Tarefas de gerar_tarefas (um 'arquivo' próprio é opcional em cada tarefa).
+        pasta (str): Pasta de saída. Padrão é 'graficos_gerados' (fora do pacote graficos).
+        formato (str): 'png' ou 'svg'. Padrão é 'png'.
+        processos (int): Número de processos. Padrão: número de núcleos. Use 1 para rodar no processo atual.
+        cubo (CuboAgregado): Repassado às funções que aceitam o parâmetro 'cubo'.
+
+    Returns:
+        pd.DataFrame: Uma linha por tarefa com grafico, arquivo, sucesso, segundos e erro.
+    """
+    if formato not in ('png', 'svg'):
+        print("Formato inválido. Use 'png' ou 'svg'.")
+        return
+    os.makedirs(pasta, exist_ok=True)
+    tarefas = [dict(t, arquivo=t.get('arquivo') or os.path.join(pasta, _nome_arquivo(t, formato)))
+               for t in tarefas]
+    processos = processos or os.cpu_count() or 1
+
+    if processos == 1:
+        import matplotlib
+        backend = matplotlib.get_backend()
+        _iniciar_trabalhador(df, cubo)
+        try:
+            resultados = [_renderizar_tarefa(t) for t in tarefas]
+        finally:
+            _dados_lote.clear()
+            matplotlib.use(backend)
+    else:
+        lote = max(1, len(tarefas) // (processos * 4))
+        with ProcessPoolExecutor(max_workers=processos, initializer=_iniciar_trabalhador,
+                                 initargs=(df, cubo)) as executor:
+            resultados = list(executor.map(_renderizar_tarefa, tarefas, chunksize=lote))
+
+    relatorio = pd.DataFrame(resultados, columns=['grafico', 'arquivo', 'sucesso', 'segundos', 'erro'])
+    print(f"{int(relatorio['sucesso'].sum())} de {len(relatorio)} gráficos gerados em '{pasta}'.")
+    return relatorio
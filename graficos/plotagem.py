@@ -0,0 +1,757 @@
+"""Funções de gráfico (matplotlib/seaborn). Carregado apenas no primeiro uso de um gráfico."""
+
+import math
+
+import matplotlib.pyplot as plt
+import numpy as np
+import seaborn as sns
+from matplotlib.ticker import MaxNLocator
+
+from tratamento.instrumentacao import instrumentar
+
+from .cubo import CuboAgregado
+from .reducao import agregar_media_desvio, reduzir_series, ticks_anos
+
+
+# Caminho do arquivo de saída quando o gráfico é gerado em modo lote (None = exibir na tela)
+_arquivo_saida = None
+
+
+def _mostrar():
+    # Exibe a figura atual ou, em modo lote, salva no arquivo de saída e fecha a figura
+    if _arquivo_saida is None:
+        plt.show()
+        return
+    figura = plt.gcf()
+    figura.savefig(_arquivo_saida)
+    plt.close(figura)
+
+
+def _linha_media_desvio(est, coluna_ano, cor, rotulo=None, marker=None, linewidth=2):
+    # Desenha a média (linha) e a faixa de ± 1 desvio padrão (sombra), como o errorbar='sd' do seaborn
+    linha, = plt.plot(est[coluna_ano], est['media'], marker=marker, linewidth=linewidth, color=cor, label=rotulo)
+    plt.fill_between(
+        est[coluna_ano],
+        est['media'] - est['desvio'],
+        est['media'] + est['desvio'],
+        color=linha.get_color(),
+        alpha=0.2,
+        linewidth=0,
+    )
+
+@instrumentar
+def graficos_linhas_continente(df, continent: str, observado: str, coluna_ano: str = 'year',
+                               cubo: CuboAgregado = None, consulta=None):
+    """"
+    Args:
+        df (pd.DataFrame): O DataFrame original (não é usado quando o cubo é informado).
+        continent (str): O nome do continente a ser selecionado.
+        observado (str): O nome da coluna que será agregada (eixo Y).
+        coluna_ano (str): O nome da coluna de tempo (eixo X). Padrão é 'ano'.
+        cubo (CuboAgregado): Agregados pré-calculados; evita reagrupar o DataFrame a cada chamada.
+        consulta (tratamento.ConsultaPainel): Índices do painel; o continente é obtido sem varrer o DataFrame.
+    """
+    if cubo is not None:
+        est = cubo.estatisticas(observado, [continent])
+        if est.empty:
+            print(f"Não foram encontrados dados para o continente: {continent}")
+            return
+        anos = est[coluna_ano].unique()
+        plt.figure(figsize=(12, 8))
+        _linha_media_desvio(est, coluna_ano, 'darkorange', marker='o', linewidth=2)
+    else:
+        if consulta is not None:
+            df_filtrado = consulta.continente(continent)
+        else:
+            df_filtrado = df[df['continent'] == continent].copy()
+        if df_filtrado.empty:
+            print(f"Não foram encontrados dados para o continente: {continent}")
+            return
+        anos = df_filtrado[coluna_ano].unique()
+        plt.figure(figsize=(12, 8))
+        # x=coluna_ano (Eixo X)
+        # y=observado (Eixo Y - será a média dos valores para cada ano)
+        sns.lineplot(
+            x=coluna_ano,
+            y=observado,
+            data=df_filtrado,
+            marker='o',          # Adiciona marcadores para os pontos
+            errorbar='sd',       # Linha sólida = Média. Sombra = Desvio Padrão ('sd').
+                                 # Use 'ci' para Intervalo de Confiança (padrão)
+            linewidth=2,
+            color='darkorange'
+        )
+    title_text = f'Evolução da Média de {observado.replace("_", " ").title()} em {continent}'
+    title_text += f'\n(Sombra = Desvio Padrão)'
+    plt.title(title_text, fontsize=16, fontweight='bold')
+    # Rótulos
+    plt.xlabel(coluna_ano.capitalize(), fontsize=14)
+    plt.ylabel(f'Média de {observado.replace("_", " ").title()}', fontsize=14)
+    # Configuração dos Ticks (para garantir que apenas os anos existentes apareçam)
+    plt.xticks(ticks_anos(anos), rotation=45)
+    plt.grid(True, linestyle='--', alpha=0.7)
+    plt.tight_layout()
+    _mostrar()
+
+
+@instrumentar
+def graficos_linhas_pais(df, pais: str, observado: str, coluna_ano: str = 'year', consulta=None,
+                         max_pontos: int = None):
+    """
+    Função para plotar um gráfico de linha da evolução de uma variável ao longo do tempo
+    para um país específico usando sns.lineplot.
+    
+    Args:
+        df (pd.DataFrame): O DataFrame original.
+        pais (str): O nome do país a ser selecionado (assume coluna 'country' no df).
+        observado (str): O nome da coluna que será plotada (eixo Y).
+        coluna_ano (str): O nome da coluna de tempo (eixo X). Padrão é 'year'.
+        consulta (tratamento.ConsultaPainel): Índices do painel; evita varrer o DataFrame inteiro.
+        max_pontos (int): Se informado, séries mais longas são reduzidas por LTTB a esse número de pontos.
+    """
+    # 1. Filtragem (Assume que a coluna de país é 'country')
+    if consulta is not None:
+        df_filtrado = consulta.pais(pais)
+    else:
+        df_filtrado = df[df['country'] == pais].copy()   
+    if df_filtrado.empty:
+        print(f"Não foram encontrados dados para o país: {pais}")
+        return  
+    # Garantir que os dados estejam ordenados por ano
+    df_filtrado = df_filtrado.sort_values(by=coluna_ano)
+    if max_pontos:
+        df_filtrado = reduzir_series(df_filtrado, coluna_ano, observado, max_pontos=max_pontos)
+    # 2. Plotagem com Seaborn
+    plt.figure(figsize=(12, 8))
+    sns.lineplot(
+        x=coluna_ano,
+        y=observado,
+        data=df_filtrado,
+        marker='o',
+        linewidth=2,
+        color='darkgreen'
+    )
+
+    # 3. Configurações do Gráfico
+    title_text = f'Evolução de {observado.replace("_", " ").title()} no(a) {pais}'
+    plt.title(title_text, fontsize=16, fontweight='bold')  
+    # Rótulos
+    plt.xlabel(coluna_ano.capitalize(), fontsize=14)
+    plt.ylabel(observado.replace("_", " ").title(), fontsize=14) 
+    # Configuração dos Ticks
+    plt.xticks(ticks_anos(df_filtrado[coluna_ano]), rotation=45)  
+    plt.grid(True, linestyle='--', alpha=0.7)
+    plt.tight_layout()
+    _mostrar()
+
+@instrumentar
+def comparando_cont(df, variavel_observada: str, coluna_ano: str = 'year', titulo_extra: str = "",
+                    cubo: CuboAgregado = None, reduzido: bool = False):
+    """
+    Plota a evolução da média de uma variável ao longo do tempo para todos os continentes.
+
+    Args:
+        df (pd.DataFrame): O DataFrame original (não é usado quando o cubo é informado).
+        variavel_observada (str): Nome da coluna para o eixo Y (ex: 'lifeExp', 'gdpPercap').
+        coluna_ano (str): Nome da coluna do tempo (eixo X). Padrão é 'year'.
+        titulo_extra (str): Texto opcional para adicionar ao título.
+        cubo (CuboAgregado): Agregados pré-calculados; evita reagrupar o DataFrame a cada chamada.
+        reduzido (bool): Se True (e sem cubo), agrega média ± desvio por continente e ano antes de
+            desenhar, passando ao matplotlib só esses pontos. Indicado para painéis grandes (OWID).
+    """
+    plt.figure(figsize=(14, 8))
+
+    if cubo is not None or reduzido:
+        if cubo is not None:
+            est, coluna_continente = cubo.estatisticas(variavel_observada), cubo.coluna_continente
+        else:
+            est, coluna_continente = agregar_media_desvio(df, coluna_ano, variavel_observada, 'continent'), 'continent'
+        anos = est[coluna_ano].unique()
+        cores = sns.color_palette(n_colors=est[coluna_continente].nunique())
+        for cor, (continente, est_cont) in zip(cores, est.groupby(coluna_continente, observed=True)):
+            _linha_media_desvio(est_cont, coluna_ano, cor, rotulo=continente, linewidth=3)
+    else:
+        anos = df[coluna_ano].unique()
+        # sns.lineplot agrega automaticamente a média para cada ano por continente
+        sns.lineplot(
+            x=coluna_ano,
+            y=variavel_observada,
+            hue='continent',
+            data=df,
+            errorbar='sd',  # Linha é a Média, Sombra é o Desvio Padrão
+            linewidth=3
+        )
+    
+    # Formatação do Título e Rótulos
+    var_title = variavel_observada.replace("Percap", " Per Capita").title()
+    plt.title(f'Evolução da Média de {var_title} por Continente {titulo_extra}', fontsize=18, fontweight='bold')
+    plt.xlabel(coluna_ano.capitalize(), fontsize=14)
+    plt.ylabel(f'Média de {var_title}', fontsize=14)
+    
+    # Ajustar o eixo X para mostrar apenas os anos presentes (ticks)
+    plt.xticks(ticks_anos(anos), rotation=45, ha='right')
+    plt.grid(True, linestyle='--', alpha=0.6)
+    plt.legend(title='Continente', title_fontsize='12', loc='best')
+    plt.tight_layout()
+    _mostrar()
+
+
+@instrumentar
+def distribuicao_por_continente(df, ano: int, variavel_observada: str, tipo_grafico: str = 'box', consulta=None):
+    """
+    Plota a distribuição de uma variável entre os continentes para um ano específico.
+
+    Args:
+        df (pd.DataFrame): O DataFrame original.
+        ano (int): O ano que será filtrado.
+        variavel_observada (str): Nome da coluna a ser analisada (ex: 'lifeExp', 'gdpPercap').
+        tipo_grafico (str): 'box' para Box Plot ou 'violin' para Violin Plot.
+        consulta (tratamento.ConsultaPainel): Índices do painel; evita varrer o DataFrame inteiro.
+    """
+    
+    # 1. Filtrar o DataFrame pelo ano
+    if consulta is not None:
+        df_filtrado = consulta.ano(ano)
+    else:
+        df_filtrado = df[df['year'] == ano].copy()
+    
+    if df_filtrado.empty:
+        print(f"Não foram encontrados dados para o ano: {ano}")
+        return
+
+    plt.figure(figsize=(12, 7))
+
+    # 2. Selecionar o tipo de gráfico
+    if tipo_grafico == 'box':
+        sns.boxplot(
+            x='continent',
+            y=variavel_observada,
+            data=df_filtrado,
+            palette='Set2'
+        )
+    elif tipo_grafico == 'violin':
+        sns.violinplot(
+            x='continent',
+            y=variavel_observada,
+            data=df_filtrado,
+            palette='Set2',
+            inner='quartile' # Mostra os quartis dentro do violin plot
+        )
+    else:
+        print("Tipo de gráfico inválido. Use 'box' ou 'violin'.")
+        return
+    
+    # 3. Formatação
+    var_title = variavel_observada.replace("Percap", " Per Capita").title()
+    plt.title(f'Distribuição de {var_title} por Continente em {ano} ({tipo_grafico.title()} Plot)', fontsize=18, fontweight='bold')
+    plt.xlabel('Continente', fontsize=14)
+    plt.ylabel(var_title, fontsize=14)
+    plt.grid(axis='y', linestyle='--', alpha=0.6)
+    plt.tight_layout()
+    _mostrar()
+
+@instrumentar
+def plotar_comparacao_dois_continentes(
+    df,
+    continentes: list,
+    variavel_observada: str,
+    coluna_continente: str = 'continent',
+    coluna_ano: str = 'year',
+    cubo: CuboAgregado = None
+):
+    """
+    Plota a evolução da média de uma variável ao longo do tempo, comparando dois continentes.
+
+    Args:
+        df (pd.DataFrame): O DataFrame original (não é usado quando o cubo é informado).
+        continentes (list): Uma lista contendo os nomes dos dois continentes a serem comparados.
+        variavel_observada (str): Nome da coluna para o eixo Y (ex: 'lifeExp', 'gdpPercap').
+        coluna_continente (str): Nome da coluna do continente. Padrão é 'continent'.
+        coluna_ano (str): Nome da coluna do tempo (eixo X). Padrão é 'year'.
+        cubo (CuboAgregado): Agregados pré-calculados; evita reagrupar o DataFrame a cada chamada.
+    """
+    
+    if len(continentes) != 2:
+        print("Erro: A lista 'continentes' deve conter exatamente dois nomes.")
+        return
+
+    if cubo is not None:
+        est = cubo.estatisticas(variavel_observada, continentes)
+        if est.empty:
+            print(f"Não foram encontrados dados para os continentes: {', '.join(continentes)}")
+            return
+        anos = cubo.tabela.index.get_level_values(coluna_ano).unique()
+        plt.figure(figsize=(14, 8))
+        for cor, continente in zip(sns.color_palette(n_colors=2), continentes):
+            est_cont = est[est[coluna_continente] == continente]
+            _linha_media_desvio(est_cont, coluna_ano, cor, rotulo=continente, marker='o', linewidth=3)
+    else:
+        # 1. Filtrar o DataFrame para incluir apenas os dois continentes
+        df_filtrado = df[df[coluna_continente].isin(continentes)].copy()
+
+        if df_filtrado.empty:
+            print(f"Não foram encontrados dados para os continentes: {', '.join(continentes)}")
+            return
+        anos = df[coluna_ano].unique()
+
+        # 2. Plotagem com Seaborn
+        plt.figure(figsize=(14, 8))
+
+        # sns.lineplot agrega automaticamente a média para cada ano por continente
+        sns.lineplot(
+            x=coluna_ano,
+            y=variavel_observada,
+            hue=coluna_continente, # Cor por continente
+            data=df_filtrado,
+            errorbar='sd',         # Linha é a Média, Sombra é o Desvio Padrão
+            marker='o',            # Adiciona marcadores nos pontos de dados
+            linewidth=3
+        )
+    
+    # 3. Formatação do Gráfico
+    
+    # Ajustar nome da variável para o título
+    var_title = variavel_observada.replace("Percap", " Per Capita").title()
+    
+    title_continents = f'{continentes[0]} vs. {continentes[1]}'
+    plt.title(f'Comparação da Média de {var_title} ao Longo do Tempo\n({title_continents})', 
+              fontsize=18, fontweight='bold')
+    
+    plt.xlabel(coluna_ano.capitalize(), fontsize=14)
+    plt.ylabel(f'Média de {var_title}', fontsize=14)
+    
+    # Ajustar o eixo X para mostrar apenas os anos presentes (ticks)
+    plt.xticks(ticks_anos(anos), rotation=45, ha='right')
+    plt.grid(True, linestyle='--', alpha=0.6)
+    plt.legend(title='Continente', title_fontsize='12', loc='best')
+    plt.tight_layout()
+    _mostrar()
+
+@instrumentar
+def graficos_mundos (df, X, Y, reduzido: bool = False, max_pontos: int = 500):
+    """
+    Plota um gráfico de linha da evolução de uma variável (Y) ao longo do tempo (X).
+    Adiciona uma linha horizontal para representar a média de Y ao longo do tempo.
+    
+    Args:
+        df (pd.DataFrame): DataFrame que contém a série temporal (preferencialmente já agregada).
+        X (str): Coluna do eixo horizontal (tempo).
+        Y (str): Coluna do eixo vertical (valor).
+        reduzido (bool): Se True, agrega a média por X (faixa de 95% pela aproximação normal, em vez
+            do bootstrap do seaborn) e reduz por LTTB a max_pontos pontos antes de desenhar.
+        max_pontos (int): Máximo de pontos desenhados no modo reduzido. Padrão é 500.
+    """
+    
+    # 1. Calcular a média da coluna Y
+    media_y = df[Y].mean()
+    
+    plt.figure(figsize=(12,8)) 
+    
+    # Plot da evolução da série temporal
+    if reduzido:
+        est = agregar_media_desvio(df, X, Y)
+        est['desvio'] = 1.96 * est['desvio'] / est['n'] ** 0.5
+        est = reduzir_series(est, X, 'media', max_pontos=max_pontos)
+        _linha_media_desvio(est, X, 'darkgreen', rotulo=Y.replace('_', ' ').title(), marker='o', linewidth=2)
+    else:
+        sns.lineplot(
+            data=df, 
+            x=X, 
+            y=Y, 
+            marker='o', 
+            linewidth=2, 
+            color='darkgreen', 
+            label=Y.replace('_', ' ').title()
+        ) 
+    
+    # 2. Adicionar a linha horizontal da média
+    plt.axhline(
+        y=media_y, 
+        color='red', 
+        linestyle='--', 
+        linewidth=2,
+        label=f'Média Geral ({Y.replace("_", " ").title()}): {media_y:.2f}' 
+    )
+
+    # Configurações do gráfico
+    plt.xlabel(X.capitalize(), fontsize=14)
+    plt.ylabel(Y.replace("_", " ").title(), fontsize=14)
+    plt.xticks(ticks_anos(df[X]), rotation=45)  
+    plt.title(f"Evolução Global de {Y.replace('_', ' ').title()} com Média Horizontal", fontsize=16)
+    plt.grid(True, linestyle='--', alpha=0.7)
+    plt.legend(loc='best')
+    plt.tight_layout()
+    _mostrar()
+
+@instrumentar
+def plotar_comparacao_multiplos_paises(
+    df,
+    paises: list,
+    variavel_observada: str,
+    coluna_pais: str = 'country',
+    coluna_ano: str = 'year',
+    consulta=None,
+    max_pontos: int = None
+):
+    """
+    Plota a evolução de uma variável ao longo do tempo, comparando múltiplos países.
+
+    Args:
+        df (pd.DataFrame): O DataFrame original.
+        paises (list): Uma lista contendo os nomes dos países a serem comparados.
+        variavel_observada (str): Nome da coluna para o eixo Y (ex: 'lifeExp', 'gdpPercap').
+        coluna_pais (str): Nome da coluna do país. Padrão é 'country'.
+        coluna_ano (str): Nome da coluna do tempo (eixo X). Padrão é 'year'.
+        consulta (tratamento.ConsultaPainel): Índices do painel; evita varrer o DataFrame inteiro.
+        max_pontos (int): Se informado, a série de cada país é reduzida por LTTB a esse número de pontos.
+    """
+    
+    if len(paises) < 2:
+        print("Erro: A lista 'paises' deve conter no mínimo dois nomes para comparação.")
+        return
+
+    # 1. Filtrar o DataFrame para incluir apenas os países selecionados
+    if consulta is not None:
+        df_filtrado = consulta.fatia(paises=paises)
+    else:
+        df_filtrado = df[df[coluna_pais].isin(paises)].copy()
+    
+    if df_filtrado.empty:
+        print(f"Não foram encontrados dados para os países: {', '.join(paises)}")
+        
+        # Dica útil: verificar se o nome dos países está correto (case-sensitive)
+        paises_nao_encontrados = [p for p in paises if p not in df[coluna_pais].unique()]
+        if paises_nao_encontrados:
+             print(f"Verifique se o nome dos seguintes países está correto (case-sensitive): {', '.join(paises_nao_encontrados)}")
+        return
+    if max_pontos:
+        df_filtrado = reduzir_series(df_filtrado, coluna_ano, variavel_observada, coluna_pais, max_pontos)
+
+    # 2. Plotagem com Seaborn
+    plt.figure(figsize=(14, 8))
+    
+    # sns.lineplot plota cada país individualmente
+    sns.lineplot(
+        x=coluna_ano,
+        y=variavel_observada,
+        hue=coluna_pais,         # Cor diferente para cada país
+        data=df_filtrado,
+        # Como estamos plotando dados de países individuais, não precisamos de errorbar/agregação
+        errorbar=None, 
+        marker='o',              # Adiciona marcadores nos pontos de dados
+        linewidth=3
+    )
+    
+    # 3. Formatação do Gráfico
+    
+    # Ajustar nome da variável para o título
+    var_title = variavel_observada.replace("Percap", " Per Capita").title()
+    
+    plt.title(f'Comparação da Evolução de {var_title} ao Longo do Tempo', 
+              fontsize=18, fontweight='bold')
+    
+    plt.xlabel(coluna_ano.capitalize(), fontsize=14)
+    plt.ylabel(var_title, fontsize=14)
+    
+    # Ajustar o eixo X para mostrar apenas os anos presentes (ticks)
+    plt.xticks(ticks_anos(df[coluna_ano]), rotation=45, ha='right')
+    plt.grid(True, linestyle='--', alpha=0.6)
+    plt.legend(title='País', title_fontsize='12', loc='best')
+    plt.tight_layout()
+    _mostrar()
+
+@instrumentar
+def plotar_pais_vs_media_continente(
+    df,
+    pais: str,
+    observado: str,
+    coluna_pais: str = 'country',
+    coluna_continente: str = 'continent',
+    coluna_ano: str = 'year',
+    cubo: CuboAgregado = None,
+    consulta=None
+):
+    """
+    Cria um gráfico de linhas comparando a evolução de uma variável para um país
+    com a média de seu continente ao longo do tempo.
+
+    Args:
+        df (pd.DataFrame): O DataFrame original.
+        pais (str): O nome do país a ser analisado.
+        observado (str): O nome da coluna para o eixo Y (ex: 'lifeExp', 'gdpPercap').
+        coluna_pais (str): Nome da coluna do país. Padrão é 'country'.
+        coluna_continente (str): Nome da coluna do continente. Padrão é 'continent'.
+        coluna_ano (str): Nome da coluna do tempo (eixo X). Padrão é 'year'.
+        cubo (CuboAgregado): Agregados pré-calculados; a média do continente sai do cubo
+            em vez de um groupby sobre o DataFrame inteiro.
+        consulta (tratamento.ConsultaPainel): Índices do painel; o país e seu continente são
+            obtidos sem varrer o DataFrame.
+    """
+
+    # --- 1. Obter o nome do Continente e fazer verificações ---
+    if consulta is not None:
+        df_pais = consulta.pais(pais)
+    else:
+        df_pais = df[df[coluna_pais] == pais].copy()
+    if df_pais.empty:
+        print(f"Erro: País '{pais}' não encontrado no DataFrame.")
+        return
+
+    # Obter o continente do país na primeira ocorrência
+    continente = df_pais[coluna_continente].iloc[0]
+    
+    # --- 2. Preparar os Dados para o Continente (Média) ---
+    nome_coluna_media = f'media_{observado}'
+    
+    if cubo is not None:
+        df_continente = cubo.estatisticas(observado, [continente]).rename(columns={'media': nome_coluna_media})
+    else:
+        # Calcular a média por continente e ano
+        df_agregado = df.groupby([coluna_continente, coluna_ano], observed=True)[observado].mean().reset_index(name=nome_coluna_media)
+
+        # Filtrar apenas o continente do país
+        df_continente = df_agregado[df_agregado[coluna_continente] == continente].copy()
+    
+    # --- 4. Plotagem com Matplotlib e Seaborn ---
+    plt.figure(figsize=(14, 8))
+    
+    # Plotar a linha do País (Valor real)
+    sns.lineplot(
+        x=coluna_ano,
+        y=observado,
+        data=df_pais,
+        label=f'País: {pais}',
+        marker='o',
+        linewidth=3,
+        color='blue',
+        errorbar=None 
+    )
+    
+    # Plotar a linha da Média do Continente
+    sns.lineplot(
+        x=coluna_ano,
+        y=nome_coluna_media,
+        data=df_continente,
+        label=f'Média do Continente: {continente}',
+        linestyle='--', # Linha tracejada para diferenciar
+        linewidth=3,
+        color='red',
+        errorbar=None
+    )
+    
+    # --- 5. Formatação do Gráfico ---
+    var_title = observado.replace("Percap", " Per Capita").title()
+    
+    plt.title(f'Evolução de {var_title}: {pais} vs. Média da {continente}', 
+              fontsize=18, fontweight='bold')
+    
+    plt.xlabel(coluna_ano.capitalize(), fontsize=14)
+    plt.ylabel(var_title, fontsize=14)
+    
+    # Ajustar o eixo X para mostrar apenas os anos presentes (ticks)
+    plt.xticks(ticks_anos(df[coluna_ano]), rotation=45, ha='right')
+    plt.grid(True, linestyle='--', alpha=0.6)
+    plt.legend(title='Legenda', title_fontsize='12', loc='best')
+    plt.tight_layout()
+    _mostrar()
+
+
+@instrumentar
+def graficos_facetas(
+    df,
+    variavel: str,
+    grupos: list,
+    coluna_grupo: str = 'country',
+    coluna_ano: str = 'year',
+    colunas: int = None,
+    cubo: CuboAgregado = None,
+    consulta=None,
+    max_pontos: int = None,
+    tamanho_painel: tuple = (2.4, 1.8)
+):
+    """
+    Pequenos múltiplos: um painel por país (ou continente) em uma única figura, com eixos X e Y
+    compartilhados, para comparar muitos grupos sem sobrepor dezenas de cores.
+
+    Os dados de todos os painéis são filtrados e agregados de uma vez (média e desvio por grupo e
+    ano); cada painel desenha só a sua fatia com matplotlib e o layout é calculado uma única vez.
+    Com grupos de várias linhas por ano (ex.: continentes), a linha é a média e a sombra o desvio padrão.
+
+    Args:
+        df (pd.DataFrame): O DataFrame original.
+        variavel (str): Nome da coluna para o eixo Y.
+        grupos (list): Países ou continentes, um painel para cada (na ordem da lista).
+        coluna_grupo (str): Coluna dos grupos. Padrão é 'country' (use 'continent' para continentes).
+        coluna_ano (str): Nome da coluna do tempo (eixo X). Padrão é 'year'.
+        colunas (int): Painéis por linha da grade. Padrão: aproximadamente a raiz quadrada do nº de grupos.
+        cubo (CuboAgregado): Agregados pré-calculados; usados quando os grupos são continentes.
+        consulta (tratamento.ConsultaPainel): Índices do painel; os grupos são obtidos sem varrer o DataFrame.
+        max_pontos (int): Se informado, a série de cada painel é reduzida por LTTB a esse número de pontos.
+        tamanho_painel (tuple): Largura e altura de cada painel, em polegadas. Padrão é (2.4, 1.8).
+    """
+    grupos = list(dict.fromkeys(grupos))
+    if not grupos:
+        print("Erro: A lista 'grupos' deve conter ao menos um país ou continente.")
+        return
+
+    # 1. Agregação de todos os painéis em uma única passada
+    if cubo is not None and coluna_grupo == cubo.coluna_continente and coluna_ano == cubo.coluna_ano:
+        est = cubo.estatisticas(variavel, grupos)
+    else:
+        if consulta is not None and coluna_grupo == consulta.coluna_pais:
+            df_filtrado = consulta.fatia(paises=grupos, colunas=[variavel])
+        elif consulta is not None and coluna_grupo == consulta.coluna_continente:
+            df_filtrado = consulta.fatia(continentes=grupos, colunas=[variavel])
+        else:
+            df_filtrado = df.loc[df[coluna_grupo].isin(grupos), [coluna_grupo, coluna_ano, variavel]]
+        est = agregar_media_desvio(df_filtrado, coluna_ano, variavel, coluna_grupo)
+    if est.empty:
+        print(f"Não foram encontrados dados de {variavel} para: {', '.join(map(str, grupos))}")
+        return
+    if max_pontos:
+        est = reduzir_series(est, coluna_ano, 'media', coluna_grupo, max_pontos)
+    posicoes = est.groupby(coluna_grupo, observed=True, sort=False).indices
+    ausentes = [g for g in grupos if g not in posicoes]
+    if ausentes:
+        print(f"Sem dados para: {', '.join(map(str, ausentes))}")
+    anos = est[coluna_ano].to_numpy()
+    medias = est['media'].to_numpy(dtype='float64')
+    desvios = est['desvio'].to_numpy(dtype='float64')
+    agregado = bool(est['n'].median() > 1)  # grupos com várias linhas por ano (ex.: continentes)
+
+    # 2. Uma figura com a grade inteira e eixos compartilhados
+    n_colunas = colunas or math.ceil(math.sqrt(len(grupos)))
+    n_linhas = math.ceil(len(grupos) / n_colunas)
+    # Estilo dos painéis definido na criação dos eixos, sem reconfigurar os ticks painel a painel
+    estilo = {'axes.grid': True, 'grid.linestyle': '--', 'grid.alpha': 0.5, 'axes.titlesize': 10,
+              'xtick.labelsize': 8, 'ytick.labelsize': 8}
+    with plt.rc_context(estilo):
+        figura, eixos = plt.subplots(
+            n_linhas, n_colunas, sharex=True, sharey=True, squeeze=False,
+            figsize=(tamanho_painel[0] * n_colunas, tamanho_painel[1] * n_linhas),
+        )
+    eixos = eixos.ravel()
+    # Com eixos compartilhados, o autoscale de cada desenho percorre todos os painéis irmãos;
+    # os limites são calculados uma vez a partir dos dados agregados
+    inferior, superior = medias - np.nan_to_num(desvios), medias + np.nan_to_num(desvios)
+    margem_y = 0.05 * (np.nanmax(superior) - np.nanmin(inferior) or 1)
+    margem_x = 0.02 * (anos.max() - anos.min() or 1)
+    eixos[0].set_autoscale_on(False)
+    eixos[0].set_xlim(anos.min() - margem_x, anos.max() + margem_x)
+    eixos[0].set_ylim(np.nanmin(inferior) - margem_y, np.nanmax(superior) + margem_y)
+    for eixo, grupo in zip(eixos, grupos):
+        eixo.set_autoscale_on(False)
+        eixo.set_title(str(grupo))
+        if grupo not in posicoes:
+            continue
+        pos = posicoes[grupo]
+        eixo.plot(anos[pos], medias[pos], color='darkgreen', linewidth=1.5)
+        if np.isfinite(desvios[pos]).any():
+            eixo.fill_between(anos[pos], inferior[pos], superior[pos], color='darkgreen', alpha=0.2, linewidth=0)
+    # Painéis que sobram na última linha: escondidos, e o painel de cima passa a mostrar os anos
+    for posicao in range(len(grupos), len(eixos)):
+        eixos[posicao].set_visible(False)
+        eixos[posicao - n_colunas].xaxis.set_tick_params(labelbottom=True)
+
+    # 3. Formatação comum (os eixos são compartilhados, então basta configurar um)
+    eixos[0].set_xticks(ticks_anos(anos, max_ticks=5))
+    eixos[0].yaxis.set_major_locator(MaxNLocator(4))
+    var_title = variavel.replace("Percap", " Per Capita").replace("_", " ").title()
+    titulo = f'Evolução de {var_title} por {"Continente" if coluna_grupo == "continent" else "País"}'
+    if agregado:
+        titulo += '\n(Linha = Média, Sombra = Desvio Padrão)'
+    figura.suptitle(titulo, fontsize=16, fontweight='bold')
+    figura.supxlabel(coluna_ano.capitalize(), fontsize=12)
+    figura.supylabel(f'Média de {var_title}' if agregado else var_title, fontsize=12)
+    figura.tight_layout()
+    _mostrar()
+
+
+@instrumentar
+def plotar_dispersao_ajuste(
+    df,
+    x: str,
+    y: str,
+    ano: int = None,
+    log_x: bool = False,
+    log_y: bool = False,
+    por_continente: bool = True,
+    coluna_continente: str = 'continent',
+    coluna_ano: str = 'year',
+    analise=None
+):
+    """
+    Dispersão de y contra x (um ponto por país) com a reta ajustada de cada continente
+    (ou uma única reta, com por_continente=False), ex.: IDH ~ log10 do PIB per capita.
+
+    Args:
+        df (pd.DataFrame): O painel (com colunas de ano e continente, ou indexado por (country, year)).
+        x (str): Variável do eixo X.
+        y (str): Variável do eixo Y.
+        ano (int): Ano a mostrar. Padrão: todos os anos juntos.
+        log_x, log_y (bool): Ajuste em log10 da variável (o eixo correspondente fica em escala log).
+        por_continente (bool): Uma reta por continente (True) ou uma reta para todos (False).
+        coluna_continente (str): Nome da coluna do continente. Padrão é 'continent'.
+        coluna_ano (str): Nome da coluna do tempo. Padrão é 'year'.
+        analise (tratamento.AnaliseRelacoes): Motor de ajustes já criado; reaproveita os ajustes
+            memorizados (padrão: criado a partir de df).
+    """
+    from tratamento.correlacao import AnaliseRelacoes
+
+    if analise is None:
+        analise = AnaliseRelacoes(df, coluna_ano=coluna_ano, coluna_continente=coluna_continente)
+    dados = analise.dados
+    por = ((coluna_ano,) if ano is not None else ()) + ((coluna_continente,) if por_continente else ())
+    ajustes = analise.ajuste(x, y, log_x=log_x, log_y=log_y, por=por)
+
+    # 1. Pontos (só as linhas do ano, com x e y válidos para o ajuste)
+    mascara = dados[x].notna() & dados[y].notna()
+    if log_x:
+        mascara &= dados[x] > 0
+    if log_y:
+        mascara &= dados[y] > 0
+    if ano is not None:
+        mascara &= dados[coluna_ano] == ano
+        ajustes = ajustes[ajustes[coluna_ano] == ano]
+    pontos = dados.loc[mascara, [x, y, coluna_continente]]
+    if pontos.empty:
+        print(f"Não foram encontrados dados de {x} e {y}" + (f" em {ano}." if ano is not None else "."))
+        return
+
+    # 2. Plotagem: pontos por continente e a reta de cada ajuste
+    plt.figure(figsize=(12, 8))
+    if por_continente:
+        continentes = sorted(pontos[coluna_continente].dropna().unique())
+        cores = dict(zip(continentes, sns.color_palette(n_colors=len(continentes))))
+        sns.scatterplot(x=x, y=y, hue=coluna_continente, hue_order=continentes, palette=cores,
+                        data=pontos, alpha=0.6, legend=False)
+    else:
+        cores = {}
+        sns.scatterplot(x=x, y=y, data=pontos, alpha=0.6, color='steelblue')
+
+    for ajuste in ajustes.itertuples(index=False):
+        grupo = getattr(ajuste, coluna_continente) if por_continente else None
+        selecao = pontos if grupo is None else pontos[pontos[coluna_continente] == grupo]
+        if ajuste.n < 3 or np.isnan(ajuste.inclinacao) or selecao.empty:
+            continue
+        limites = selecao[x].agg(['min', 'max']).to_numpy(dtype='float64')
+        grade = np.geomspace(*limites, 50) if log_x else np.linspace(*limites, 50)
+        previsto = ajuste.intercepto + ajuste.inclinacao * (np.log10(grade) if log_x else grade)
+        rotulo = f'{grupo or "Todos"}: r = {ajuste.correlacao:.2f}, n = {ajuste.n}'
+        plt.plot(grade, 10 ** previsto if log_y else previsto, color=cores.get(grupo, 'darkred'),
+                 linewidth=2.5, label=rotulo)
+
+    # 3. Formatação
+    if log_x:
+        plt.xscale('log')
+    if log_y:
+        plt.yscale('log')
+    forma = f'{"log " if log_y else ""}{y} ~ {"log " if log_x else ""}{x}'
+    plt.title(f'{y} vs. {x}' + (f' em {ano}' if ano is not None else '') + f'\n(Ajuste: {forma})',
+              fontsize=16, fontweight='bold')
+    plt.xlabel(x + (' (escala log)' if log_x else ''), fontsize=14)
+    plt.ylabel(y + (' (escala log)' if log_y else ''), fontsize=14)
+    plt.grid(True, linestyle='--', alpha=0.6)
+    plt.legend(title='Ajuste', title_fontsize='12', loc='best')
+    plt.tight_layout()
+    _mostrar()
@@ -0,0 +1,102 @@
+"""Redução dos dados antes do desenho: agregação por grupo/ano, LTTB e ticks espaçados."""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+
+# Passos "redondos" para os ticks do eixo de anos
+_PASSOS_TICKS = (1, 2, 5, 10, 20, 25, 50, 100, 200, 250, 500, 1000)
+
+
+def agregar_media_desvio(df, coluna_x: str, coluna_y: str, coluna_grupo: str = None):
+    """
+    Agrega para exatamente os pontos que serão desenhados: média, desvio padrão e contagem
+    de coluna_y por (grupo, x), com um único groupby vetorizado.
+
+    Returns:
+        pd.DataFrame: Colunas [coluna_grupo], coluna_x, media, desvio (ddof=1) e n, ordenado.
+    """
+    chaves = [coluna_grupo, coluna_x] if coluna_grupo else [coluna_x]
+    agregado = df.groupby(chaves, observed=True, sort=True)[coluna_y].agg(['mean', 'std', 'count'])
+    agregado.columns = ['media', 'desvio', 'n']
+    return agregado[agregado['n'] > 0].reset_index()
+
+
+def lttb(x, y, n_pontos: int):
+    """
+    Largest-Triangle-Three-Buckets: escolhe n_pontos de uma série preservando sua forma visual
+    (picos e vales), em vez de amostrar a cada k pontos.
+
+    Args:
+        x, y: Série ordenada por x e sem valores nulos.
+        n_pontos (int): Quantidade de pontos a manter (>= 3).
+
+    Returns:
+        np.ndarray: Posições dos pontos escolhidos, em ordem crescente (sempre inclui o primeiro e o último).
+    """
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+    n = len(x)
+    if n_pontos >= n or n_pontos < 3:
+        return np.arange(n)
+
+    # n_pontos - 2 baldes entre o primeiro e o último ponto
+    limites = np.floor(np.linspace(1, n - 1, n_pontos - 1)).astype(np.intp)
+    escolhidos = np.empty(n_pontos, dtype=np.intp)
+    escolhidos[0], escolhidos[-1] = 0, n - 1
+    anterior = 0
+    for i in range(n_pontos - 2):
+        inicio, fim = limites[i], limites[i + 1]
+        # Vértice fixo do próximo balde: a média dele (ou o último ponto, no último balde)
+        if i + 2 < len(limites):
+            x_prox = x[fim:limites[i + 2]].mean()
+            y_prox = y[fim:limites[i + 2]].mean()
+        else:
+            x_prox, y_prox = x[-1], y[-1]
+        area = np.abs(
+            (x[anterior] - x_prox) * (y[inicio:fim] - y[anterior])
+            - (x[anterior] - x[inicio:fim]) * (y_prox - y[anterior])
+        )
+        anterior = inicio + int(np.argmax(area))
+        escolhidos[i + 1] = anterior
+    return escolhidos
+
+
+def reduzir_series(df, coluna_x: str, coluna_y: str, coluna_grupo: str = None, max_pontos: int = 500):
+    """
+    Ordena por (grupo, x), remove nulos de coluna_y e aplica LTTB em cada série com mais
+    de max_pontos pontos.
+
+    Returns:
+        pd.DataFrame: As linhas escolhidas de df.
+    """
+    chaves = [coluna_grupo, coluna_x] if coluna_grupo else [coluna_x]
+    dados = df.dropna(subset=[coluna_y]).sort_values(chaves, kind='stable')
+    if coluna_grupo is None:
+        grupos = [np.arange(len(dados))]
+    else:
+        grupos = dados.groupby(coluna_grupo, observed=True, sort=False).indices.values()
+    x = dados[coluna_x].to_numpy(dtype='float64')
+    y = dados[coluna_y].to_numpy(dtype='float64')
+    posicoes = [p[lttb(x[p], y[p], max_pontos)] if len(p) > max_pontos else p for p in grupos]
+    if not posicoes:
+        return dados
+    return dados.iloc[np.sort(np.concatenate(posicoes))]
+
+
+def ticks_anos(valores, max_ticks: int = 20):
+    """
+    Ticks do eixo de anos: todos os anos presentes quando cabem em max_ticks; senão,
+    anos redondos com um passo de 1, 2, 5, 10, 20, 25, 50... anos.
+    """
+    valores = pd.Series(np.asarray(valores)).dropna().drop_duplicates().sort_values().to_numpy()
+    if len(valores) <= max_ticks:
+        return valores
+    if not np.issubdtype(valores.dtype, np.number):
+        return valores[::math.ceil(len(valores) / max_ticks)]
+    amplitude = valores[-1] - valores[0]
+    passo = next((p for p in _PASSOS_TICKS if amplitude / p <= max_ticks - 1), _PASSOS_TICKS[-1])
+    inicio = math.ceil(valores[0] / passo) * passo
+    return np.arange(inicio, valores[-1] + 1, passo)
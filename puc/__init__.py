@@ -0,0 +1,10 @@
+"""
+Pipeline do projeto (importação -> harmonização -> painel -> classificação -> gráficos).
+
+Uso pela linha de comando:
+    python -m puc build
+    python -m puc status
+    python -m puc servir --porta 8050
+"""
+
+from .pipeline import Etapa, Pipeline, pipeline_projeto
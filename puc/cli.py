@@ -0,0 +1,145 @@
+"""Linha de comando do pipeline: python -m puc {build,status,limpar,servir,paises}."""
+
+import argparse
+import os
+import shutil
+import time
+
+import tratamento
+from tratamento import instrumentacao
+
+from .pipeline import pipeline_projeto
+
+
+def _criar_parser():
+    parser = argparse.ArgumentParser(prog='python -m puc', description='Pipeline do projeto PUC.')
+    parser.add_argument('--dados', default='.', help="Pasta dos CSVs (padrão: '.').")
+    parser.add_argument('--cache', default=os.path.join('.cache', 'pipeline'),
+                        help="Pasta do cache das etapas (padrão: '.cache/pipeline').")
+    parser.add_argument('--instrumentar', metavar='ARQUIVO.jsonl',
+                        help='Grava um registro por chamada (tempo, linhas, cache) e mostra o resumo por função.')
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    build = sub.add_parser('build', help='Executa as etapas desatualizadas.')
+    build.add_argument('etapas', nargs='*', help='Etapas alvo (padrão: todas).')
+    build.add_argument('--graficos', default='graficos_gerados', help="Pasta dos gráficos (padrão: 'graficos_gerados').")
+    build.add_argument('--formato', choices=('png', 'svg'), default='png')
+    build.add_argument('--processos', type=int, default=None, help='Processos na renderização (padrão: núcleos).')
+    build.add_argument('--forcar', nargs='*', default=(), help='Etapas a refazer mesmo com cache válido.')
+    build.add_argument('--sem-graficos', action='store_true', help='Não executa a etapa de gráficos.')
+    build.add_argument('--exportar', help='Grava o painel classificado em .csv ou .parquet.')
+
+    sub.add_parser('status', help='Mostra quais etapas estão em cache e quais seriam refeitas.')
+    sub.add_parser('limpar', help='Apaga o cache das etapas.')
+
+    servir = sub.add_parser('servir', help='Serve o painel classificado por HTTP/JSON (para o dashboard).')
+    servir.add_argument('--host', default='127.0.0.1', help="Endereço de escuta (padrão: '127.0.0.1').")
+    servir.add_argument('--porta', type=int, default=8050, help='Porta TCP (padrão: 8050).')
+
+    paises = sub.add_parser('paises', help='Sugere correspondências para os países sem par no gapminder.')
+    paises.add_argument('fontes', nargs='*', default=['idh', 'escolaridade_esperada'],
+                        help="Fontes de tratamento.FONTES_PROJETO (padrão: 'idh' e 'escolaridade_esperada').")
+    paises.add_argument('--aprovar', type=float, metavar='MINIMO',
+                        help='Grava na tabela de apelidos as sugestões com pontuação >= MINIMO e os agregados.')
+    return parser
+
+
+def main(argv=None):
+    args = _criar_parser().parse_args(argv)
+    if not args.instrumentar:
+        return _executar(args)
+    memoria = instrumentacao.DestinoMemoria()
+    instrumentacao.ativar(memoria, instrumentacao.DestinoJSONL(args.instrumentar))
+    try:
+        return _executar(args)
+    finally:
+        instrumentacao.desativar()
+        resumo = memoria.resumo()
+        if not resumo.empty:
+            print(resumo.to_string(index=False, float_format=lambda x: f'{x:.4f}'))
+        print(f"Registros gravados em {args.instrumentar}")
+
+
+def _executar(args):
+
+    if args.comando == 'limpar':
+        shutil.rmtree(args.cache, ignore_errors=True)
+        print(f"Cache removido: {args.cache}")
+        return 0
+
+    if args.comando == 'status':
+        pipeline = pipeline_projeto(pasta_dados=args.dados, dir_cache=args.cache)
+        print(pipeline.situacao().to_string(index=False))
+        return 0
+
+    if args.comando == 'servir':
+        from .servidor import criar_servidor
+        pipeline = pipeline_projeto(pasta_dados=args.dados, dir_cache=args.cache)
+        painel = pipeline.executar(['classificacao'])[0]['classificacao']
+        servidor = criar_servidor(painel, host=args.host, porta=args.porta)
+        print(f"Servindo {len(painel)} linhas em http://{args.host}:{args.porta} (Ctrl+C para encerrar)")
+        try:
+            servidor.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            servidor.server_close()
+        return 0
+
+    if args.comando == 'paises':
+        return _paises(args)
+
+    pipeline = pipeline_projeto(
+        pasta_dados=args.dados,
+        pasta_graficos=args.graficos,
+        dir_cache=args.cache,
+        formato=args.formato,
+        processos=args.processos,
+    )
+    alvos = args.etapas or [nome for nome in pipeline.etapas if not (args.sem_graficos and nome == 'graficos')]
+    inicio = time.perf_counter()
+    saidas, relatorio = pipeline.executar(alvos, forcar=set(args.forcar))
+    print(relatorio.to_string(index=False))
+    print(f"Concluído em {time.perf_counter() - inicio:.2f} s "
+          f"({int((relatorio['situacao'] == 'executada').sum())} etapa(s) executada(s)).")
+
+    if args.exportar:
+        painel = saidas.get('classificacao')
+        if painel is None:
+            painel = pipeline.executar(['classificacao'])[0]['classificacao']
+        if args.exportar.endswith('.parquet'):
+            painel.to_parquet(args.exportar, index=False)
+        else:
+            painel.to_csv(args.exportar, index=False)
+        print(f"Painel exportado para {args.exportar}")
+    return 0
+
+
+def _paises(args):
+    # Compara os nomes de cada fonte com os do gapminder (referência do painel)
+    tabela = tratamento.TabelaApelidos(os.path.join(args.dados, tratamento.ARQUIVO_APELIDOS))
+    resolvedor = tratamento.ResolvedorPaises(tabela.como_mapa())
+    referencia = tratamento.FONTES_PROJETO['gapminder']
+    gapminder = tratamento.import_data_otimizado(os.path.join(args.dados, referencia['arquivo']))
+    aprovadas = 0
+    for nome in args.fontes:
+        fonte = tratamento.FONTES_PROJETO[nome]
+        df = tabela.descartar(tratamento.import_data_otimizado(os.path.join(args.dados, fonte['arquivo'])),
+                              fonte['pais'])
+        sugestoes = tratamento.sugerir_correspondencias(
+            df[fonte['pais']], gapminder[referencia['pais']], resolvedor=resolvedor,
+            codigos_origem=df[fonte['codigo']] if 'codigo' in fonte else None,
+        )
+        sem_candidato = sugestoes[(sugestoes['posicao'] == 0) & ~sugestoes['agregado']]
+        exibir = sugestoes.drop(sem_candidato.index)
+        print(f"\n{nome}: {sugestoes['nome'].nunique()} nome(s) sem par no gapminder")
+        if not exibir.empty:
+            print(exibir.to_string(index=False))
+        if not sem_candidato.empty:
+            print(f"Sem candidato ({len(sem_candidato)}): {', '.join(sem_candidato['nome'].astype(str))}")
+        if args.aprovar is not None:
+            aprovadas += tabela.aprovar_sugestoes(sugestoes, minimo=args.aprovar)
+    if args.aprovar is not None:
+        tabela.salvar()
+        print(f"\n{aprovadas} entrada(s) aprovada(s) em {tabela.caminho}")
+    return 0
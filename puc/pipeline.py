@@ -0,0 +1,381 @@
+"""
+Execução incremental das etapas do projeto, com cache por hash do conteúdo.
+
+Cada etapa tem uma chave calculada a partir do código da função, do código-fonte do módulo dela
+e dos pacotes que ela usa (tratamento e graficos), dos parâmetros, do conteúdo dos arquivos de
+entrada e do hash da saída das etapas de que depende. Se a chave já está no
+manifesto, a saída é reaproveitada do cache (e só é lida do disco se alguma etapa seguinte
+precisar ser executada). Como a chave usa o hash da *saída* das dependências, uma etapa que
+é refeita mas produz o mesmo resultado não força a reexecução das seguintes.
+"""
+
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import pickle
+import tempfile
+import time
+
+import pandas as pd
+
+import tratamento
+
+# Valores do notebook para a classificação por nível de renda e de escolaridade
+# Colunas de faixas criadas na classificação: coluna nova -> (variável, tabela de tratamento.TABELAS_FAIXAS)
+FAIXAS_PROJETO = {
+    'Nivel de renda': ('gdpPercap', 'renda_projeto'),
+    'nivel_escolaridade': ('Anos estudo', 'escolaridade_projeto'),
+}
+
+
+def _hash_texto(*partes):
+    return hashlib.sha256('\x1f'.join(partes).encode('utf-8')).hexdigest()
+
+
+def _arquivos_fonte(modulo):
+    # Arquivos .py de um módulo (nome ou objeto); para um pacote, todos os .py da pasta
+    if isinstance(modulo, str):
+        especificacao = importlib.util.find_spec(modulo)
+        arquivo = especificacao.origin if especificacao else None
+    else:
+        arquivo = getattr(modulo, '__file__', None)
+    if not arquivo or not arquivo.endswith('.py'):
+        return []
+    if os.path.basename(arquivo) != '__init__.py':
+        return [arquivo]
+    pasta = os.path.dirname(arquivo)
+    return [
+        os.path.join(raiz, nome)
+        for raiz, _, nomes in os.walk(pasta)
+        for nome in nomes if nome.endswith('.py')
+    ]
+
+
+def hash_fonte(modulos):
+    """
+    Hash do código-fonte dos módulos/pacotes (nomes ou objetos), em ordem de caminho.
+    """
+    h = hashlib.sha256()
+    for caminho in sorted({os.path.abspath(c) for m in modulos for c in _arquivos_fonte(m)}):
+        h.update(os.path.basename(caminho).encode('utf-8'))
+        with open(caminho, 'rb') as arquivo:
+            h.update(arquivo.read())
+    return h.hexdigest()
+
+
+def hash_objeto(objeto):
+    """
+    Hash do conteúdo de uma saída de etapa (DataFrame, Série ou objeto serializável).
+    """
+    if isinstance(objeto, (pd.DataFrame, pd.Series)):
+        h = hashlib.sha256()
+        h.update(pd.util.hash_pandas_object(objeto, index=True).to_numpy().tobytes())
+        colunas = objeto.columns if isinstance(objeto, pd.DataFrame) else [objeto.name]
+        tipos = objeto.dtypes if isinstance(objeto, pd.DataFrame) else [objeto.dtype]
+        h.update(repr((list(map(str, colunas)), list(map(str, tipos)))).encode('utf-8'))
+        return h.hexdigest()
+    return hashlib.sha256(pickle.dumps(objeto, protocol=pickle.HIGHEST_PROTOCOL)).hexdigest()
+
+
+class Etapa:
+    """
+    Uma etapa do pipeline.
+
+    Args:
+        nome (str): Nome único da etapa.
+        funcao (callable): Recebe as saídas das dependências (na ordem declarada) seguidas dos
+            parâmetros nomeados, e retorna a saída da etapa.
+        dependencias (tuple): Nomes das etapas de entrada.
+        parametros (dict): Parâmetros nomeados (entram na chave de cache; devem ser serializáveis).
+        arquivos (tuple): Arquivos lidos pela etapa (o conteúdo entra na chave de cache).
+        opcoes (dict): Parâmetros nomeados que não alteram o resultado (ex.: número de processos);
+            são repassados à função, mas não entram na chave de cache.
+    """
+
+    def __init__(self, nome, funcao, dependencias=(), parametros=None, arquivos=(), opcoes=None):
+        self.nome = nome
+        self.funcao = funcao
+        self.dependencias = tuple(dependencias)
+        self.parametros = dict(parametros or {})
+        self.arquivos = tuple(arquivos)
+        self.opcoes = dict(opcoes or {})
+
+
+class Pipeline:
+    """
+    DAG de etapas com cache incremental em disco.
+
+    Args:
+        dir_cache (str): Pasta do cache (manifesto + saídas das etapas). Padrão é '.cache/pipeline'.
+        pacotes (tuple): Pacotes cujo código-fonte entra na chave de todas as etapas (as funções
+            auxiliares chamadas pelas etapas estão neles). Padrão é ('tratamento', 'graficos').
+    """
+
+    def __init__(self, dir_cache=os.path.join('.cache', 'pipeline'), pacotes=('tratamento', 'graficos')):
+        self.dir_cache = dir_cache
+        self.pacotes = tuple(pacotes)
+        self._hashes_fonte = {}
+        self.etapas = {}
+        self._manifesto_arquivo = os.path.join(dir_cache, 'manifesto.json')
+        self.manifesto = {'etapas': {}, 'arquivos': {}}
+        if os.path.exists(self._manifesto_arquivo):
+            with open(self._manifesto_arquivo, encoding='utf-8') as arquivo:
+                self.manifesto = json.load(arquivo)
+
+    def adicionar(self, etapa: Etapa):
+        # Registra a etapa; as dependências precisam ter sido registradas antes (ordem topológica)
+        faltando = [d for d in etapa.dependencias if d not in self.etapas]
+        if faltando:
+            raise ValueError(f"Etapa '{etapa.nome}' depende de etapas não registradas: {faltando}")
+        self.etapas[etapa.nome] = etapa
+        return etapa
+
+    def _hash_arquivo(self, caminho):
+        # Hash do conteúdo, recalculado apenas se tamanho ou mtime mudarem
+        caminho = os.path.abspath(caminho)
+        info = os.stat(caminho)
+        memo = self.manifesto['arquivos'].get(caminho)
+        if memo and memo[0] == info.st_size and memo[1] == info.st_mtime_ns:
+            return memo[2]
+        h = hashlib.sha256()
+        with open(caminho, 'rb') as arquivo:
+            for bloco in iter(lambda: arquivo.read(1 << 20), b''):
+                h.update(bloco)
+        self.manifesto['arquivos'][caminho] = [info.st_size, info.st_mtime_ns, h.hexdigest()]
+        return h.hexdigest()
+
+    def _hash_fonte(self, funcao):
+        # Código do módulo da função + pacotes do projeto (calculado uma vez por módulo)
+        modulo = inspect.getmodule(funcao)
+        nome = getattr(modulo, '__name__', None)
+        if nome not in self._hashes_fonte:
+            self._hashes_fonte[nome] = hash_fonte([*self.pacotes, *([modulo] if modulo else [])])
+        return self._hashes_fonte[nome]
+
+    def _chave(self, etapa, hashes_saida):
+        try:
+            codigo = inspect.getsource(etapa.funcao)
+        except (OSError, TypeError):
+            codigo = getattr(etapa.funcao, '__qualname__', repr(etapa.funcao))
+        return _hash_texto(
+            etapa.nome,
+            codigo,
+            self._hash_fonte(etapa.funcao),
+            json.dumps(etapa.parametros, sort_keys=True, default=repr),
+            *(self._hash_arquivo(a) for a in etapa.arquivos),
+            *(hashes_saida[d] for d in etapa.dependencias),
+        )
+
+    def _arquivo_saida(self, etapa, chave):
+        return os.path.join(self.dir_cache, f'{etapa.nome}-{chave[:16]}.pkl')
+
+    def executar(self, alvos=None, forcar=()):
+        """
+        Executa as etapas necessárias para obter os alvos, reaproveitando o cache.
+
+        Args:
+            alvos (list): Etapas desejadas. Padrão: todas.
+            forcar (tuple): Etapas a refazer mesmo com cache válido.
+
+        Returns:
+            (dict, pd.DataFrame): Saídas dos alvos e o relatório (etapa, situacao, segundos, chave).
+        """
+        alvos = list(alvos or self.etapas)
+        necessarias = self._fechamento(alvos)
+        os.makedirs(self.dir_cache, exist_ok=True)
+
+        hashes_saida, saidas, relatorio = {}, {}, []
+
+        def carregar(nome):
+            # Lê a saída de uma etapa em cache apenas quando alguém precisa dela
+            if nome not in saidas:
+                with open(self.manifesto['etapas'][nome]['arquivo'], 'rb') as arquivo:
+                    saidas[nome] = pickle.load(arquivo)
+            return saidas[nome]
+
+        for nome in self.etapas:
+            if nome not in necessarias:
+                continue
+            etapa = self.etapas[nome]
+            inicio = time.perf_counter()
+            with tratamento.instrumentacao.medir(f'pipeline.{nome}') as medicao:
+                chave = self._chave(etapa, hashes_saida)
+                registro = self.manifesto['etapas'].get(nome)
+                em_cache = (
+                    registro is not None
+                    and registro['chave'] == chave
+                    and os.path.exists(registro['arquivo'])
+                    and nome not in forcar
+                )
+                tratamento.instrumentacao.registrar_cache(em_cache)
+                if em_cache:
+                    situacao = 'cache'
+                else:
+                    entradas = [carregar(d) for d in etapa.dependencias]
+                    saida = etapa.funcao(*entradas, **etapa.parametros, **etapa.opcoes)
+                    arquivo_saida = self._arquivo_saida(etapa, chave)
+                    with open(arquivo_saida, 'wb') as arquivo:
+                        pickle.dump(saida, arquivo, protocol=pickle.HIGHEST_PROTOCOL)
+                    if registro and registro['arquivo'] != arquivo_saida and os.path.exists(registro['arquivo']):
+                        os.remove(registro['arquivo'])
+                    registro = {'chave': chave, 'arquivo': arquivo_saida, 'hash_saida': hash_objeto(saida)}
+                    self.manifesto['etapas'][nome] = registro
+                    saidas[nome] = saida
+                    situacao = 'executada'
+                    if medicao is not None:
+                        medicao['linhas_saida'] = getattr(saida, 'shape', (None,))[0]
+            hashes_saida[nome] = registro['hash_saida']
+            relatorio.append({
+                'etapa': nome,
+                'situacao': situacao,
+                'segundos': round(time.perf_counter() - inicio, 3),
+                'chave': chave[:12],
+            })
+            self._gravar_manifesto()
+
+        return {nome: carregar(nome) for nome in alvos}, pd.DataFrame(relatorio)
+
+    def situacao(self):
+        """
+        Indica, sem executar nada, quais etapas estão em cache e quais seriam refeitas.
+        Uma etapa é dada como 'desatualizada' se ela ou alguma dependência mudou.
+        """
+        hashes_saida, linhas = {}, []
+        for nome, etapa in self.etapas.items():
+            registro = self.manifesto['etapas'].get(nome)
+            desatualizadas = {l['etapa'] for l in linhas if l['situacao'] != 'cache'}
+            if any(d in desatualizadas for d in etapa.dependencias) or registro is None:
+                situacao = 'desatualizada'
+            else:
+                chave = self._chave(etapa, hashes_saida)
+                valido = registro['chave'] == chave and os.path.exists(registro['arquivo'])
+                situacao = 'cache' if valido else 'desatualizada'
+            if registro is not None:
+                hashes_saida[nome] = registro['hash_saida']
+            linhas.append({'etapa': nome, 'situacao': situacao, 'dependencias': ', '.join(etapa.dependencias)})
+        self._gravar_manifesto()
+        return pd.DataFrame(linhas)
+
+    def _fechamento(self, alvos):
+        # Alvos + todas as dependências (transitivas)
+        necessarias, pilha = set(), list(alvos)
+        while pilha:
+            nome = pilha.pop()
+            if nome not in self.etapas:
+                raise ValueError(f"Etapa desconhecida: '{nome}'")
+            if nome not in necessarias:
+                necessarias.add(nome)
+                pilha.extend(self.etapas[nome].dependencias)
+        return necessarias
+
+    def _gravar_manifesto(self):
+        os.makedirs(self.dir_cache, exist_ok=True)
+        temporario = f'{self._manifesto_arquivo}.tmp'
+        with open(temporario, 'w', encoding='utf-8') as arquivo:
+            json.dump(self.manifesto, arquivo, indent=1)
+        os.replace(temporario, self._manifesto_arquivo)
+
+
+# --- Etapas do projeto (mesmo fluxo do Trabalho_Final.ipynb) ---
+def _importar(caminho, pais=None, agregados=()):
+    df = tratamento.import_data_otimizado(caminho)
+    if df is None:
+        # import_data só imprime o erro; aqui a etapa precisa falhar para não ir para o cache
+        raise ValueError(f"Não foi possível importar '{caminho}'.")
+    # Regiões e grupos de renda aprovados como agregados não entram no painel
+    return tratamento.descartar_agregados(df, pais, agregados)
+
+
+def _montar_painel(gapminder, idh, escolaridade, mapa, como):
+    # Harmoniza os países com o mapa de apelidos e junta as três bases em uma única passada
+    resolvedor = tratamento.ResolvedorPaises(mapa)
+    fontes = [
+        dict(tratamento.FONTES_PROJETO['gapminder'], dados=gapminder),
+        dict(tratamento.FONTES_PROJETO['idh'], dados=idh),
+        dict(tratamento.FONTES_PROJETO['escolaridade_esperada'], dados=escolaridade),
+    ]
+    for fonte in fontes:
+        fonte.pop('arquivo')
+    return tratamento.montar_painel(fontes, resolvedor=resolvedor, como=como).reset_index()
+
+
+def _classificar(painel, faixas):
+    # faixas: {coluna nova: (variável, tabela)}; as tabelas vêm inteiras nos parâmetros, então
+    # alterar os limites de uma tabela invalida o cache desta etapa
+    return tratamento.ClassificadorFaixas(painel).aplicar(faixas)
+
+
+def _graficos(painel, tarefas, pasta, formato, processos):
+    import graficos
+    cubo = graficos.CuboAgregado(painel)
+    # Os processos de renderização abrem o painel por memory map em vez de receber uma cópia cada
+    with tempfile.TemporaryDirectory(prefix='painel_') as temporaria:
+        armazem = tratamento.gravar_painel(painel, os.path.join(temporaria, 'painel'))
+        relatorio = graficos.renderizar_lote(armazem, tarefas, pasta=pasta, formato=formato, processos=processos,
+                                             cubo=cubo)
+    return relatorio[['grafico', 'arquivo', 'sucesso']]
+
+
+def pipeline_projeto(pasta_dados='.', pasta_graficos='graficos_gerados', dir_cache=os.path.join('.cache', 'pipeline'),
+                     mapa=None, agregados=None, formato='png', processos=None):
+    """
+    Monta o pipeline do projeto: importação -> painel (harmonização + merge) -> classificação -> gráficos.
+
+    Args:
+        pasta_dados (str): Pasta dos CSVs. Padrão é '.'.
+        pasta_graficos (str): Pasta de saída dos gráficos. Padrão é 'graficos_gerados'.
+        dir_cache (str): Pasta do cache das etapas. Padrão é '.cache/pipeline'.
+        mapa (dict): Mapa de apelidos de países. Padrão é tratamento.MAPA_PAISES acrescido dos
+            apelidos aprovados em '<pasta_dados>/apelidos_paises.csv' (se existir).
+        agregados (list): Nomes descartados na importação (regiões, grupos de renda). Padrão são
+            os agregados aprovados no mesmo arquivo de apelidos.
+        formato (str): 'png' ou 'svg'. Padrão é 'png'.
+        processos (int): Processos usados na renderização. Padrão: número de núcleos.
+
+    Returns:
+        Pipeline: O pipeline com as etapas registradas.
+    """
+    if mapa is None or agregados is None:
+        tabela = tratamento.TabelaApelidos(os.path.join(pasta_dados, tratamento.ARQUIVO_APELIDOS))
+        mapa = tabela.como_mapa() if mapa is None else mapa
+        agregados = tabela.agregados if agregados is None else agregados
+    pipeline = Pipeline(dir_cache)
+    for nome, fonte in (('gapminder', 'gapminder'), ('idh', 'idh'), ('escolaridade', 'escolaridade_esperada')):
+        caminho = os.path.join(pasta_dados, tratamento.FONTES_PROJETO[fonte]['arquivo'])
+        pipeline.adicionar(Etapa(
+            f'importar_{nome}', _importar,
+            parametros={'caminho': caminho, 'pais': tratamento.FONTES_PROJETO[fonte]['pais'],
+                        'agregados': sorted(agregados)},
+            arquivos=(caminho,),
+        ))
+
+    pipeline.adicionar(Etapa(
+        'painel', _montar_painel,
+        dependencias=('importar_gapminder', 'importar_idh', 'importar_escolaridade'),
+        parametros={'mapa': dict(mapa), 'como': 'inner'},
+    ))
+    pipeline.adicionar(Etapa(
+        'classificacao', _classificar,
+        dependencias=('painel',),
+        parametros={'faixas': {
+            coluna: (variavel, tratamento.TABELAS_FAIXAS[tabela])
+            for coluna, (variavel, tabela) in FAIXAS_PROJETO.items()
+        }},
+    ))
+
+    variaveis = ['Life expectation', 'gdpPercap', 'IDH', 'Anos estudo']
+    continentes = ['Africa', 'Americas', 'Asia', 'Europe', 'Oceania']
+    import graficos
+    tarefas = (
+        graficos.gerar_tarefas('comparando_cont', variavel_observada=variaveis)
+        + graficos.gerar_tarefas('graficos_linhas_continente', continent=continentes, observado=variaveis)
+    )
+    pipeline.adicionar(Etapa(
+        'graficos', _graficos,
+        dependencias=('classificacao',),
+        parametros={'tarefas': tarefas, 'pasta': pasta_graficos, 'formato': formato},
+        opcoes={'processos': processos},
+    ))
+    return pipeline
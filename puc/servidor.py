@@ -0,0 +1,89 @@
+"""Servidor HTTP/JSON local para consultar o painel já carregado (usado pelo dashboard)."""
+
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from tratamento import ConsultaPainel
+
+
+def _criar_manipulador(consulta):
+
+    class Manipulador(BaseHTTPRequestHandler):
+        # GET /dimensoes                     -> países, continentes, anos e colunas disponíveis
+        # GET /fatia?pais=..&continente=..&ano=..&coluna=..  (parâmetros repetíveis)
+
+        def _responder(self, status, corpo):
+            dados = corpo.encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(dados)))
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(dados)
+
+        def _erro(self, status, mensagem):
+            self._responder(status, json.dumps({'erro': mensagem}, ensure_ascii=False))
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            parametros = parse_qs(url.query)
+
+            if url.path == '/dimensoes':
+                corpo = {
+                    'paises': consulta.listar('pais'),
+                    'continentes': consulta.listar('continente'),
+                    'anos': [int(ano) for ano in consulta.listar('ano')],
+                    'colunas': list(consulta.dados.columns),
+                }
+                self._responder(200, json.dumps(corpo, ensure_ascii=False))
+                return
+
+            if url.path == '/fatia':
+                colunas = parametros.get('coluna')
+                desconhecidas = [c for c in colunas or () if c not in consulta.dados.columns]
+                if desconhecidas:
+                    self._erro(400, f"Colunas não encontradas: {', '.join(desconhecidas)}")
+                    return
+                try:
+                    anos = [int(ano) for ano in parametros['ano']] if 'ano' in parametros else None
+                except ValueError:
+                    self._erro(400, "O parâmetro 'ano' deve ser inteiro.")
+                    return
+                fatia = consulta.fatia(
+                    paises=parametros.get('pais'),
+                    continentes=parametros.get('continente'),
+                    anos=anos,
+                    colunas=colunas,
+                )
+                registros = fatia.to_json(orient='records', force_ascii=False)
+                self._responder(200, f'{{"linhas": {len(fatia)}, "dados": {registros}}}')
+                return
+
+            self._erro(404, f"Rota desconhecida: {url.path}")
+
+        def log_message(self, formato, *args):
+            # Sem log por requisição no terminal
+            pass
+
+    return Manipulador
+
+
+def criar_servidor(df, host: str = '127.0.0.1', porta: int = 8050, **colunas):
+    """
+    Cria o servidor de consultas sobre um painel (DataFrame ou ConsultaPainel).
+
+    Os índices são construídos uma vez aqui; cada requisição só fatia o painel em memória.
+    Chame .serve_forever() no objeto retornado para atender as requisições.
+
+    Args:
+        df: pd.DataFrame do painel ou uma ConsultaPainel já construída.
+        host (str): Endereço de escuta. Padrão é '127.0.0.1' (apenas local).
+        porta (int): Porta TCP. Padrão é 8050.
+        **colunas: Repassados para ConsultaPainel (coluna_pais, coluna_continente, coluna_ano).
+
+    Returns:
+        ThreadingHTTPServer: O servidor, ainda não iniciado.
+    """
+    consulta = df if isinstance(df, ConsultaPainel) else ConsultaPainel(df, **colunas)
+    return ThreadingHTTPServer((host, porta), _criar_manipulador(consulta))
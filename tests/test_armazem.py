@@ -0,0 +1,40 @@
+"""Testes do armazém colunar do painel (tratamento/armazem.py)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tratamento.armazem import abrir_painel, gravar_painel
+
+
+def _painel():
+    return pd.DataFrame({
+        'country': ['A', 'A', 'B'],
+        'year': np.array([2000, 2001, 2000], dtype='int16'),
+        'IDH': [0.5, np.nan, 0.9],
+        'faixa': pd.Categorical(['Baixo', 'Baixo', 'Alto'], categories=['Baixo', 'Médio', 'Alto'], ordered=True),
+        'grupo': pd.Categorical(['x', 'y', 'x']),
+    }).set_index(['country', 'year'])
+
+
+def test_ida_e_volta(tmp_path):
+    painel = _painel()
+    aberto = abrir_painel(gravar_painel(painel, str(tmp_path / 'painel')), indice=True)
+    assert aberto.index.names == ['country', 'year']
+    assert aberto.index.get_level_values('country').tolist() == ['A', 'A', 'B']
+    np.testing.assert_array_equal(aberto['IDH'].to_numpy(), painel['IDH'].to_numpy())
+    assert aberto['grupo'].tolist() == ['x', 'y', 'x']
+    assert not aberto['grupo'].cat.ordered
+
+
+def test_categorica_ordenada(tmp_path):
+    aberto = abrir_painel(gravar_painel(_painel(), str(tmp_path / 'painel')))
+    assert aberto['faixa'].cat.ordered
+    assert aberto['faixa'].cat.categories.tolist() == ['Baixo', 'Médio', 'Alto']
+    assert (aberto['faixa'] > 'Baixo').tolist() == [False, False, True]
+
+
+def test_somente_leitura(tmp_path):
+    aberto = abrir_painel(gravar_painel(_painel(), str(tmp_path / 'painel')))
+    with pytest.raises(ValueError):
+        aberto['IDH'].to_numpy()[0] = 1.0
@@ -0,0 +1,63 @@
+"""Testes do upsert incremental do painel (tratamento/atualizacao.py)."""
+
+import pandas as pd
+
+from tratamento.atualizacao import PainelIncremental
+from tratamento.painel import montar_painel
+from tratamento.paises import ResolvedorPaises
+
+
+def _fontes(renda, idh):
+    return [
+        {'nome': 'renda', 'dados': renda, 'pais': 'country', 'ano': 'year', 'colunas': ['renda'],
+         'atributos': {'continent': 'continent'}},
+        {'nome': 'idh', 'dados': idh, 'pais': 'Entity', 'ano': 'Year', 'colunas': {'HDI': 'IDH'}},
+    ]
+
+
+def _renda():
+    return pd.DataFrame({
+        'country': ['Brazil', 'Brazil', 'Chile', 'Peru'],
+        'year': [2000, 2001, 2000, 2000],
+        'continent': ['Americas', 'Americas', 'Americas', 'Americas'],
+        'renda': [10.0, 11.0, 12.0, 9.0],
+    })
+
+
+def _idh():
+    return pd.DataFrame({
+        'Entity': ['Brazil', 'Chile', 'Peru'],
+        'Year': [2000, 2000, 2000],
+        'HDI': [0.7, 0.8, 0.6],
+    })
+
+
+def _comparar(inc, fontes, como):
+    referencia = montar_painel(fontes, resolvedor=ResolvedorPaises(), como=como)
+    pd.testing.assert_frame_equal(inc.painel, referencia)
+
+
+def test_upsert_igual_a_remontar():
+    for como in ('outer', 'inner'):
+        inc = PainelIncremental(_fontes(_renda(), _idh()), resolvedor=ResolvedorPaises(), como=como)
+        idh = pd.concat([_idh(), pd.DataFrame({
+            'Entity': ['Brazil', 'Argentina', 'Chile'],
+            'Year': [2001, 2000, 2002],
+            'HDI': [0.71, 0.82, 0.81],
+        })], ignore_index=True)
+        idh.loc[idh['Entity'] == 'Peru', 'HDI'] = 0.65
+        alteracoes = inc.atualizar_fonte('idh', idh)
+        _comparar(inc, _fontes(_renda(), idh), como)
+        assert ('Peru', 0.65) in set(zip(alteracoes['country'], alteracoes['novo']))
+        assert len(inc.atualizar_fonte('idh', idh)) == 0
+
+
+def test_upsert_le_csv(tmp_path):
+    caminho = tmp_path / 'idh.csv'
+    _idh().to_csv(caminho, index=False)
+    inc = PainelIncremental(_fontes(_renda(), str(caminho)), resolvedor=ResolvedorPaises())
+    novo = pd.concat([_idh(), pd.DataFrame({'Entity': ['Chile'], 'Year': [2001], 'HDI': [0.9]})])
+    novo.to_csv(caminho, index=False)
+    alteracoes = inc.atualizar_fonte('idh')
+    assert alteracoes[['country', 'year']].values.tolist() == [['Chile', 2001]]
+    _comparar(inc, _fontes(_renda(), str(caminho)), 'outer')
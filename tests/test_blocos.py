@@ -0,0 +1,67 @@
+"""Testes da importação em blocos (tratamento/blocos.py)."""
+
+import os
+
+import pytest
+
+from tratamento.blocos import import_data_em_blocos
+
+
+def _csv(pasta):
+    # A coluna 'nota' só tem valores no último bloco (como as anotações dos exports do OWID)
+    caminho = os.path.join(pasta, 'dados.csv')
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        arquivo.write('pais,ano,valor,nota\n')
+        for i in range(6):
+            arquivo.write(f"P{i},{2000 + i},{i / 2},{'revisado' if i == 5 else ''}\n")
+    return caminho
+
+
+def test_coluna_nula_no_primeiro_bloco_em_memoria(tmp_path):
+    df = import_data_em_blocos(_csv(tmp_path), tamanho_bloco=2)
+    assert df['nota'].dtype != object
+    assert df['nota'].tolist()[-1] == 'revisado'
+
+
+@pytest.mark.parametrize('extensao', ['parquet', 'feather'])
+def test_coluna_nula_no_primeiro_bloco_no_destino(tmp_path, extensao):
+    pa = pytest.importorskip('pyarrow')
+    destino = str(tmp_path / f'saida.{extensao}')
+    assert import_data_em_blocos(_csv(tmp_path), tamanho_bloco=2, destino=destino) == destino
+    if extensao == 'parquet':
+        import pyarrow.parquet as pq
+        tabela = pq.read_table(destino)
+    else:
+        import pyarrow.feather as feather
+        tabela = feather.read_table(destino)
+    assert tabela.num_rows == 6
+    assert tabela.column('nota').to_pylist()[-1] == 'revisado'
+    assert pa.types.is_large_string(tabela.schema.field('nota').type)
+
+
+@pytest.mark.parametrize('extensao', ['parquet', 'feather'])
+def test_coluna_numerica_nula_no_primeiro_bloco(tmp_path, extensao):
+    # 'taxa' é numérica, mas vazia nos dois primeiros blocos: não pode ser gravada como texto
+    pa = pytest.importorskip('pyarrow')
+    caminho = tmp_path / 'taxas.csv'
+    linhas = ['pais,ano,taxa'] + [f"P{i},{2000 + i},{i * 1.5 if i >= 4 else ''}" for i in range(7)]
+    caminho.write_text('\n'.join(linhas) + '\n', encoding='utf-8')
+    destino = str(tmp_path / f'saida.{extensao}')
+    assert import_data_em_blocos(str(caminho), tamanho_bloco=2, destino=destino) == destino
+    if extensao == 'parquet':
+        import pyarrow.parquet as pq
+        tabela = pq.read_table(destino)
+    else:
+        import pyarrow.feather as feather
+        tabela = feather.read_table(destino)
+    assert pa.types.is_floating(tabela.schema.field('taxa').type)
+    assert tabela.column('taxa').to_pylist() == [None] * 4 + [6.0, 7.5, 9.0]
+
+
+def test_falha_remove_destino_parcial(tmp_path):
+    caminho = tmp_path / 'inteiros.csv'
+    caminho.write_text('a\n1\n2\n1.5\n', encoding='utf-8')
+    destino = str(tmp_path / 'saida.parquet')
+    pytest.importorskip('pyarrow')
+    assert import_data_em_blocos(str(caminho), tamanho_bloco=2, destino=destino) is None
+    assert not os.path.exists(destino)
@@ -0,0 +1,27 @@
+"""Testes de ConsultaPainel (tratamento/consulta.py)."""
+
+import pandas as pd
+import pytest
+
+from tratamento.consulta import ConsultaPainel
+
+
+def _consulta():
+    return ConsultaPainel(pd.DataFrame({
+        'country': ['A', 'A', 'B'],
+        'continent': ['Europe', 'Europe', 'Asia'],
+        'year': [2000, 2001, 2000],
+        'x': [1.0, 2.0, 3.0],
+        'y': [4.0, 5.0, 6.0],
+    }))
+
+
+def test_fatia_colunas():
+    fatia = _consulta().fatia(paises='A', colunas=['x'])
+    assert list(fatia.columns) == ['country', 'continent', 'year', 'x']
+    assert fatia['x'].tolist() == [1.0, 2.0]
+
+
+def test_fatia_coluna_desconhecida():
+    with pytest.raises(KeyError):
+        _consulta().fatia(colunas=['nao_existe'])
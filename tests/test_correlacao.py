@@ -0,0 +1,32 @@
+"""Testes de AnaliseRelacoes (tratamento/correlacao.py)."""
+
+import numpy as np
+import pandas as pd
+
+from tratamento.correlacao import AnaliseRelacoes
+
+
+def _painel():
+    return pd.DataFrame({
+        'country': ['A', 'B', 'C', 'D', 'E', 'F'],
+        'year': [2000] * 6,
+        'continent': ['Europe', 'Europe', 'Europe', 'Asia', 'Asia', None],
+        'x': [1.0, 2.0, 3.0, 1.0, 2.0, 5.0],
+        'y': [2.0, 4.1, 5.9, 10.0, 20.0, 7.0],
+    })
+
+
+def test_residuos_chave_de_grupo_nula_fica_nan():
+    residuos = AnaliseRelacoes(_painel()).residuos('x', 'y')
+    assert np.isnan(residuos.loc[('F', 2000)])
+    assert residuos.drop(('F', 2000)).notna().all()
+
+
+def test_residuos_conferem_com_polyfit():
+    df = _painel()
+    residuos = AnaliseRelacoes(df).residuos('x', 'y')
+    europa = df[df['continent'] == 'Europe']
+    inclinacao, intercepto = np.polyfit(europa['x'], europa['y'], 1)
+    esperado = europa['y'] - (intercepto + inclinacao * europa['x'])
+    obtido = residuos.loc[list(zip(europa['country'], europa['year']))]
+    assert np.allclose(obtido.to_numpy(), esperado.to_numpy())
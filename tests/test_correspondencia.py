@@ -0,0 +1,22 @@
+"""Testes da tabela de apelidos e dos agregados (tratamento/correspondencia.py)."""
+
+import pandas as pd
+
+from tratamento.correspondencia import TabelaApelidos, sugerir_correspondencias
+
+
+def test_agregado_aprovado_e_descartado(tmp_path):
+    caminho = str(tmp_path / 'apelidos.csv')
+    sugestoes = sugerir_correspondencias(pd.Series(['Brazil', 'World']), pd.Series(['Brazil']))
+    tabela = TabelaApelidos(caminho)
+    assert tabela.aprovar_sugestoes(sugestoes) == 1
+    tabela.salvar()
+
+    df = pd.DataFrame({'Entity': ['Brazil', 'World', 'Brazil'], 'Year': [2000, 2000, 2001]})
+    filtrado = TabelaApelidos(caminho).descartar(df, 'Entity')
+    assert filtrado['Entity'].tolist() == ['Brazil', 'Brazil']
+
+
+def test_descartar_sem_agregados(tmp_path):
+    df = pd.DataFrame({'Entity': ['World']})
+    assert TabelaApelidos(str(tmp_path / 'vazio.csv')).descartar(df, 'Entity') is df
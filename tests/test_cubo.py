@@ -0,0 +1,24 @@
+"""Testes do cubo de agregados (graficos/cubo.py)."""
+
+import pandas as pd
+
+from graficos.cubo import CuboAgregado
+
+
+def _painel(valores):
+    return pd.DataFrame({
+        'country': ['A', 'B', 'C'],
+        'continent': ['Europe', 'Europe', 'Europe'],
+        'year': [2000, 2000, 2000],
+        'IDH': valores,
+    })
+
+
+def test_atualizar_recalcula_extremo_substituido():
+    antes = _painel([0.2, 0.5, 0.9])
+    depois = _painel([0.4, 0.5, 0.6])
+    cubo = CuboAgregado(antes)
+    cubo.atualizar(antes.iloc[[0, 2]], depois.iloc[[0, 2]], depois)
+    esperado = CuboAgregado(depois).estatisticas('IDH')
+    pd.testing.assert_frame_equal(cubo.estatisticas('IDH'), esperado)
+    assert cubo.estatisticas('IDH')[['minimo', 'maximo']].iloc[0].tolist() == [0.4, 0.6]
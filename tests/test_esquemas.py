@@ -0,0 +1,18 @@
+"""Testes da inferência de tipos (tratamento/esquemas.py)."""
+
+import numpy as np
+import pandas as pd
+
+from tratamento.esquemas import inferir_esquema
+
+
+def test_float32_so_sem_perda():
+    tipos = inferir_esquema(pd.DataFrame({
+        'taxa': [0.1, 0.25, np.nan],
+        'fora_da_faixa': [1.5e39, 0.5, np.nan],
+        'subnormal': [1e-42, 0.5, np.nan],
+        'populacao': [1234567891.0, np.nan, 3.0],
+        'pequena': [120.0, np.nan, 3.0],
+    }))
+    assert tipos == {'taxa': 'float32', 'fora_da_faixa': 'float64', 'subnormal': 'float64',
+                     'populacao': 'float64', 'pequena': 'float32'}
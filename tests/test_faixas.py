@@ -0,0 +1,24 @@
+"""Testes da classificação em faixas (tratamento/faixas.py)."""
+
+import numpy as np
+import pandas as pd
+
+from tratamento.faixas import ClassificadorFaixas
+
+
+def test_memo_nao_reaproveita_tabela_descartada():
+    df = pd.DataFrame({'year': [2000] * 3, 'x': [1.0, 5.0, 9.0]})
+    classificador = ClassificadorFaixas(df)
+    for corte in np.linspace(0.5, 9.5, 50):
+        tabela = {'versao': 1, 'categorias': ['baixo', 'alto'], 'limites': (corte,), 'direita': True}
+        obtido = classificador.classificar('x', tabela).tolist()
+        esperado = ['baixo' if valor <= corte else 'alto' for valor in df['x']]
+        assert obtido == esperado
+
+
+def test_memo_reaproveita_mesmo_conteudo():
+    df = pd.DataFrame({'year': [2000], 'x': [1.0]})
+    classificador = ClassificadorFaixas(df)
+    tabela = {'categorias': ['a', 'b'], 'limites': (0.5,)}
+    primeira = classificador.classificar('x', tabela)
+    assert classificador.classificar('x', dict(tabela)) is primeira
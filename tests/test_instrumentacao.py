@@ -0,0 +1,42 @@
+"""Testes da instrumentação (tratamento/instrumentacao.py)."""
+
+from contextlib import contextmanager
+
+import numpy as np
+
+from tratamento import instrumentacao
+
+
+def test_instrumentar_com_desativacao_concorrente(monkeypatch):
+    # Simula desativar() em outra thread depois do teste de _ativo do decorador e antes do de medir
+    @contextmanager
+    def medir_desativado(nome, linhas_entrada=None, **campos):
+        yield None
+
+    @instrumentacao.instrumentar
+    def dobro(valores):
+        return [v * 2 for v in valores]
+
+    memoria = instrumentacao.DestinoMemoria()
+    instrumentacao.ativar(memoria)
+    try:
+        monkeypatch.setattr(instrumentacao, 'medir', medir_desativado)
+        assert dobro([1, 2]) == [2, 4]
+    finally:
+        instrumentacao.desativar()
+
+
+def test_instrumentar_registra_linhas():
+    @instrumentacao.instrumentar(nome='teste.dobro')
+    def dobro(valores):
+        return valores * 2
+
+    memoria = instrumentacao.DestinoMemoria()
+    instrumentacao.ativar(memoria)
+    try:
+        dobro(np.arange(3))
+    finally:
+        instrumentacao.desativar()
+    registro, = memoria.registros()
+    assert registro['nome'] == 'teste.dobro'
+    assert registro['linhas_entrada'] == registro['linhas_saida'] == 3
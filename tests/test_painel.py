@@ -0,0 +1,40 @@
+"""Testes de montagem e alinhamento do painel (tratamento/painel.py)."""
+
+import numpy as np
+import pandas as pd
+
+from tratamento.painel import MAPA_CONTINENTES_OWID, alinhar_anos, montar_painel
+
+
+def test_alinhar_anos_coluna_sem_observacoes():
+    df = pd.DataFrame({
+        'country': ['A', 'A', 'B', 'B'],
+        'year': [2000, 2004, 2000, 2004],
+        'x': [1.0, 3.0, np.nan, np.nan],
+        'z': [np.nan] * 4,
+    })
+    for metodo in ('linear', 'nearest', 'step'):
+        alinhado = alinhar_anos(df, [2000, 2002, 2004], metodo=metodo)
+        assert alinhado['z'].isna().all()
+        assert alinhado.loc[alinhado['country'] == 'B', 'x'].isna().all()
+    linear = alinhar_anos(df, [2000, 2002, 2004])
+    assert linear.loc[linear['country'] == 'A', 'x'].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_montar_painel_recodifica_continentes():
+    gapminder = pd.DataFrame({'country': ['Brazil'], 'year': [2000], 'pop': [1.0], 'continent': ['Americas']})
+    owid = pd.DataFrame({
+        'Entity': ['Brazil', 'Canada', 'Antarctica'],
+        'Year': [2000, 2000, 2000],
+        'GDP per capita': [1.0, 2.0, 3.0],
+        'Continent': ['South America', 'North America', 'Antarctica'],
+    })
+    fontes = [
+        {'dados': gapminder, 'pais': 'country', 'ano': 'year', 'colunas': ['pop'],
+         'atributos': {'continent': 'continent'}},
+        {'dados': owid, 'pais': 'Entity', 'ano': 'Year', 'colunas': ['GDP per capita'],
+         'atributos': {'Continent': 'continent'}, 'recodificar': {'continent': MAPA_CONTINENTES_OWID}},
+    ]
+    painel = montar_painel(fontes)
+    continentes = painel['continent'].dropna().unique().tolist()
+    assert set(continentes) == {'Americas'}
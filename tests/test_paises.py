@@ -0,0 +1,30 @@
+"""Testes da harmonização de países (tratamento/paises.py)."""
+
+import pandas as pd
+
+from tratamento.paises import MAPA_PAISES, ResolvedorPaises, resolvedor_padrao
+
+
+def test_resolvedor_padrao_nao_guarda_apelidos_entre_chamadas():
+    primeiro = resolvedor_padrao()
+    # O código ISO3 faz 'Brasil' virar apelido de 'Brazil' neste resolvedor
+    ids = primeiro.resolver(pd.Series(['Brazil', 'Brasil']), pd.Series(['BRA', 'BRA']))
+    assert ids[0] == ids[1]
+
+    segundo = resolvedor_padrao()
+    brasil, brazil = segundo.resolver(pd.Series(['Brasil', 'Brazil']))
+    assert brasil != brazil
+
+
+def test_copiar_independente():
+    original = ResolvedorPaises()
+    copia = original.copiar()
+    copia.adicionar_apelido('Brasil', 'Brazil')
+    assert original.id_de('Brasil') != original.id_de('Brazil')
+    assert copia.id_de('Brasil') == copia.id_de('Brazil')
+
+
+def test_mapa_mantem_grafia_original():
+    assert MAPA_PAISES[' Korea Dem. Rep.'] == 'North Korea'
+    resolvedor = ResolvedorPaises()
+    assert resolvedor.id_de(' Korea Dem. Rep.') == resolvedor.id_de('North Korea')
@@ -0,0 +1,46 @@
+"""Testes do perfil dos dados (tratamento/perfil.py)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tratamento.perfil import gerar_metadados, perfilar_dataframe
+
+
+def _dados():
+    return pd.DataFrame({
+        'country': ['A', 'A', 'B', 'B', None],
+        'year': [2000, 2000, 2000, 2001, 2001],
+        'x': [1.0, 1.0, np.nan, 3.0, 4.0],
+    })
+
+
+def test_gerar_metadados_igual_ao_pandas():
+    df = _dados()
+    metadados = gerar_metadados(df)
+    assert list(metadados.columns) == ['nome_variavel', 'tipo', 'qt_nulos', 'percent_nulos', 'cardinalidade']
+    assert metadados['cardinalidade'].tolist() == df.nunique().tolist()
+    assert metadados['qt_nulos'].tolist() == df.isna().sum().tolist()
+
+
+def test_perfil_apenas_estatisticas_pedidas():
+    perfil = perfilar_dataframe(_dados(), estatisticas=('cardinalidade',))
+    assert 'duplicados' not in perfil
+    assert 'memoria_kb' not in perfil['metadados'].columns
+
+
+def test_perfil_completo_conta_duplicados():
+    perfil = perfilar_dataframe(_dados())
+    assert perfil['qtd_duplicados'] == 1
+    assert perfil['qtd_duplicados_chave'] == 1
+    assert perfil['metadados']['maximo'].tolist()[1:] == [2001, 4.0]
+
+
+def test_perfil_estatistica_desconhecida():
+    with pytest.raises(ValueError):
+        perfilar_dataframe(_dados(), estatisticas=('mediana',))
+
+
+def test_cardinalidade_aproximada_poucos_valores():
+    df = pd.DataFrame({'x': np.tile(np.arange(10), 1000)})
+    assert gerar_metadados(df, aproximado=True)['cardinalidade'].tolist() == [10]
@@ -0,0 +1,69 @@
+"""
+Tratamento das bases do projeto: importação, tipos, harmonização de países, perfil e painel.
+
+O pacote não importa matplotlib/seaborn, então rotinas de ETL (sem gráficos) carregam rápido.
+"""
+
+from . import instrumentacao
+from .importacao import (
+    VERSAO_CACHE,
+    estatisticas_cache,
+    import_data,
+    limpar_estatisticas_cache,
+)
+from .esquemas import (
+    ESQUEMAS,
+    aplicar_esquema,
+    import_data_otimizado,
+    inferir_esquema,
+    obter_esquema,
+    relatorio_memoria,
+)
+from .wdi import COLUNAS_CHAVE_WDI, import_wdi, indicadores_wdi
+from .perfil import (
+    gerar_metadados,
+    perfilar_dataframe,
+    verifica_dados_duplicados,
+    verificar_duplicados,
+    verificar_NaN,
+)
+from .paises import (
+    MAPA_PAISES,
+    ResolvedorPaises,
+    integrar_dataframes_por_pais,
+    renomeando_gp,
+    resolvedor_padrao,
+    substituir_por_unicos,
+)
+from .painel import (
+    FONTES_PROJETO,
+    alinhar_anos,
+    chave_pais_ano,
+    decodificar_chave,
+    fontes_projeto,
+    montar_painel,
+)
+from .atualizacao import PainelIncremental
+from .indicadores import IndicadoresPainel
+from .correlacao import AnaliseRelacoes
+from .consulta import ConsultaPainel
+from .faixas import TABELAS_FAIXAS, ClassificadorFaixas, classificar, codigos_faixas
+from .armazem import VERSAO_ARMAZEM, abrir_painel, gravar_painel, info_painel
+from .correspondencia import (
+    ARQUIVO_APELIDOS,
+    CODIGOS_AGREGADOS,
+    IndiceNomes,
+    TabelaApelidos,
+    descartar_agregados,
+    eh_agregado,
+    sugerir_correspondencias,
+)
+from .blocos import (
+    etapa_descartar_chaves_invalidas,
+    etapa_filtrar_anos,
+    etapa_harmonizar_paises,
+    etapa_renomear,
+    etapa_renomear_gp,
+    etapa_selecionar_colunas,
+    import_data_em_blocos,
+)
@@ -0,0 +1,126 @@
+"""Armazém colunar do painel em disco, aberto por memory map e compartilhado entre processos."""
+
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from .instrumentacao import instrumentar
+
+
+# Versão do formato do armazém. Incrementar torna ilegíveis (erro explícito) os armazéns antigos.
+VERSAO_ARMAZEM = 1
+_MANIFESTO = 'manifesto.json'
+
+
+def _coluna_para_array(serie):
+    # Converte uma coluna para (array de largura fixa, categorias ou None)
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        return serie.cat.codes.to_numpy(), serie.cat.categories.tolist()
+    if serie.dtype == object or pd.api.types.is_string_dtype(serie.dtype):
+        categorica = pd.Categorical(serie)
+        return categorica.codes, categorica.categories.tolist()
+    if isinstance(serie.dtype, pd.api.extensions.ExtensionDtype):
+        # Tipos anuláveis (Int64, Float64, boolean): float64 com NaN no lugar de <NA>
+        return serie.to_numpy(dtype='float64', na_value=np.nan), None
+    if serie.dtype.kind in 'biufmM':
+        return serie.to_numpy(), None
+    raise TypeError(f"Coluna '{serie.name}' com tipo não suportado pelo armazém: {serie.dtype}")
+
+
+@instrumentar
+def gravar_painel(df, pasta: str):
+    """
+    Grava o painel como um array .npy de largura fixa por coluna, mais um manifesto JSON.
+
+    Colunas de texto (país, continente...) são gravadas como códigos inteiros e o dicionário
+    de valores vai no manifesto; ao abrir, voltam como categóricas (ordenadas, se eram). Um painel indexado por
+    (country, year) tem o índice gravado como colunas e restaurado com abrir_painel(indice=True).
+    A gravação é atômica: quem estiver lendo a versão anterior não vê um armazém pela metade.
+
+    Args:
+        df (pd.DataFrame): O painel harmonizado.
+        pasta (str): Pasta do armazém (substituída se já existir).
+
+    Returns:
+        str: O caminho da pasta gravada.
+    """
+    indice = [nome for nome in df.index.names if nome is not None]
+    if indice:
+        df = df.reset_index()
+    pasta = os.path.abspath(pasta)
+    temporaria = f'{pasta}.{os.getpid()}.tmp'
+    shutil.rmtree(temporaria, ignore_errors=True)
+    os.makedirs(temporaria)
+
+    colunas = []
+    for posicao, nome in enumerate(df.columns):
+        serie = df[nome]
+        array, categorias = _coluna_para_array(serie)
+        arquivo = f'{posicao:03d}.npy'
+        np.save(os.path.join(temporaria, arquivo), np.ascontiguousarray(array), allow_pickle=False)
+        # Categóricas ordenadas (ex.: faixas de IDH) mantêm a ordem ao reabrir
+        ordenada = isinstance(serie.dtype, pd.CategoricalDtype) and bool(serie.cat.ordered)
+        colunas.append({'nome': str(nome), 'arquivo': arquivo, 'dtype': str(array.dtype), 'categorias': categorias,
+                        'ordenada': ordenada})
+
+    manifesto = {'versao': VERSAO_ARMAZEM, 'linhas': len(df), 'indice': indice, 'colunas': colunas}
+    with open(os.path.join(temporaria, _MANIFESTO), 'w', encoding='utf-8') as arquivo:
+        json.dump(manifesto, arquivo, ensure_ascii=False, default=str)
+
+    if os.path.exists(pasta):
+        antiga = f'{pasta}.{os.getpid()}.old'
+        os.replace(pasta, antiga)
+        os.replace(temporaria, pasta)
+        shutil.rmtree(antiga, ignore_errors=True)
+    else:
+        os.replace(temporaria, pasta)
+    return pasta
+
+
+def info_painel(pasta: str):
+    """Manifesto do armazém (versão, linhas, índice e colunas com tipo e dicionário)."""
+    with open(os.path.join(pasta, _MANIFESTO), encoding='utf-8') as arquivo:
+        manifesto = json.load(arquivo)
+    if manifesto.get('versao') != VERSAO_ARMAZEM:
+        raise ValueError(f"Armazém '{pasta}' na versão {manifesto.get('versao')}; esperado {VERSAO_ARMAZEM}.")
+    return manifesto
+
+
+@instrumentar
+def abrir_painel(pasta: str, colunas: list = None, indice: bool = False):
+    """
+    Abre um armazém gravado com gravar_painel, somente leitura e sem cópia.
+
+    Cada coluna é um np.memmap do arquivo .npy: o sistema operacional carrega as páginas sob
+    demanda e todos os processos que abrem o mesmo armazém compartilham a mesma cópia física.
+    O DataFrame retornado é somente leitura (atribuições levantam ValueError); use .copy()
+    para obter uma cópia alterável.
+
+    Args:
+        pasta (str): Pasta do armazém.
+        colunas (list): Colunas a abrir (padrão: todas).
+        indice (bool): Se True, restaura o índice gravado (ex.: (country, year)); montar o
+            índice cria arrays próprios para as colunas de chave.
+
+    Returns:
+        pd.DataFrame: O painel, com colunas de texto como categóricas.
+    """
+    manifesto = info_painel(pasta)
+    pedidas = None if colunas is None else set(colunas) | (set(manifesto['indice']) if indice else set())
+    dados = {}
+    for coluna in manifesto['colunas']:
+        if pedidas is not None and coluna['nome'] not in pedidas:
+            continue
+        array = np.load(os.path.join(pasta, coluna['arquivo']), mmap_mode='r', allow_pickle=False)
+        if coluna['categorias'] is not None:
+            array = pd.Categorical.from_codes(array, categories=coluna['categorias'],
+                                              ordered=coluna.get('ordenada', False), validate=False)
+        dados[coluna['nome']] = array
+    df = pd.DataFrame(dados, copy=False)
+    if indice and manifesto['indice']:
+        df = df.set_index(manifesto['indice'])
+    df.attrs['armazem'] = os.path.abspath(pasta)
+    return df
@@ -0,0 +1,382 @@
+"""Atualização incremental (upsert) do painel (country, year) quando uma fonte publica anos novos."""
+
+import io
+
+import numpy as np
+import pandas as pd
+
+from .esquemas import aplicar_esquema, obter_esquema
+from .instrumentacao import instrumentar
+from .painel import _DESLOCAMENTO_ANO, _juntar_fontes, _preparar_fonte, chave_pais_ano, decodificar_chave
+from .paises import resolvedor_padrao
+
+
+def _combinar_atributos(atributos_por_fonte):
+    # Atributo (ex.: continente) de cada ID: vale a primeira fonte, as seguintes preenchem lacunas
+    combinados = {}
+    for atributos in atributos_por_fonte:
+        for nome, serie in atributos.items():
+            combinados[nome] = serie if nome not in combinados else combinados[nome].combine_first(serie)
+    return combinados
+
+
+def _alterados(novos, antigos):
+    # Valores presentes em 'novos' que não existiam ou eram diferentes em 'antigos' (NaN = sem valor)
+    novos = np.asarray(novos)
+    antigos = np.asarray(antigos)
+    presentes = ~pd.isna(novos)
+    ausentes = pd.isna(antigos)
+    with np.errstate(invalid='ignore'):
+        diferentes = np.asarray(novos != antigos, dtype=bool)
+    return presentes & (ausentes | diferentes)
+
+
+def _inserir_categorica(categorica, posicoes, valores):
+    # np.insert para categóricas: os códigos atuais só são remapeados se surgirem categorias novas
+    categorias = categorica.categories
+    codigos = categorica.codes
+    presentes = pd.Index(pd.unique(valores[~pd.isna(valores)]))
+    if len(presentes.difference(categorias)):
+        categorias = categorias.union(presentes.astype(categorias.dtype))
+        codigos = np.where(codigos >= 0, categorias.get_indexer(categorica.categories).take(codigos), -1)
+    return pd.Categorical.from_codes(np.insert(codigos, posicoes, categorias.get_indexer(valores)), categories=categorias)
+
+
+def _ler_linhas(caminho):
+    # (cabeçalho, linhas de dados, hash de cada linha) do CSV bruto, sem parse
+    with open(caminho, 'rb') as arquivo:
+        linhas = arquivo.read().split(b'\n')
+    dados = np.array([linha for linha in linhas[1:] if linha.strip()], dtype=object)
+    return linhas[0], dados, pd.util.hash_array(dados)
+
+
+def _linhas_novas(dados, anterior):
+    """
+    Restringe uma fonte às linhas que não existiam (byte a byte) na versão anterior.
+
+    Args:
+        dados (pd.DataFrame ou str): Versão nova da fonte (DataFrame ou caminho do CSV).
+        anterior (tuple): Assinatura da versão anterior (ou None).
+
+    Returns:
+        tuple: (dados a preparar, assinatura da versão nova). Sem assinatura anterior compatível
+        (ex.: cabeçalho diferente), os dados voltam inteiros.
+    """
+    if isinstance(dados, pd.DataFrame):
+        cabecalho, linhas = tuple(dados.columns), None
+        hashes = pd.util.hash_pandas_object(dados, index=False).to_numpy()
+    else:
+        cabecalho, linhas, hashes = _ler_linhas(dados)
+        if any(linha.count(b'"') % 2 for linha in linhas if b'"' in linha):
+            # Campo entre aspas com quebra de linha: uma linha do arquivo não é um registro
+            return dados, None
+    ordem = np.argsort(hashes)
+    assinatura = (cabecalho, hashes[ordem])
+    if anterior is None or anterior[0] != cabecalho or not len(anterior[1]):
+        return dados, assinatura
+    # Pertinência por searchsorted entre as duas listas de hashes ordenadas
+    posicoes = np.minimum(np.searchsorted(anterior[1], assinatura[1]), len(anterior[1]) - 1)
+    novas = np.empty(len(hashes), dtype=bool)
+    novas[ordem] = anterior[1][posicoes] != assinatura[1]
+    if linhas is None:
+        return dados[novas], assinatura
+    # Só as linhas novas passam pelo parse e pelo esquema de tipos (como em import_data_otimizado)
+    texto = b'\n'.join([cabecalho, *linhas[novas]])
+    return aplicar_esquema(pd.read_csv(io.BytesIO(texto)), obter_esquema(dados)), assinatura
+
+
+def _mesclar_medidas(antigas, novas):
+    # Upsert das medidas de uma fonte: chaves existentes são escritas no lugar (NaN novo mantém o
+    # valor anterior, como combine_first) e as chaves novas vão para o final
+    posicoes = antigas.index.get_indexer(novas.index)
+    existentes = posicoes >= 0
+    if existentes.any():
+        for coluna in novas.columns:
+            if coluna not in antigas.columns:
+                antigas[coluna] = np.nan
+            valores = novas[coluna].to_numpy()[existentes]
+            presentes = ~pd.isna(valores)
+            if presentes.any():
+                tipo = antigas[coluna].dtype
+                if isinstance(tipo, np.dtype) and tipo.kind in 'iubf' and valores.dtype.kind in 'iubf':
+                    # Ex.: coluna int recebendo float, ou float32 recebendo float64
+                    tipo = np.result_type(tipo, valores.dtype)
+                    if tipo != antigas[coluna].dtype:
+                        antigas[coluna] = antigas[coluna].astype(tipo)
+                antigas.iloc[posicoes[existentes][presentes], antigas.columns.get_loc(coluna)] = valores[presentes]
+    if (~existentes).any():
+        antigas = pd.concat([antigas, novas[~existentes]])
+    return antigas
+
+
+class PainelIncremental:
+    """
+    Painel (country, year) montado uma vez a partir das fontes e atualizado célula a célula.
+
+    Guarda as medidas de cada fonte já harmonizadas pela chave (ID do país, ano) e um hash de cada
+    linha da última versão lida. Quando uma fonte é publicada de novo (OWID e WDI acrescentam anos
+    periodicamente), atualizar_fonte só faz o parse, a limpeza e a harmonização das linhas cujo hash
+    é novo, descobre quais células (país, ano, variável) foram incluídas ou alteradas e aplica só
+    essas ao painel: células de linhas existentes são escritas no lugar e linhas novas são
+    intercaladas com np.insert, sem reordenar o painel nem recalcular a ordem das demais linhas
+    (cada coluna ainda é copiada uma vez ao inserir). As estruturas derivadas inscritas
+    (ex.: CuboAgregado.atualizar) recebem apenas as linhas afetadas.
+
+    O resultado é o mesmo de montar_painel com os arquivos novos, exceto que é um upsert:
+    linhas ou valores que sumiram do arquivo novo continuam no painel. Se uma linha alterada repete
+    a chave (país, ano) de outra linha da fonte, vale a alterada.
+
+    Args:
+        fontes (list): Fontes no formato de montar_painel (veja fontes_projeto); cada uma é
+            identificada por fonte['nome'] ou, sem nome, pela posição na lista.
+        resolvedor (ResolvedorPaises): Índice de harmonização. Padrão é resolvedor_padrao().
+        como (str): 'outer' ou 'inner', como em montar_painel. Padrão é 'outer'.
+        anos (tuple): (ano_inicial, ano_final) para filtrar as fontes, opcional.
+        cache (bool): Repassado para import_data quando 'dados' é um caminho.
+    """
+
+    def __init__(self, fontes, resolvedor=None, como='outer', anos=None, cache=False):
+        if como not in ('outer', 'inner'):
+            raise ValueError("Parâmetro 'como' inválido. Use 'outer' ou 'inner'.")
+        self.resolvedor = resolvedor_padrao() if resolvedor is None else resolvedor
+        self.como = como
+        self.anos = anos
+        self.cache = cache
+        self.fontes = {}
+        self._medidas = {}      # nome da fonte -> medidas indexadas pela chave (ID, ano)
+        self._atributos = {}    # nome da fonte -> {atributo: Série por ID}
+        self._assinaturas = {}  # nome da fonte -> (cabeçalho, hashes ordenados das linhas) da última versão lida
+        for posicao, fonte in enumerate(fontes):
+            nome = fonte.get('nome', posicao)
+            medidas, atributos = _preparar_fonte(fonte, self.resolvedor, anos, cache)
+            self.fontes[nome] = dict(fonte)
+            self._medidas[nome] = medidas.sort_index()
+            self._atributos[nome] = atributos
+            self._assinaturas[nome] = _linhas_novas(fonte['dados'], None)[1]
+        self._inscritos = []
+        self.painel = _juntar_fontes(
+            [(self._medidas[nome], self._atributos[nome]) for nome in self.fontes], self.resolvedor, como,
+        )
+        self._atualizar_ordem()
+
+    # --- Localização das linhas ---
+    def _atualizar_ordem(self):
+        # Chave de ordenação de cada linha do painel: (código do país na categórica, ano), crescente
+        paises = self.painel.index.get_level_values(0)
+        self._categorias = paises.categories
+        self._ordem = chave_pais_ano(paises.codes, self.painel.index.get_level_values(1))
+
+    def _posicoes(self, chaves):
+        # Posição no painel de cada chave (ID, ano); -1 para as que não são linhas do painel
+        ids, anos = decodificar_chave(chaves)
+        codigos = self._categorias.get_indexer(np.asarray(self.resolvedor.nomes, dtype=object)[ids])
+        ordem = chave_pais_ano(codigos, anos)
+        posicoes = np.searchsorted(self._ordem, ordem)
+        encontradas = (codigos >= 0) & (posicoes < len(self._ordem))
+        encontradas[encontradas] = self._ordem[posicoes[encontradas]] == ordem[encontradas]
+        return np.where(encontradas, posicoes, -1)
+
+    def _valores(self, coluna, chaves):
+        # Valor da coluna nas chaves: a primeira fonte que a tem, as seguintes preenchem lacunas
+        valores = None
+        for medidas in self._medidas.values():
+            if coluna not in medidas.columns:
+                continue
+            serie = medidas[coluna].reindex(chaves)
+            valores = serie if valores is None else valores.fillna(serie)
+        return valores.to_numpy()
+
+    def colunas_medidas(self):
+        # Colunas de medidas do painel, na ordem do painel
+        atributos = _combinar_atributos(self._atributos.values())
+        return [c for c in self.painel.columns if c not in atributos]
+
+    def inscrever(self, funcao):
+        """
+        Registra uma estrutura derivada a ser atualizada após cada atualizar_fonte.
+
+        funcao(antigas, novas, painel) recebe as linhas afetadas antes e depois da atualização
+        (DataFrames planos, com country e year como colunas; 'antigas' não inclui as linhas novas)
+        e o painel atualizado. Ex.: painel.inscrever(cubo.atualizar).
+        """
+        self._inscritos.append(funcao)
+        return funcao
+
+    # --- Upsert ---
+    @instrumentar
+    def atualizar_fonte(self, nome, dados=None):
+        """
+        Incorpora a versão nova de uma fonte ao painel.
+
+        Args:
+            nome: Nome da fonte (fonte['nome'] ou posição em 'fontes').
+            dados (pd.DataFrame ou str): Dados novos ou caminho do CSV novo. Padrão: relê fonte['dados'].
+
+        Returns:
+            pd.DataFrame: Células do painel incluídas ou alteradas, com as colunas
+            country, year, variavel, anterior (NaN para células novas) e novo.
+        """
+        fonte = dict(self.fontes[nome])
+        if dados is not None:
+            fonte['dados'] = dados
+        # Só as linhas que não existiam na versão anterior são lidas, limpas e harmonizadas
+        fonte['dados'], self._assinaturas[nome] = _linhas_novas(fonte['dados'], self._assinaturas.get(nome))
+        novas_medidas, novos_atributos = _preparar_fonte(fonte, self.resolvedor, self.anos, self.cache)
+        antigas_medidas = self._medidas[nome]
+
+        # --- 1. Células da fonte incluídas ou alteradas (comparação vetorizada por coluna) ---
+        alinhadas = antigas_medidas.reindex(novas_medidas.index)
+        # Chaves novas contam mesmo sem valores (no join 'outer' elas também viram linhas)
+        alterada = antigas_medidas.index.get_indexer(novas_medidas.index) < 0
+        for coluna in novas_medidas.columns:
+            antigos = alinhadas[coluna] if coluna in alinhadas.columns else np.full(len(alinhadas), np.nan)
+            alterada |= _alterados(novas_medidas[coluna], antigos)
+        chaves = novas_medidas.index[alterada].to_numpy()
+        self._medidas[nome] = _mesclar_medidas(antigas_medidas, novas_medidas[alterada])
+
+        atributos_antes = _combinar_atributos(self._atributos.values())
+        self._atributos[nome] = {
+            atributo: serie.combine_first(self._atributos[nome].get(atributo, serie.iloc[:0]))
+            for atributo, serie in novos_atributos.items()
+        }
+        atributos = _combinar_atributos(self._atributos.values())
+
+        # Países cujo atributo (ex.: continente) mudou: todas as linhas deles são afetadas
+        ids_atributo = set()
+        for atributo, serie in atributos.items():
+            anterior = atributos_antes.get(atributo, serie.iloc[:0]).reindex(serie.index)
+            ids_atributo.update(serie.index[_alterados(serie, anterior)].tolist())
+        posicoes_atributo = self._linhas_paises(self.resolvedor.nomes_de(sorted(ids_atributo)))
+
+        # --- 2. Separação entre linhas existentes e linhas novas do painel ---
+        posicoes = self._posicoes(chaves)
+        existentes = np.union1d(posicoes[posicoes >= 0], posicoes_atributo).astype(np.intp)
+        chaves_existentes = chaves[posicoes >= 0]
+        chaves_novas = chaves[posicoes < 0]
+        if self.como == 'inner' and len(chaves_novas):
+            em_todas = np.ones(len(chaves_novas), dtype=bool)
+            for medidas in self._medidas.values():
+                em_todas &= medidas.index.get_indexer(chaves_novas) >= 0
+            chaves_novas = chaves_novas[em_todas]
+
+        antigas = self.painel.iloc[existentes]
+
+        # --- 3. Células de linhas existentes: escritas no lugar, só nas colunas da fonte ---
+        if len(chaves_existentes):
+            alvo = self._posicoes(chaves_existentes)
+            for coluna in novas_medidas.columns:
+                valores = self._valores(coluna, chaves_existentes)
+                self._escrever(coluna, alvo, valores)
+        for atributo, serie in atributos.items():
+            if len(posicoes_atributo) and atributo in self.painel.columns:
+                ids = self.resolvedor.resolver(pd.Series(self.painel.index.get_level_values(0)[posicoes_atributo]))
+                self._escrever(atributo, posicoes_atributo, serie.reindex(ids).to_numpy())
+
+        # --- 4. Linhas novas: intercaladas na ordem (country, year) ---
+        if len(chaves_novas):
+            insercao = self._inserir(chaves_novas, atributos)
+            # Cada linha existente desloca-se pelo número de linhas inseridas antes dela
+            existentes = existentes + np.searchsorted(insercao, existentes, side='right')
+            inseridas = insercao + np.arange(len(insercao))
+        else:
+            inseridas = np.array([], dtype=np.intp)
+
+        novas = self.painel.iloc[np.concatenate([existentes, inseridas]).astype(np.intp)]
+        alteracoes = self._celulas(antigas, novas)
+
+        # --- 5. Estruturas derivadas ---
+        if self._inscritos and (len(antigas) or len(novas)):
+            antigas_planas, novas_planas = antigas.reset_index(), novas.reset_index()
+            for funcao in self._inscritos:
+                funcao(antigas_planas, novas_planas, self.painel)
+        return alteracoes
+
+    def _escrever(self, coluna, posicoes, valores):
+        # Escreve valores em posições de uma coluna, convertendo a coluna se o tipo não comporta
+        serie = self.painel[coluna]
+        if isinstance(serie.dtype, pd.CategoricalDtype):
+            novas_categorias = pd.Index(pd.unique(valores[~pd.isna(valores)])).difference(serie.cat.categories)
+            if len(novas_categorias):
+                categorias = serie.cat.categories.append(novas_categorias).sort_values()
+                self.painel[coluna] = serie.cat.set_categories(categorias)
+        elif serie.dtype.kind in 'iub' and (pd.isna(valores).any() or np.asarray(valores).dtype.kind == 'f'):
+            self.painel[coluna] = serie.astype('float64')
+        self.painel.iloc[posicoes, self.painel.columns.get_loc(coluna)] = valores
+
+    def _inserir(self, chaves_novas, atributos):
+        # Intercala as linhas novas com np.insert em cada coluna e na chave de ordenação, sem
+        # permutar o painel nem recalcular a ordem das linhas existentes. Retorna as posições de
+        # inserção (no painel anterior), em ordem crescente.
+        ids, anos = decodificar_chave(chaves_novas)
+        nomes = np.asarray(self.resolvedor.nomes, dtype=object)[ids]
+        paises = self.painel.index.get_level_values(0)
+        codigos_paises = paises.codes
+        categorias = self._categorias
+        novos_paises = pd.Index(pd.unique(nomes)).difference(categorias)
+        if len(novos_paises):
+            # Países novos mudam os códigos da categórica: só então a chave das linhas existentes é refeita
+            categorias = categorias.union(novos_paises)
+            codigos_paises = categorias.get_indexer(self._categorias).take(codigos_paises)
+            self._ordem = chave_pais_ano(codigos_paises, self.painel.index.get_level_values(1))
+        codigos_novos = categorias.get_indexer(nomes)
+        ordem_novas = chave_pais_ano(codigos_novos, anos)
+        ordenadas = np.argsort(ordem_novas, kind='stable')
+        chaves_novas, ordem_novas = chaves_novas[ordenadas], ordem_novas[ordenadas]
+        codigos_novos, anos = codigos_novos[ordenadas], anos[ordenadas]
+        insercao = np.searchsorted(self._ordem, ordem_novas)
+
+        ids_novos = ids[ordenadas]
+        colunas = {}
+        for coluna in self.painel.columns:
+            atual = self.painel[coluna]
+            if coluna in atributos:
+                valores = atributos[coluna].reindex(ids_novos).to_numpy()
+            else:
+                valores = self._valores(coluna, chaves_novas)
+            if isinstance(atual.dtype, pd.CategoricalDtype):
+                colunas[coluna] = _inserir_categorica(atual.array, insercao, valores)
+            else:
+                valores_atuais = atual.to_numpy()
+                if valores_atuais.dtype.kind in 'iub' and (pd.isna(valores).any() or np.asarray(valores).dtype.kind == 'f'):
+                    valores_atuais = valores_atuais.astype('float64')
+                colunas[coluna] = np.insert(valores_atuais, insercao, valores)
+
+        indice = pd.MultiIndex.from_arrays(
+            [
+                pd.Categorical.from_codes(np.insert(codigos_paises, insercao, codigos_novos), categories=categorias),
+                np.insert(self.painel.index.get_level_values(1).to_numpy(), insercao, anos).astype('int16'),
+            ],
+            names=self.painel.index.names,
+        )
+        self.painel = pd.DataFrame(colunas, index=indice, copy=False)
+        self._categorias = categorias
+        self._ordem = np.insert(self._ordem, insercao, ordem_novas)
+        return insercao
+
+    def _linhas_paises(self, nomes):
+        # Posições de todas as linhas dos países (intervalos contíguos na ordem do painel)
+        codigos = self._categorias.get_indexer(pd.Index(nomes, dtype=object))
+        codigos = codigos[codigos >= 0]
+        if not len(codigos):
+            return np.array([], dtype=np.intp)
+        inicios = np.searchsorted(self._ordem, chave_pais_ano(codigos, -_DESLOCAMENTO_ANO))
+        fins = np.searchsorted(self._ordem, chave_pais_ano(codigos + 1, -_DESLOCAMENTO_ANO))
+        return np.concatenate([np.arange(inicio, fim) for inicio, fim in zip(inicios, fins)]).astype(np.intp)
+
+    def _celulas(self, antigas, novas):
+        # Formato longo das células de medidas incluídas ou alteradas
+        anteriores = antigas.reindex(novas.index)
+        partes = []
+        for coluna in self.colunas_medidas():
+            mascara = _alterados(novas[coluna], anteriores[coluna])
+            if mascara.any():
+                partes.append(pd.DataFrame({
+                    'country': novas.index.get_level_values(0)[mascara].astype(str),
+                    'year': novas.index.get_level_values(1)[mascara],
+                    'variavel': coluna,
+                    'anterior': anteriores[coluna].to_numpy()[mascara],
+                    'novo': novas[coluna].to_numpy()[mascara],
+                }))
+        if not partes:
+            return pd.DataFrame(columns=['country', 'year', 'variavel', 'anterior', 'novo'])
+        return pd.concat(partes, ignore_index=True)
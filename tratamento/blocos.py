@@ -0,0 +1,242 @@
+"""Importação em blocos com etapas de limpeza aplicadas a cada bloco."""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from .esquemas import obter_esquema
+from .instrumentacao import instrumentar
+from .paises import renomeando_gp, resolvedor_padrao
+
+
+# --- Importação em blocos com pipeline de limpeza por bloco ---
+# Cada etapa recebe um bloco (pd.DataFrame) e devolve o bloco tratado.
+def etapa_renomear_gp(nomes: dict):
+    # Etapa equivalente a renomeando_gp (renomeia colunas do gapminder e corrige nomes de países)
+    def etapa(bloco):
+        return renomeando_gp(bloco, nomes)
+    return etapa
+
+
+def etapa_renomear(colunas: dict):
+    # Renomeia colunas do bloco
+    def etapa(bloco):
+        return bloco.rename(columns=colunas)
+    return etapa
+
+
+def etapa_harmonizar_paises(coluna_pais='country', resolvedor=None, coluna_codigo=None, coluna_id=None):
+    # Troca o nome do país pelo nome canônico do ResolvedorPaises (e, opcionalmente, grava o ID)
+    def etapa(bloco):
+        nonlocal resolvedor
+        if resolvedor is None:
+            resolvedor = resolvedor_padrao()
+        ids = resolvedor.resolver(bloco[coluna_pais], bloco[coluna_codigo] if coluna_codigo else None)
+        nomes = np.append(np.asarray(resolvedor.nomes, dtype=object), np.nan)
+        novas = {coluna_pais: nomes[ids]}  # ID -1 (ausente) cai no NaN do final
+        if coluna_id:
+            novas[coluna_id] = ids
+        return bloco.assign(**novas)
+    return etapa
+
+
+def etapa_selecionar_colunas(colunas: list):
+    # Mantém apenas as colunas pedidas (as ausentes no bloco são ignoradas)
+    def etapa(bloco):
+        return bloco[[c for c in colunas if c in bloco.columns]]
+    return etapa
+
+
+def etapa_filtrar_anos(inicio=None, fim=None, coluna_ano='year'):
+    # Mantém apenas os registros com ano entre inicio e fim (inclusive)
+    def etapa(bloco):
+        anos = pd.to_numeric(bloco[coluna_ano], errors='coerce')
+        filtro = anos.notna()
+        if inicio is not None:
+            filtro &= anos >= inicio
+        if fim is not None:
+            filtro &= anos <= fim
+        return bloco[filtro]
+    return etapa
+
+
+def etapa_descartar_chaves_invalidas(coluna_pais='country', coluna_ano='year'):
+    # Remove registros sem país ou com ano não numérico (ex.: linhas de rodapé dos exports)
+    def etapa(bloco):
+        anos = pd.to_numeric(bloco[coluna_ano], errors='coerce')
+        bloco = bloco[bloco[coluna_pais].notna() & anos.notna()].copy()
+        bloco[coluna_ano] = anos[bloco.index].astype('int64')
+        return bloco
+    return etapa
+
+
+class _DestinoColunar:
+    # Grava os blocos de forma incremental em Parquet ou Feather (Arrow IPC), conforme a extensão.
+    # O esquema sai do primeiro bloco e os blocos seguintes são convertidos para ele. Uma coluna só
+    # com nulos no primeiro bloco (ex.: anotações do OWID) usa o tipo declarado em ESQUEMAS; sem
+    # declaração, fica com o tipo nulo até aparecer um valor, e então o arquivo já gravado é
+    # reescrito com o tipo novo.
+    def __init__(self, caminho, tipos=None):
+        import pyarrow as pa
+        self.pa = pa
+        self.caminho = caminho
+        self.tipos = tipos or {}
+        self.esquema = None
+        self.escritor = None
+
+    def _tipo_declarado(self, nome):
+        # Tipo Arrow equivalente ao tipo declarado no esquema do arquivo (None se não houver)
+        tipo = self.tipos.get(nome)
+        if tipo is None:
+            return None
+        if tipo == 'category':
+            return self.pa.large_string()
+        return self.pa.from_numpy_dtype(np.dtype(tipo))
+
+    def _abrir(self):
+        if self.caminho.endswith('.parquet'):
+            import pyarrow.parquet as pq
+            self.escritor = pq.ParquetWriter(self.caminho, self.esquema)
+        else:
+            self.escritor = self.pa.ipc.new_file(self.caminho, self.esquema)
+
+    def _lotes(self, caminho):
+        # Lê de volta, lote a lote, um arquivo gravado por este destino (no formato do destino)
+        if self.caminho.endswith('.parquet'):
+            import pyarrow.parquet as pq
+            yield from pq.ParquetFile(caminho).iter_batches()
+        else:
+            with self.pa.memory_map(caminho) as fonte:
+                leitor = self.pa.ipc.open_file(fonte)
+                for i in range(leitor.num_record_batches):
+                    yield leitor.get_batch(i)
+
+    def _ampliar(self, tabela):
+        # Troca o tipo nulo das colunas que passaram a ter valores e reescreve o que já foi gravado
+        pa = self.pa
+        novos = {
+            campo.name: tabela.schema.field(campo.name).type
+            for campo in self.esquema
+            if pa.types.is_null(campo.type) and tabela.column(campo.name).null_count < len(tabela)
+        }
+        if not novos:
+            return
+        self.esquema = pa.schema([pa.field(c.name, novos.get(c.name, c.type)) for c in self.esquema])
+        self.escritor.close()
+        anterior = self.caminho + '.anterior'
+        os.replace(self.caminho, anterior)
+        try:
+            self._abrir()
+            for lote in self._lotes(anterior):
+                self.escritor.write_table(pa.Table.from_batches([lote]).cast(self.esquema))
+        finally:
+            os.remove(anterior)
+
+    def gravar(self, bloco):
+        pa = self.pa
+        tabela = pa.Table.from_pandas(bloco, preserve_index=False).replace_schema_metadata(None)
+        if self.escritor is None:
+            campos = []
+            for campo in tabela.schema:
+                if tabela.column(campo.name).null_count == len(tabela):
+                    campo = pa.field(campo.name, self._tipo_declarado(campo.name) or pa.null())
+                campos.append(campo)
+            self.esquema = pa.schema(campos)
+            self._abrir()
+        else:
+            self._ampliar(tabela)
+        # Colunas ainda sem tipo: o bloco também só tem nulos nelas
+        for campo in self.esquema:
+            if pa.types.is_null(campo.type) and not pa.types.is_null(tabela.schema.field(campo.name).type):
+                i = tabela.schema.get_field_index(campo.name)
+                tabela = tabela.set_column(i, campo, pa.nulls(len(tabela)))
+        if not tabela.schema.equals(self.esquema):
+            tabela = tabela.cast(self.esquema)
+        self.escritor.write_table(tabela)
+
+    def fechar(self):
+        if self.escritor is not None:
+            self.escritor.close()
+
+
+def _unificar_tipos(partes):
+    # Uma coluna só com nulos em um bloco é lida como float64; usa nela o tipo dos blocos com valores
+    # para que o concat não a transforme em object
+    for coluna in partes[0].columns:
+        tipos = [parte[coluna].dtype for parte in partes if coluna in parte and parte[coluna].notna().any()]
+        if not tipos:
+            continue
+        for i, parte in enumerate(partes):
+            if coluna in parte and parte[coluna].dtype != tipos[0] and parte[coluna].isna().all():
+                partes[i] = parte.assign(**{coluna: parte[coluna].astype(tipos[0])})
+    return partes
+
+
+@instrumentar
+def import_data_em_blocos(path, etapas=(), separador = ',', encoding = 'utf-8', tamanho_bloco = 100_000,
+                          colunas = None, destino = None):
+    """
+    Importa um CSV em blocos, aplicando as etapas de limpeza a cada bloco antes de juntá-los.
+
+    Só as linhas que sobrevivem às etapas são guardadas (ou gravadas no destino), então o pico de
+    memória depende do tamanho do bloco e não do tamanho do arquivo.
+
+    Args:
+        path (str): Caminho do arquivo.
+        etapas (list): Funções bloco -> bloco aplicadas em ordem (veja etapa_renomear_gp,
+            etapa_harmonizar_paises, etapa_selecionar_colunas, etapa_filtrar_anos e
+            etapa_descartar_chaves_invalidas).
+        separador (str): Separador do arquivo. Padrão é ','.
+        encoding (str): Codificação do arquivo. Padrão é 'utf-8'.
+        tamanho_bloco (int): Número de linhas por bloco. Padrão é 100000.
+        colunas (list): Colunas lidas do CSV (as demais nem são convertidas). Padrão: todas.
+        destino (str): Caminho .parquet ou .feather para gravar os blocos diretamente em vez
+            de montar o dataframe em memória. Requer pyarrow.
+
+    Returns:
+        pd.DataFrame ou str: O DataFrame com as linhas tratadas, ou o caminho do destino.
+    """
+    try:
+        leitor = pd.read_csv(path, sep=separador, encoding=encoding, usecols=colunas, chunksize=tamanho_bloco)
+    except UnicodeDecodeError as ue:
+        print(f"Erro de codificação: {ue}. Tente outro encoding.")
+        return
+    except FileNotFoundError as fnf:
+        print(f"Arquivo não encontrado: {fnf}. Verifique o caminho.")
+        return
+
+    esquema = obter_esquema(path) or {}
+    saida = _DestinoColunar(destino, esquema.get('tipos')) if destino else None
+    partes = []
+    lidas = mantidas = 0
+    try:
+        with leitor:
+            for bloco in leitor:
+                lidas += len(bloco)
+                for etapa in etapas:
+                    bloco = etapa(bloco)
+                if bloco.empty:
+                    continue
+                mantidas += len(bloco)
+                if saida is not None:
+                    saida.gravar(bloco)
+                else:
+                    partes.append(bloco)
+    except Exception as e:
+        print(f"Erro ao importar o arquivo: {e}")
+        if saida is not None and saida.escritor is not None:
+            # Não deixa um arquivo de destino parcial
+            saida.fechar()
+            if os.path.exists(destino):
+                os.remove(destino)
+        return
+    if saida is not None:
+        saida.fechar()
+
+    print(f"Arquivo importado com sucesso! ({mantidas} de {lidas} registros mantidos)")
+    if saida is not None:
+        return destino
+    if not partes:
+        return pd.DataFrame()
+    return pd.concat(_unificar_tipos(partes), ignore_index=True)
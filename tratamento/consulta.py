@@ -0,0 +1,161 @@
+"""Consultas rápidas por país, continente e ano sobre um painel carregado uma única vez."""
+
+import numpy as np
+import pandas as pd
+
+from .instrumentacao import instrumentar
+
+
+def _como_lista(valor):
+    if valor is None:
+        return None
+    if isinstance(valor, (list, tuple, set, np.ndarray, pd.Index, pd.Series)):
+        return list(valor)
+    return [valor]
+
+
+class _IndicePosicional:
+    # Para cada valor distinto de uma coluna, o intervalo [inicio, fim) em 'ordem' com as linhas que o contêm
+
+    def __init__(self, serie):
+        codigos, valores = pd.factorize(serie, sort=True)
+        ordem = np.argsort(codigos, kind='stable')
+        contagem = np.bincount(codigos[codigos >= 0], minlength=len(valores))
+        self.codigos = codigos
+        self.ordem = ordem[codigos[ordem] >= 0]
+        self.limites = np.concatenate([[0], np.cumsum(contagem)])
+        self.valores = valores
+        self.posicao = {valor: i for i, valor in enumerate(valores.tolist())}
+
+    def codigos_de(self, chaves):
+        return [self.posicao[chave] for chave in chaves if chave in self.posicao]
+
+    def linhas(self, codigos):
+        if not codigos:
+            return np.empty(0, dtype=self.ordem.dtype)
+        return np.concatenate([self.ordem[self.limites[c]:self.limites[c + 1]] for c in codigos])
+
+    def mascara(self, codigos):
+        # Tabela de consulta por código: permite testar pertencimento de N linhas em O(N)
+        aceita = np.zeros(len(self.valores) + 1, dtype=bool)
+        aceita[codigos] = True
+        return aceita
+
+
+class ConsultaPainel:
+    """
+    Índices posicionais por país, continente e ano, construídos uma vez sobre o painel.
+
+    Cada consulta retorna as linhas pedidas em tempo proporcional ao tamanho da resposta,
+    sem varrer o DataFrame inteiro (como faz df[df['country'] == pais]). As linhas são
+    devolvidas ordenadas por (país, ano).
+
+    Args:
+        df (pd.DataFrame): Painel com colunas de país, continente e ano, ou indexado por (country, year).
+        coluna_pais (str): Nome da coluna de país. Padrão é 'country'.
+        coluna_continente (str): Nome da coluna de continente. Padrão é 'continent'.
+        coluna_ano (str): Nome da coluna de ano. Padrão é 'year'.
+    """
+
+    def __init__(self, df, coluna_pais='country', coluna_continente='continent', coluna_ano='year'):
+        if coluna_pais in (df.index.names or []):
+            df = df.reset_index()
+        self.coluna_pais = coluna_pais
+        self.coluna_continente = coluna_continente
+        self.coluna_ano = coluna_ano
+        self.dados = df.sort_values([coluna_pais, coluna_ano], kind='stable').reset_index(drop=True)
+        self._indices = {
+            'pais': _IndicePosicional(self.dados[coluna_pais]),
+            'ano': _IndicePosicional(self.dados[coluna_ano]),
+        }
+        if coluna_continente in self.dados.columns:
+            self._indices['continente'] = _IndicePosicional(self.dados[coluna_continente])
+
+    def listar(self, dimensao: str):
+        """Valores distintos de uma dimensão ('pais', 'continente' ou 'ano'), em ordem."""
+        if dimensao not in ('pais', 'continente', 'ano'):
+            print(f"Dimensão inválida: {dimensao}")
+            return []
+        if dimensao not in self._indices:
+            return []
+        return self._indices[dimensao].valores.tolist()
+
+    def linhas(self, paises=None, continentes=None, anos=None):
+        """
+        Posições (em self.dados) das linhas que atendem a todos os filtros informados.
+
+        Cada filtro aceita um valor ou uma lista; valores desconhecidos são ignorados.
+        Os candidatos saem do filtro mais seletivo e os demais são testados só sobre eles.
+        """
+        filtros = []
+        for dimensao, chaves in (('pais', paises), ('continente', continentes), ('ano', anos)):
+            chaves = _como_lista(chaves)
+            if chaves is None:
+                continue
+            if dimensao not in self._indices:
+                print(f"Coluna '{self.coluna_continente}' não encontrada no painel.")
+                return np.empty(0, dtype=np.intp)
+            indice = self._indices[dimensao]
+            if dimensao == 'ano':
+                chaves = [int(ano) for ano in chaves]
+            codigos = indice.codigos_de(chaves)
+            tamanho = int(sum(indice.limites[c + 1] - indice.limites[c] for c in codigos))
+            filtros.append((tamanho, indice, codigos))
+
+        if not filtros:
+            return np.arange(len(self.dados))
+        filtros.sort(key=lambda filtro: filtro[0])
+        _, indice, codigos = filtros[0]
+        candidatas = indice.linhas(codigos)
+        for _, indice, codigos in filtros[1:]:
+            candidatas = candidatas[indice.mascara(codigos)[indice.codigos[candidatas]]]
+        return np.sort(candidatas)
+
+    @instrumentar
+    def fatia(self, paises=None, continentes=None, anos=None, colunas=None):
+        """
+        Linhas do painel que atendem aos filtros, ordenadas por (país, ano).
+
+        Args:
+            paises, continentes, anos: Um valor ou uma lista de valores (None = sem filtro).
+            colunas (list): Colunas de valores a retornar, além de país, continente e ano.
+
+        Returns:
+            pd.DataFrame: A fatia pedida (cópia).
+
+        Raises:
+            KeyError: Se alguma das colunas pedidas não existe no painel.
+        """
+        posicoes = self.linhas(paises, continentes, anos)
+        selecao = slice(None)
+        if colunas is not None:
+            colunas = _como_lista(colunas)
+            desconhecidas = [c for c in colunas if c not in self.dados.columns]
+            if desconhecidas:
+                raise KeyError(f"Colunas não encontradas no painel: {', '.join(map(str, desconhecidas))}")
+            chaves = [c for c in (self.coluna_pais, self.coluna_continente, self.coluna_ano) if c in self.dados.columns]
+            selecao = self.dados.columns.get_indexer(chaves + [c for c in colunas if c not in chaves])
+        if len(posicoes) and posicoes[-1] - posicoes[0] + 1 == len(posicoes):
+            # Linhas contíguas (ex.: um país): fatia por intervalo, sem indexação elemento a elemento
+            return self.dados.iloc[posicoes[0]:posicoes[-1] + 1, selecao].copy()
+        return self.dados.iloc[posicoes, selecao]
+
+    def pais(self, nome, colunas=None):
+        """Série histórica de um país."""
+        return self.fatia(paises=nome, colunas=colunas)
+
+    def continente(self, nome, colunas=None):
+        """Todas as linhas de um continente."""
+        return self.fatia(continentes=nome, colunas=colunas)
+
+    def ano(self, ano, colunas=None):
+        """Todos os países em um ano."""
+        return self.fatia(anos=ano, colunas=colunas)
+
+    def continente_de(self, pais):
+        """Continente de um país (primeira ocorrência não nula), ou None."""
+        if 'continente' not in self._indices:
+            return None
+        continentes = self.dados[self.coluna_continente].to_numpy()[self.linhas(paises=pais)]
+        continentes = continentes[pd.notna(continentes)]
+        return continentes[0] if len(continentes) else None
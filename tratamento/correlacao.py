@@ -0,0 +1,234 @@
+"""Correlações, ajustes lineares/log-lineares e resíduos por ano e continente, em lote."""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from .instrumentacao import instrumentar, registrar_cache
+
+
+# Colunas do resultado de AnaliseRelacoes.ajustes (além das colunas de agrupamento)
+COLUNAS_AJUSTE = ['x', 'y', 'n', 'correlacao', 'inclinacao', 'intercepto', 'r2', 'erro_inclinacao', 'desvio_residuos']
+
+
+def _transformar(valores, log):
+    # log10 dos valores positivos (NaN para os demais) ou os próprios valores
+    if not log:
+        return valores
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(valores > 0, np.log10(valores), np.nan)
+
+
+def _momentos_em_lote(codigos, xs, ys, n_grupos):
+    """
+    Momentos de segunda ordem de vários pares de colunas em todos os grupos, de uma vez.
+
+    Args:
+        codigos (np.ndarray): Grupo de cada linha (0..n_grupos-1, ou -1 para ignorar a linha).
+        xs, ys (np.ndarray): Matrizes (linhas x pares); NaN marca a observação como ausente no par.
+        n_grupos (int): Número de grupos.
+
+    Returns:
+        dict: Matrizes (grupos x pares) n, media_x, media_y, sxx, syy e sxy (somas centradas).
+    """
+    manter = codigos >= 0  # -1: linha com chave de grupo nula
+    codigos, xs, ys = codigos[manter], xs[manter], ys[manter]
+    validas = ~(np.isnan(xs) | np.isnan(ys))
+    x0 = np.where(validas, xs, 0.0)
+    y0 = np.where(validas, ys, 0.0)
+    # Linhas ordenadas por grupo: cada soma por grupo é um np.add.reduceat sobre todas as colunas
+    ordem = np.argsort(codigos, kind='stable')
+    codigos = codigos[ordem]
+    validas, x0, y0 = validas[ordem], x0[ordem], y0[ordem]
+    inicios = np.flatnonzero(np.r_[True, codigos[1:] != codigos[:-1]])
+    presentes = codigos[inicios]
+
+    def somar(matriz):
+        total = np.zeros((n_grupos, matriz.shape[1]))
+        if len(inicios):
+            total[presentes] = np.add.reduceat(matriz, inicios, axis=0)
+        return total
+
+    n = somar(validas.astype('float64'))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        media_x = somar(x0) / n
+        media_y = somar(y0) / n
+    # Segunda passada sobre os desvios (mais estável que somas de quadrados brutas)
+    dx = np.where(validas, x0 - media_x[codigos], 0.0)
+    dy = np.where(validas, y0 - media_y[codigos], 0.0)
+    return {
+        'n': n,
+        'media_x': media_x,
+        'media_y': media_y,
+        'sxx': somar(dx * dx),
+        'syy': somar(dy * dy),
+        'sxy': somar(dx * dy),
+    }
+
+
+class AnaliseRelacoes:
+    """
+    Relações entre variáveis do painel (ex.: IDH ~ log PIB per capita) por ano, continente ou ambos.
+
+    Todos os grupos e todos os pares pedidos em uma chamada são calculados juntos: as linhas são
+    ordenadas por grupo uma vez e as somas por grupo saem de np.add.reduceat sobre matrizes
+    (linhas x pares), sem um ajuste separado por ano, continente e par. Cada resultado fica
+    memorizado por (par, transformações, agrupamento).
+
+    Args:
+        df (pd.DataFrame): Painel com colunas de ano e continente, ou indexado por (country, year).
+        coluna_pais (str): Nome da coluna de país. Padrão é 'country'.
+        coluna_ano (str): Nome da coluna de ano. Padrão é 'year'.
+        coluna_continente (str): Nome da coluna de continente. Padrão é 'continent'.
+    """
+
+    def __init__(self, df, coluna_pais='country', coluna_ano='year', coluna_continente='continent'):
+        if coluna_pais in (df.index.names or []):
+            df = df.reset_index()
+        self.coluna_pais = coluna_pais
+        self.coluna_ano = coluna_ano
+        self.coluna_continente = coluna_continente
+        self.dados = df.reset_index(drop=True)
+        self.indice = pd.MultiIndex.from_arrays(
+            [self.dados[coluna_pais], self.dados[coluna_ano]], names=[coluna_pais, coluna_ano]
+        )
+        self._grupos = {}
+        self._memo = {}
+
+    def _por(self, por):
+        # Agrupamento padrão: (ano, continente); () ou None = todas as linhas juntas
+        if por is None:
+            por = (self.coluna_ano, self.coluna_continente)
+        return (por,) if isinstance(por, str) else tuple(por)
+
+    def _agrupamento(self, por):
+        # (código do grupo de cada linha, DataFrame com as chaves de cada grupo), calculado uma vez por 'por'
+        if por not in self._grupos:
+            if not por:
+                codigos, chaves = np.zeros(len(self.dados), dtype=np.intp), pd.DataFrame(index=[0])
+            else:
+                grupos = self.dados.groupby(list(por), observed=True, sort=True)
+                codigos = grupos.ngroup().fillna(-1).to_numpy(dtype=np.intp)  # chaves nulas ficam fora
+                chaves = grupos.size().index.to_frame(index=False)
+            self._grupos[por] = (codigos, chaves)
+        return self._grupos[por]
+
+    def _valores(self, variavel, log):
+        return _transformar(self.dados[variavel].to_numpy(dtype='float64', na_value=np.nan), log)
+
+    @staticmethod
+    def _normalizar_par(par):
+        x, y, *transformacoes = par
+        log_x, log_y = (list(transformacoes) + [False, False])[:2]
+        return x, y, bool(log_x), bool(log_y)
+
+    @instrumentar
+    def ajustes(self, pares, por=None):
+        """
+        Correlação de Pearson e reta de mínimos quadrados y = intercepto + inclinacao * x
+        para cada par e cada grupo.
+
+        Args:
+            pares (list): Tuplas (x, y) ou (x, y, log_x, log_y); log aplica log10 (valores <= 0 são ignorados).
+                Ex.: [('PIB per capita', 'IDH historico', True, False)].
+            por (tuple): Colunas de agrupamento. Padrão: (ano, continente); use (ano,) só por ano
+                ou () para um único ajuste com todas as linhas.
+
+        Returns:
+            pd.DataFrame: Colunas de agrupamento, x, y, n, correlacao, inclinacao, intercepto, r2,
+            erro_inclinacao e desvio_residuos (as colunas x e y trazem 'log10(...)' quando transformadas).
+        """
+        por = self._por(por)
+        pares = [self._normalizar_par(par) for par in pares]
+        faltando = [par for par in dict.fromkeys(pares) if ('ajuste', par, por) not in self._memo]
+        for par in pares:
+            registrar_cache(par not in faltando)
+        if faltando:
+            self._calcular_ajustes(faltando, por)
+        resultados = [self._memo[('ajuste', par, por)] for par in pares]
+        return pd.concat(resultados, ignore_index=True) if resultados else pd.DataFrame(columns=COLUNAS_AJUSTE)
+
+    def _calcular_ajustes(self, pares, por):
+        codigos, chaves = self._agrupamento(por)
+        xs = np.column_stack([self._valores(x, log_x) for x, _, log_x, _ in pares])
+        ys = np.column_stack([self._valores(y, log_y) for _, y, _, log_y in pares])
+        m = _momentos_em_lote(codigos, xs, ys, len(chaves))
+
+        n, sxx, syy, sxy = m['n'], m['sxx'], m['syy'], m['sxy']
+        with np.errstate(invalid='ignore', divide='ignore'):
+            inclinacao = np.where(sxx > 0, sxy / sxx, np.nan)
+            correlacao = np.where((sxx > 0) & (syy > 0), sxy / np.sqrt(sxx * syy), np.nan)
+            intercepto = m['media_y'] - inclinacao * m['media_x']
+            soma_residuos = np.clip(syy - inclinacao * sxy, 0, None)
+            desvio = np.where(n > 2, np.sqrt(soma_residuos / (n - 2)), np.nan)
+            erro = desvio / np.sqrt(sxx)
+
+        for coluna, (x, y, log_x, log_y) in enumerate(pares):
+            resultado = chaves.copy()
+            resultado['x'] = f'log10({x})' if log_x else x
+            resultado['y'] = f'log10({y})' if log_y else y
+            resultado['n'] = n[:, coluna].astype('int64')
+            resultado['correlacao'] = correlacao[:, coluna]
+            resultado['inclinacao'] = inclinacao[:, coluna]
+            resultado['intercepto'] = intercepto[:, coluna]
+            resultado['r2'] = correlacao[:, coluna] ** 2
+            resultado['erro_inclinacao'] = erro[:, coluna]
+            resultado['desvio_residuos'] = desvio[:, coluna]
+            self._memo[('ajuste', (x, y, log_x, log_y), por)] = resultado
+
+    def ajuste(self, x: str, y: str, log_x: bool = False, log_y: bool = False, por=None):
+        """Ajuste de um único par (veja ajustes)."""
+        return self.ajustes([(x, y, log_x, log_y)], por=por)
+
+    @instrumentar
+    def correlacoes(self, variaveis: list, por=None, log: list = ()):
+        """
+        Correlação de todos os pares de variáveis em todos os grupos, em uma única passada.
+
+        Args:
+            variaveis (list): Variáveis a cruzar (todos os pares i < j).
+            por (tuple): Colunas de agrupamento (veja ajustes).
+            log (list): Variáveis usadas em log10 (ex.: ['PIB per capita']).
+
+        Returns:
+            pd.DataFrame: Colunas de agrupamento, x, y, n e correlacao.
+        """
+        log = set(log)
+        pares = [(x, y, x in log, y in log) for x, y in itertools.combinations(variaveis, 2)]
+        ajustes = self.ajustes(pares, por)
+        colunas = [c for c in ajustes.columns if c not in COLUNAS_AJUSTE]
+        return ajustes[colunas + ['x', 'y', 'n', 'correlacao']]
+
+    @instrumentar
+    def residuos(self, x: str, y: str, log_x: bool = False, log_y: bool = False, por=None):
+        """
+        Resíduo de cada observação em relação ao ajuste do seu grupo: y - (intercepto + inclinacao * x),
+        na escala transformada (ex.: IDH acima ou abaixo do esperado para o seu PIB no ano e continente).
+
+        Returns:
+            pd.Series: Resíduos indexados por (país, ano); NaN onde x, y ou a chave do grupo é nulo.
+        """
+        por = self._por(por)
+        par = self._normalizar_par((x, y, log_x, log_y))
+        chave = ('residuo', par, por)
+        registrar_cache(chave in self._memo)
+        if chave not in self._memo:
+            ajuste = self.ajustes([par], por)
+            codigos, _ = self._agrupamento(por)
+            valores_x = self._valores(x, par[2])
+            valores_y = self._valores(y, par[3])
+            # Linhas com chave de grupo nula (código -1) não têm ajuste: previsto fica NaN
+            validos = codigos >= 0
+            previsto = np.full(len(codigos), np.nan)
+            grupo = codigos[validos]
+            previsto[validos] = (
+                ajuste['intercepto'].to_numpy()[grupo] + ajuste['inclinacao'].to_numpy()[grupo] * valores_x[validos]
+            )
+            self._memo[chave] = pd.Series(valores_y - previsto, index=self.indice, name=f'residuo_{y}')
+        return self._memo[chave]
+
+    def limpar_memoria(self):
+        # Descarta os resultados memorizados (ex.: depois de alterar self.dados)
+        self._memo.clear()
+        self._grupos.clear()
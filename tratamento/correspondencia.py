@@ -0,0 +1,272 @@
+"""Correspondência aproximada de nomes de países, detecção de agregados e tabela persistente de apelidos."""
+
+import collections
+import csv
+import os
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+from .instrumentacao import instrumentar
+from .paises import MAPA_PAISES, resolvedor_padrao
+
+
+# --- Agregados e regiões (não são países) ---
+# Padrões de nome usados pelo OWID e pelo WDI para regiões, grupos de renda e blocos
+_PADRAO_AGREGADO = re.compile(
+    r'\bincome\b|\(excluding|\bIDA\b|\bIBRD\b|demographic dividend|\bcountries\b|\bOECD\b|Euro area'
+    r'|European Union|&|\bWorld\b|\(region\)|small states|Sub-Sahara|Fragile|Not classified|Arab States'
+    r'|\((?:UN|WB|UNDP|WHO|FAO)\)|^Africa (?:Eastern|Western)'
+    r'|^(?:Africa|Asia|Europe|Oceania|Americas|North America|South America|Latin America|Middle East'
+    r'|East Asia|South Asia|Western Europe|Eastern Europe|Central Europe and the Baltics'
+    r'|Western Offshoots|South and South-East Asia)$',
+    re.IGNORECASE,
+)
+
+# Códigos de agregados do WDI (Country Code) e do OWID
+CODIGOS_AGREGADOS = frozenset({
+    'AFE', 'AFW', 'ARB', 'CEB', 'CSS', 'EAP', 'EAR', 'EAS', 'ECA', 'ECS', 'EMU', 'EUU', 'FCS', 'HIC',
+    'HPC', 'IBD', 'IBT', 'IDA', 'IDB', 'IDX', 'INX', 'LAC', 'LCN', 'LDC', 'LIC', 'LMC', 'LMY', 'LTE',
+    'MEA', 'MIC', 'MNA', 'NAC', 'OED', 'OSS', 'PRE', 'PSS', 'PST', 'SAS', 'SSA', 'SSF', 'SST', 'TEA',
+    'TEC', 'TLA', 'TMN', 'TSA', 'TSS', 'UMC', 'WLD', 'OWID_WRL',
+})
+
+
+def eh_agregado(nome, codigo=None):
+    """Indica se o nome (ou o código WDI/OWID) é de uma região, grupo de renda ou bloco, e não de um país."""
+    if codigo is not None and not pd.isna(codigo) and str(codigo).strip().upper() in CODIGOS_AGREGADOS:
+        return True
+    return bool(_PADRAO_AGREGADO.search(str(nome)))
+
+
+# --- Índice de n-gramas ---
+# Abreviações comuns nos exports (WDI, gapminder) e palavras ignoradas na comparação
+_ABREVIACOES = {'dem': 'democratic', 'rep': 'republic', 'st': 'saint', 'is': 'islands', 'fed': 'federated',
+                'sts': 'states', 'isl': 'islands', 'pdr': 'peoples democratic republic'}
+_IGNORADAS = {'the', 'of', 'and'}
+# Palavras genéricas em nomes de países: pesam menos na pontuação ('Czech Republic' ~ 'Czechia')
+_GENERICAS = {'republic', 'democratic', 'federal', 'federated', 'islands', 'island', 'kingdom', 'people',
+              'peoples', 'states', 'state', 'union', 'united'}
+_PESO_GENERICA = 0.3
+
+
+def _tokens(nome):
+    # Minúsculas, sem acentos e pontuação, com abreviações expandidas
+    texto = unicodedata.normalize('NFKD', str(nome)).encode('ascii', 'ignore').decode('ascii').lower()
+    palavras = re.sub(r'[^a-z0-9 ]+', ' ', texto.replace('&', ' and ')).split()
+    expandidas = ' '.join(_ABREVIACOES.get(p, p) for p in palavras).split()
+    return [p for p in expandidas if p not in _IGNORADAS]
+
+
+def _ngramas(nome, n=3):
+    # Peso de cada n-grama das palavras (com bordas), então a ordem das palavras não importa
+    gramas = collections.Counter()
+    for palavra in _tokens(nome):
+        peso = _PESO_GENERICA if palavra in _GENERICAS else 1.0
+        palavra = f' {palavra} '
+        for i in range(max(1, len(palavra) - n + 1)):
+            gramas[palavra[i:i + n]] += peso
+    return gramas
+
+
+class IndiceNomes:
+    """
+    Índice invertido de n-gramas sobre uma lista de nomes canônicos, montado uma vez.
+
+    Para um nome de consulta, só os nomes que compartilham algum n-grama com ele são pontuados
+    (percorrendo as listas dos n-gramas da consulta), então o custo cresce com o número de
+    consultas, não com todos os pares. A pontuação é o coeficiente de Dice entre os multiconjuntos
+    de n-gramas (1 = mesmas palavras, em qualquer ordem), com peso menor para palavras genéricas
+    como 'republic' e 'islands'.
+
+    Args:
+        nomes (list): Nomes canônicos (alvos da correspondência).
+        n (int): Tamanho dos n-gramas. Padrão é 3.
+    """
+
+    def __init__(self, nomes, n=3):
+        self.n = n
+        self.nomes = list(dict.fromkeys(str(nome) for nome in nomes))
+        self._tamanhos = np.zeros(len(self.nomes))
+        postagens = collections.defaultdict(list)
+        for posicao, nome in enumerate(self.nomes):
+            gramas = _ngramas(nome, n)
+            self._tamanhos[posicao] = sum(gramas.values())
+            for grama, quantidade in gramas.items():
+                postagens[grama].append((posicao, quantidade))
+        self._postagens = {
+            grama: (np.array([p for p, _ in lista]), np.array([q for _, q in lista]))
+            for grama, lista in postagens.items()
+        }
+
+    def candidatos(self, nome, limite=3, minimo=0.3):
+        """
+        Melhores nomes do índice para 'nome'.
+
+        Returns:
+            list: Tuplas (nome_canonico, pontuacao) em ordem decrescente, com pontuação >= minimo.
+        """
+        gramas = _ngramas(nome, self.n)
+        comuns = np.zeros(len(self.nomes))
+        for grama, quantidade in gramas.items():
+            if grama in self._postagens:
+                posicoes, quantidades = self._postagens[grama]
+                comuns[posicoes] += np.minimum(quantidades, quantidade)
+        total = sum(gramas.values())
+        if total == 0 or not comuns.any():
+            return []
+        pontuacao = 2 * comuns / (self._tamanhos + total)
+        melhores = np.argsort(-pontuacao, kind='stable')[:limite]
+        return [(self.nomes[i], round(float(pontuacao[i]), 3)) for i in melhores if pontuacao[i] >= minimo]
+
+
+@instrumentar
+def sugerir_correspondencias(nomes_origem, nomes_alvo, resolvedor=None, codigos_origem=None,
+                             limite=3, minimo=0.3):
+    """
+    Para cada nome da origem sem correspondente no alvo, sugere candidatos do alvo com pontuação
+    e marca os agregados (regiões, grupos de renda), que podem ser descartados.
+
+    Só os nomes do alvo que também ficaram sem par entram no índice, e só os nomes sem par da
+    origem são consultados.
+
+    Args:
+        nomes_origem (pd.Series): Nomes da base a integrar (ex.: coluna 'Entity' do OWID).
+        nomes_alvo (pd.Series): Nomes da base de referência (ex.: coluna 'country' do gapminder).
+        resolvedor (ResolvedorPaises): Harmonização já conhecida. Padrão é resolvedor_padrao().
+        codigos_origem (pd.Series): Códigos ISO3/WDI da origem, opcional (ajuda a marcar agregados).
+        limite (int): Número máximo de candidatos por nome. Padrão é 3.
+        minimo (float): Pontuação mínima de um candidato (0 a 1). Padrão é 0.3.
+
+    Returns:
+        pd.DataFrame: nome, agregado, candidato, pontuacao, posicao (1 = melhor) e sugerido; nomes
+        sem candidato aparecem uma vez com candidato nulo. 'sugerido' marca uma atribuição um para
+        um (gulosa, da maior pontuação para a menor): um mesmo nome do alvo não é sugerido para
+        dois nomes da origem.
+    """
+    if resolvedor is None:
+        resolvedor = resolvedor_padrao()
+    nomes_origem = pd.Series(nomes_origem).reset_index(drop=True)
+    nomes_alvo = pd.Series(nomes_alvo)
+    ids_origem = resolvedor.resolver(nomes_origem)
+    ids_alvo = resolvedor.resolver(nomes_alvo)
+    pareados = set(np.unique(ids_origem).tolist()) & set(np.unique(ids_alvo).tolist())
+
+    sem_par_alvo = [resolvedor.nomes[i] for i in np.unique(ids_alvo[ids_alvo >= 0]) if i not in pareados]
+    indice = IndiceNomes(sem_par_alvo)
+
+    codigo_de = {}
+    if codigos_origem is not None:
+        codigos_origem = pd.Series(codigos_origem).reset_index(drop=True)
+        codigo_de = dict(zip(nomes_origem, codigos_origem))
+
+    linhas = []
+    sem_par_origem = pd.unique(nomes_origem[(ids_origem >= 0) & ~np.isin(ids_origem, list(pareados))])
+    for nome in sorted(sem_par_origem, key=str):
+        agregado = eh_agregado(nome, codigo_de.get(nome))
+        candidatos = [] if agregado else indice.candidatos(nome, limite, minimo)
+        if not candidatos:
+            linhas.append({'nome': nome, 'agregado': agregado, 'candidato': None, 'pontuacao': np.nan, 'posicao': 0})
+        for posicao, (candidato, pontuacao) in enumerate(candidatos, start=1):
+            linhas.append({'nome': nome, 'agregado': agregado, 'candidato': candidato,
+                           'pontuacao': pontuacao, 'posicao': posicao})
+    sugestoes = pd.DataFrame(linhas, columns=['nome', 'agregado', 'candidato', 'pontuacao', 'posicao'])
+
+    # Atribuição um para um: cada nome da origem e cada candidato são usados no máximo uma vez
+    sugestoes['sugerido'] = False
+    usados_origem, usados_alvo = set(), set()
+    for indice_linha, linha in sugestoes.dropna(subset=['candidato']).sort_values(
+            'pontuacao', ascending=False, kind='stable').iterrows():
+        if linha['nome'] not in usados_origem and linha['candidato'] not in usados_alvo:
+            sugestoes.at[indice_linha, 'sugerido'] = True
+            usados_origem.add(linha['nome'])
+            usados_alvo.add(linha['candidato'])
+    return sugestoes
+
+
+# --- Tabela persistente de apelidos ---
+ARQUIVO_APELIDOS = 'apelidos_paises.csv'
+
+
+def descartar_agregados(dataframe, coluna, agregados):
+    """Remove as linhas cujo nome na coluna de país é um dos agregados (regiões, grupos de renda) informados."""
+    if not agregados:
+        return dataframe
+    return dataframe[~dataframe[coluna].isin(list(agregados))]
+
+
+class TabelaApelidos:
+    """
+    Apelidos aprovados (apelido -> nome canônico) e agregados a descartar, gravados em CSV.
+
+    O arquivo tem as colunas apelido, canonico e tipo ('pais' ou 'agregado') e pode ser editado
+    à mão. como_mapa() devolve o mapa no formato de MAPA_PAISES, pronto para ResolvedorPaises, e
+    descartar() remove de uma base as linhas dos agregados aprovados.
+
+    Args:
+        caminho (str): Arquivo CSV. Padrão é 'apelidos_paises.csv' (criado ao salvar).
+    """
+
+    def __init__(self, caminho=ARQUIVO_APELIDOS):
+        self.caminho = caminho
+        self.apelidos = {}
+        self.agregados = set()
+        if os.path.exists(caminho):
+            with open(caminho, newline='', encoding='utf-8') as arquivo:
+                for linha in csv.DictReader(arquivo):
+                    if linha['tipo'] == 'agregado':
+                        self.agregados.add(linha['apelido'])
+                    else:
+                        self.apelidos[linha['apelido']] = linha['canonico']
+
+    def aprovar(self, apelido, canonico):
+        # Registra um apelido aprovado (substitui a aprovação anterior do mesmo apelido)
+        self.agregados.discard(apelido)
+        self.apelidos[apelido] = canonico
+
+    def marcar_agregado(self, nome):
+        self.apelidos.pop(nome, None)
+        self.agregados.add(nome)
+
+    def aprovar_sugestoes(self, sugestoes, minimo=0.85, agregados=True):
+        """
+        Aprova automaticamente o candidato sugerido de cada nome com pontuação >= minimo
+        (e, se agregados=True, registra os agregados marcados).
+
+        Args:
+            sugestoes (pd.DataFrame): Saída de sugerir_correspondencias (pode ser filtrada/editada antes).
+
+        Returns:
+            int: Quantidade de entradas aprovadas.
+        """
+        aprovadas = 0
+        for linha in sugestoes.itertuples(index=False):
+            if linha.agregado and agregados:
+                self.marcar_agregado(linha.nome)
+                aprovadas += 1
+            elif not linha.agregado and linha.sugerido and linha.pontuacao >= minimo:
+                self.aprovar(linha.nome, linha.candidato)
+                aprovadas += 1
+        return aprovadas
+
+    def como_mapa(self, base=None):
+        """Mapa apelido -> canônico: MAPA_PAISES (ou 'base') acrescido dos apelidos aprovados."""
+        return {**(MAPA_PAISES if base is None else base), **self.apelidos}
+
+    def descartar(self, dataframe, coluna):
+        """Remove do dataframe as linhas cujo país (coluna) foi marcado como agregado."""
+        return descartar_agregados(dataframe, coluna, self.agregados)
+
+    def salvar(self):
+        # Grava o CSV ordenado (diffs pequenos quando a tabela é versionada)
+        temporario = f'{self.caminho}.{os.getpid()}.tmp'
+        with open(temporario, 'w', newline='', encoding='utf-8') as arquivo:
+            escritor = csv.writer(arquivo)
+            escritor.writerow(['apelido', 'canonico', 'tipo'])
+            for apelido in sorted(self.apelidos):
+                escritor.writerow([apelido, self.apelidos[apelido], 'pais'])
+            for nome in sorted(self.agregados):
+                escritor.writerow([nome, '', 'agregado'])
+        os.replace(temporario, self.caminho)
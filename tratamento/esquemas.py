@@ -0,0 +1,237 @@
+"""Esquemas de tipos das bases: categorias e redução de tipos numéricos."""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from .importacao import import_data
+from .instrumentacao import instrumentar
+
+
+# --- Esquemas de tipos das bases do projeto ---
+# Cada esquema informa o tipo de cada coluna conhecida. Colunas que não aparecem no esquema
+# passam pela inferência de inferir_esquema. 'na_values' são marcadores extras de ausência e
+# 'chaves' são colunas obrigatórias (linhas sem valor nelas, como rodapés, são descartadas).
+_TIPOS_OWID = {
+    'Entity': 'category',
+    'Code': 'category',
+    'Continent': 'category',
+    'Year': 'int16',
+    '417485-annotations': 'category',
+    # População passa de 2^24 e tem NaN: float32 perderia precisão, então continua float64
+    'Population (historical estimates)': 'float64',
+}
+
+ESQUEMAS = {
+    'gapminder_full.csv': {
+        'tipos': {
+            'country': 'category',
+            'continent': 'category',
+            'year': 'int16',
+            'pop': 'int32',
+            'lifeExp': 'float32',
+            'gdpPercap': 'float32',
+        },
+    },
+    'arquivo1.csv': {
+        'tipos': {
+            'Time': 'int16',
+            'Time Code': 'category',
+            'Country Name': 'category',
+            'Country Code': 'category',
+        },
+        'na_values': ['..'],
+        'chaves': ['Time', 'Country Code'],
+    },
+}
+for _arquivo in (
+    'expected-years-of-schooling.csv',
+    'gross-national-income-per-capita.csv',
+    'hdi-vs-gdp-per-capita.csv',
+    'hdi-vs-hihd.csv',
+    'hihd-without-gdp-vs-gdp-per-capita.csv',
+    'human-development-index-comparison.csv',
+    'human-development-index-escosura.csv',
+    'human-development-index.csv',
+    'mean-years-of-schooling-long-run.csv',
+):
+    ESQUEMAS[_arquivo] = {'tipos': dict(_TIPOS_OWID)}
+
+
+# Erro relativo aceito ao reduzir uma coluna float64 para float32 (cerca de 6 dígitos significativos)
+_TOLERANCIA_FLOAT32 = 1e-6
+
+
+def _eh_texto(serie):
+    return pd.api.types.is_object_dtype(serie) or pd.api.types.is_string_dtype(serie)
+
+
+def _cabe_em_float32(valores, exato=False):
+    # Indica se os valores sobrevivem à ida e volta float64 -> float32 -> float64: dentro de
+    # _TOLERANCIA_FLOAT32 (relativa) ou, para inteiros (ex.: população com NaN), sem nenhuma perda
+    with np.errstate(over='ignore'):  # fora da faixa do float32 vira inf e reprova a redução
+        volta = valores.astype('float32').astype('float64')
+    if exato:
+        return bool(np.array_equal(volta, valores))
+    return bool(np.allclose(volta, valores, rtol=_TOLERANCIA_FLOAT32, atol=0.0))
+
+
+def inferir_esquema(dataframe, limite_categoria=0.5):
+    """
+    Infere o menor tipo adequado para cada coluna do dataframe.
+
+    Args:
+        dataframe (pd.DataFrame): O DataFrame original.
+        limite_categoria (float): Proporção máxima de valores distintos para uma coluna de texto
+            virar 'category'. Padrão é 0.5.
+
+    Returns:
+        dict: {coluna: tipo} no mesmo formato de ESQUEMAS[...]['tipos'].
+    """
+    tipos = {}
+    for coluna in dataframe.columns:
+        serie = dataframe[coluna]
+        if isinstance(serie.dtype, pd.CategoricalDtype):
+            tipos[coluna] = 'category'
+        elif _eh_texto(serie):
+            if len(serie) and serie.nunique() / len(serie) <= limite_categoria:
+                tipos[coluna] = 'category'
+        elif pd.api.types.is_bool_dtype(serie):
+            continue
+        elif pd.api.types.is_integer_dtype(serie):
+            tipos[coluna] = str(pd.to_numeric(serie, downcast='integer').dtype)
+        elif pd.api.types.is_float_dtype(serie):
+            valores = serie.dropna()
+            inteiros = bool(len(valores)) and bool((valores % 1 == 0).all())
+            # Floats que só contêm inteiros (ex.: população) viram inteiros quando não há NaN
+            if inteiros and len(valores) == len(serie):
+                tipos[coluna] = str(pd.to_numeric(valores, downcast='integer').dtype)
+            elif _cabe_em_float32(valores.to_numpy(dtype='float64'), exato=inteiros):
+                tipos[coluna] = 'float32'
+            else:
+                tipos[coluna] = 'float64'
+    return tipos
+
+
+def obter_esquema(path):
+    # Retorna o esquema conhecido para o arquivo (pelo nome) ou None
+    return ESQUEMAS.get(os.path.basename(path))
+
+
+@instrumentar
+def aplicar_esquema(dataframe, esquema=None, limite_categoria=0.5):
+    """
+    Converte as colunas do dataframe para os tipos do esquema (categorias e numéricos reduzidos).
+
+    Args:
+        dataframe (pd.DataFrame): O DataFrame original (não é alterado).
+        esquema (dict): Esquema no formato de ESQUEMAS. Colunas fora do esquema são inferidas.
+        limite_categoria (float): Repassado para inferir_esquema.
+
+    Returns:
+        pd.DataFrame: Novo DataFrame com os tipos otimizados.
+    """
+    esquema = esquema or {}
+    df = dataframe
+    na_values = esquema.get('na_values')
+    if na_values:
+        df = df.replace(list(na_values), np.nan)
+    chaves = [c for c in esquema.get('chaves', []) if c in df.columns]
+    if chaves:
+        df = df.dropna(subset=chaves)
+
+    tipos_esquema = {c: t for c, t in esquema.get('tipos', {}).items() if c in df.columns}
+    if na_values:
+        # Colunas que eram texto só por causa do marcador de ausência voltam a ser numéricas
+        numericas = {}
+        for coluna in df.columns:
+            serie = df[coluna]
+            if coluna not in tipos_esquema and _eh_texto(serie):
+                numerica = pd.to_numeric(serie, errors='coerce')
+                if numerica.notna().sum() == serie.notna().sum():
+                    numericas[coluna] = numerica
+        if numericas:
+            df = df.assign(**numericas)
+
+    tipos = inferir_esquema(df, limite_categoria)
+    tipos.update(tipos_esquema)
+
+    convertidas = {}
+    for coluna in df.columns:
+        serie = df[coluna]
+        tipo = tipos.get(coluna)
+        if tipo is not None and str(serie.dtype) != tipo:
+            try:
+                serie = serie.astype(tipo)
+            except (ValueError, TypeError):
+                # Ex.: inteiro pedido, mas a coluna tem NaN; mantém o tipo atual
+                pass
+        convertidas[coluna] = serie
+    return pd.DataFrame(convertidas, index=df.index).reset_index(drop=True)
+
+
+def relatorio_memoria(antes, depois):
+    """
+    Compara o uso de memória de duas versões do mesmo dataframe, coluna a coluna.
+
+    Args:
+        antes (pd.DataFrame): DataFrame original.
+        depois (pd.DataFrame): DataFrame otimizado.
+
+    Returns:
+        pd.DataFrame: nome_variavel, tipo_antes, tipo_depois, memoria_antes_kb, memoria_depois_kb
+        e reducao_percentual, com uma linha final 'TOTAL'.
+    """
+    mem_antes = antes.memory_usage(deep=True, index=False)
+    mem_depois = depois.memory_usage(deep=True, index=False).reindex(mem_antes.index)
+
+    relatorio = pd.DataFrame({
+        'nome_variavel': antes.columns,
+        'tipo_antes': antes.dtypes.astype(str).values,
+        'tipo_depois': depois.dtypes.reindex(antes.columns).astype(str).values,
+        'memoria_antes_kb': (mem_antes / 1024).round(2).values,
+        'memoria_depois_kb': (mem_depois / 1024).round(2).values,
+    })
+    total = pd.DataFrame([{
+        'nome_variavel': 'TOTAL',
+        'tipo_antes': '',
+        'tipo_depois': '',
+        'memoria_antes_kb': round(mem_antes.sum() / 1024, 2),
+        'memoria_depois_kb': round(mem_depois.sum() / 1024, 2),
+    }])
+    relatorio = pd.concat([relatorio, total], ignore_index=True)
+    relatorio['reducao_percentual'] = (
+        (1 - relatorio['memoria_depois_kb'] / relatorio['memoria_antes_kb']) * 100
+    ).round(2)
+    return relatorio
+
+
+@instrumentar
+def import_data_otimizado(path, separador = ',', encoding = 'utf-8', esquema = None, cache = False,
+                          dir_cache = None, relatorio = False):
+    """
+    Importa o CSV com import_data e aplica o esquema de tipos (conhecido ou inferido).
+
+    Args:
+        path (str): Caminho do arquivo.
+        separador (str): Separador do arquivo. Padrão é ','.
+        encoding (str): Codificação do arquivo. Padrão é 'utf-8'.
+        esquema (dict): Esquema no formato de ESQUEMAS. Padrão: o esquema conhecido do arquivo,
+            ou apenas inferência se o arquivo não estiver em ESQUEMAS.
+        cache (bool): Repassado para import_data.
+        dir_cache (str): Repassado para import_data.
+        relatorio (bool): Se True, retorna também o relatorio_memoria antes/depois.
+
+    Returns:
+        pd.DataFrame ou (pd.DataFrame, pd.DataFrame): O DataFrame otimizado e, opcionalmente, o relatório.
+    """
+    df = import_data(path, separador, encoding, cache=cache, dir_cache=dir_cache)
+    if df is None:
+        return None
+    if esquema is None:
+        esquema = obter_esquema(path)
+    otimizado = aplicar_esquema(df, esquema)
+    if relatorio:
+        return otimizado, relatorio_memoria(df, otimizado)
+    return otimizado
@@ -0,0 +1,214 @@
+"""Classificação em faixas (renda, IDH, escolaridade) com tabelas de limites nomeadas e versionadas."""
+
+import numpy as np
+import pandas as pd
+
+from .instrumentacao import instrumentar, registrar_cache
+
+
+# --- Tabelas de limites ---
+# Cada tabela tem:
+#   'versao': revisão dos limites (incrementar ao alterá-los; os caches usam o próprio conteúdo da tabela);
+#   'categorias': rótulos das faixas, da menor para a maior;
+#   'limites': os len(categorias) - 1 pontos de corte, ou {ano: pontos de corte} quando os
+#       limites mudam com o tempo (anos antes do primeiro usam a primeira linha; depois do último, a última);
+#   'direita': True se a faixa inclui o limite superior (valor == corte fica na faixa de baixo).
+_CATEGORIAS_RENDA = ['Baixa Renda', 'Renda Média Baixa', 'Renda Média Alta', 'Alta Renda']
+
+TABELAS_FAIXAS = {
+    # Grupos de renda do Banco Mundial (RNB per capita, método Atlas, US$ correntes), por ano dos dados.
+    # Uma economia é de renda baixa se RNB <= primeiro corte, e assim por diante.
+    'renda_banco_mundial': {
+        'versao': 1,
+        'categorias': _CATEGORIAS_RENDA,
+        'direita': True,
+        'limites': {
+            1987: (480, 1940, 6000),
+            1988: (545, 2200, 6000),
+            1989: (580, 2335, 6000),
+            1990: (610, 2465, 7620),
+            1991: (635, 2555, 7910),
+            1992: (675, 2695, 8355),
+            1993: (695, 2785, 8625),
+            1994: (725, 2895, 8955),
+            1995: (765, 3035, 9385),
+            1996: (785, 3115, 9645),
+            1997: (785, 3125, 9655),
+            1998: (760, 3030, 9360),
+            1999: (755, 2995, 9265),
+            2000: (755, 2995, 9265),
+            2001: (745, 2975, 9205),
+            2002: (735, 2935, 9075),
+            2003: (765, 3035, 9385),
+            2004: (825, 3255, 10065),
+            2005: (875, 3465, 10725),
+            2006: (905, 3595, 11115),
+            2007: (935, 3705, 11455),
+            2008: (975, 3855, 11905),
+            2009: (995, 3945, 12195),
+            2010: (1005, 3975, 12275),
+            2011: (1025, 4035, 12475),
+            2012: (1035, 4085, 12615),
+            2013: (1045, 4125, 12745),
+            2014: (1045, 4125, 12735),
+            2015: (1025, 4035, 12475),
+            2016: (1005, 3955, 12235),
+            2017: (995, 3895, 12055),
+            2018: (1025, 3995, 12375),
+            2019: (1035, 4045, 12535),
+            2020: (1045, 4095, 12695),
+            2021: (1085, 4255, 13205),
+            2022: (1135, 4465, 13845),
+            2023: (1145, 4515, 14005),
+        },
+    },
+    # Limites fixos usados no notebook (valores_GDP / categorias_GDP), aplicados ao gdpPercap
+    'renda_projeto': {
+        'versao': 1,
+        'categorias': _CATEGORIAS_RENDA,
+        'direita': True,
+        'limites': (1135, 4465, 13845),
+    },
+    # Faixas do IDH do PNUD: baixo < 0,550 <= médio < 0,700 <= alto < 0,800 <= muito alto
+    'idh_pnud': {
+        'versao': 1,
+        'categorias': ['IDH Baixo', 'IDH Médio', 'IDH Alto', 'IDH Muito Alto'],
+        'direita': False,
+        'limites': (0.550, 0.700, 0.800),
+    },
+    # Faixas de anos esperados de estudo usadas no notebook
+    'escolaridade_projeto': {
+        'versao': 1,
+        'categorias': ['Baixa Escolaridade', 'Média Escolaridade', 'Alta Escolaridade', 'Muito Alta Escolaridade'],
+        'direita': True,
+        'limites': (10, 14, 17),
+    },
+}
+
+
+def _obter_tabela(tabela):
+    # Aceita o nome de uma tabela de TABELAS_FAIXAS ou a própria tabela (dict)
+    if isinstance(tabela, str):
+        if tabela not in TABELAS_FAIXAS:
+            raise KeyError(f"Tabela de faixas desconhecida: {tabela}. Opções: {', '.join(TABELAS_FAIXAS)}")
+        return TABELAS_FAIXAS[tabela]
+    return tabela
+
+
+def _congelar_tabela(tabela):
+    # Conteúdo da tabela como tupla imutável (usável como chave de dicionário)
+    limites = tabela['limites']
+    if isinstance(limites, dict):
+        limites = tuple((ano, tuple(limites[ano])) for ano in sorted(limites))
+    else:
+        limites = tuple(limites)
+    return tuple(tabela['categorias']), bool(tabela.get('direita', True)), limites
+
+
+def codigos_faixas(valores, tabela, anos=None):
+    """
+    Código da faixa (0 = menor) de cada valor, em uma única passada vetorizada; -1 para nulos.
+
+    Com limites fixos usa np.searchsorted sobre os pontos de corte. Com limites por ano, cada
+    linha recebe a linha de limites do seu ano (searchsorted sobre os anos da tabela) e o
+    código é o número de cortes abaixo do valor.
+
+    Args:
+        valores: Valores a classificar (array, Series).
+        tabela (str ou dict): Nome em TABELAS_FAIXAS ou uma tabela no mesmo formato.
+        anos: Ano de cada valor (obrigatório para tabelas com limites por ano).
+
+    Returns:
+        np.ndarray: Códigos int8.
+    """
+    tabela = _obter_tabela(tabela)
+    valores = np.asarray(valores, dtype='float64')
+    direita = tabela.get('direita', True)
+    limites = tabela['limites']
+
+    if isinstance(limites, dict):
+        if anos is None:
+            raise ValueError("A tabela tem limites por ano: informe 'anos'.")
+        anos_tabela = np.array(sorted(limites))
+        cortes = np.array([limites[ano] for ano in anos_tabela], dtype='float64')
+        linha = np.searchsorted(anos_tabela, np.asarray(anos), side='right') - 1
+        cortes = cortes[np.clip(linha, 0, len(anos_tabela) - 1)]
+        acima = valores[:, None] > cortes if direita else valores[:, None] >= cortes
+        codigos = acima.sum(axis=1)
+    else:
+        codigos = np.searchsorted(np.asarray(limites, dtype='float64'), valores, side='left' if direita else 'right')
+
+    codigos = codigos.astype(np.int8)
+    codigos[np.isnan(valores)] = -1
+    return codigos
+
+
+@instrumentar
+def classificar(valores, tabela, anos=None):
+    """
+    Classifica os valores nas faixas da tabela.
+
+    Returns:
+        pd.Categorical: Categorias ordenadas com os rótulos da tabela (NaN para valores nulos).
+    """
+    categorias = _obter_tabela(tabela)['categorias']
+    return pd.Categorical.from_codes(codigos_faixas(valores, tabela, anos), categories=categorias, ordered=True)
+
+
+class ClassificadorFaixas:
+    """
+    Classifica colunas de um painel em faixas, guardando o resultado por (conteúdo da tabela, variável).
+
+    Reclassificar a mesma coluna com a mesma tabela devolve o resultado guardado; trocar de
+    tabela custa uma passada vetorizada sobre a coluna.
+
+    Args:
+        df (pd.DataFrame): O painel (colunas de valores e, para tabelas por ano, a coluna de ano).
+        coluna_ano (str): Nome da coluna de ano. Padrão é 'year'.
+    """
+
+    def __init__(self, df, coluna_ano='year'):
+        self.df = df
+        self.coluna_ano = coluna_ano
+        self._memo = {}
+
+    def _chave(self, variavel, tabela):
+        # Chave pelo conteúdo da tabela (não pelo id(): um dict descartado pode ter o id reaproveitado)
+        return (_congelar_tabela(_obter_tabela(tabela)), variavel)
+
+    def classificar(self, variavel: str, tabela):
+        """
+        Faixas de uma coluna do painel.
+
+        Returns:
+            pd.Series: Categórica (ordenada), com o mesmo índice do painel.
+        """
+        chave = self._chave(variavel, tabela)
+        registrar_cache(chave in self._memo)
+        if chave not in self._memo:
+            anos = self.df[self.coluna_ano].to_numpy() if isinstance(_obter_tabela(tabela)['limites'], dict) else None
+            self._memo[chave] = pd.Series(
+                classificar(self.df[variavel].to_numpy(dtype='float64', na_value=np.nan), tabela, anos),
+                index=self.df.index, name=variavel,
+            )
+        return self._memo[chave]
+
+    def aplicar(self, faixas: dict):
+        """
+        Adiciona colunas de faixas ao painel.
+
+        Args:
+            faixas (dict): {coluna_nova: (variavel, tabela)}, ex.:
+                {'Nivel de renda': ('gdpPercap', 'renda_projeto'), 'nivel_idh': ('IDH', 'idh_pnud')}.
+
+        Returns:
+            pd.DataFrame: Cópia do painel com as novas colunas.
+        """
+        painel = self.df.copy()
+        for coluna, (variavel, tabela) in faixas.items():
+            painel[coluna] = self.classificar(variavel, tabela).rename(coluna)
+        return painel
+
+    def limpar_memoria(self):
+        # Descarta as classificações guardadas (ex.: depois de alterar self.df)
+        self._memo.clear()
@@ -0,0 +1,135 @@
+"""Importação de arquivos CSV, com cache colunar opcional."""
+
+import glob
+import hashlib
+import os
+import time
+
+import pandas as pd
+
+from .instrumentacao import instrumentar, registrar_cache
+
+
+# Versão do formato do cache. Incrementar invalida todos os arquivos já gravados.
+VERSAO_CACHE = 1
+
+# Contadores globais do cache colunar usado por import_data(cache=True)
+_estatisticas_cache = {
+    'hits': 0,
+    'misses': 0,
+    'gravacoes': 0,
+    'erros': 0,
+    'tempo_hits_s': 0.0,
+    'tempo_misses_s': 0.0,
+}
+
+
+def _chave_cache(path, separador, encoding):
+    # Retorna (prefixo, chave) do arquivo de cache.
+    # O prefixo identifica a origem + opções de leitura; a chave inclui também tamanho e mtime,
+    # de forma que qualquer alteração no CSV gera um novo arquivo e invalida o anterior.
+    caminho = os.path.abspath(path)
+    info = os.stat(caminho)
+    origem = f'{caminho}|{separador}|{encoding}|{VERSAO_CACHE}'
+    prefixo = hashlib.sha1(origem.encode('utf-8')).hexdigest()[:10]
+    versao = hashlib.sha1(f'{info.st_size}|{info.st_mtime_ns}'.encode('utf-8')).hexdigest()[:10]
+    return prefixo, versao
+
+
+def _caminho_cache(path, separador, encoding, dir_cache=None):
+    # Monta o caminho do arquivo .feather correspondente ao CSV e às opções de leitura
+    if dir_cache is None:
+        dir_cache = os.path.join(os.path.dirname(os.path.abspath(path)), '.cache')
+    nome = os.path.splitext(os.path.basename(path))[0]
+    prefixo, versao = _chave_cache(path, separador, encoding)
+    base = os.path.join(dir_cache, f'{nome}-{prefixo}')
+    return f'{base}-{versao}.feather', base
+
+
+def _ler_cache(arquivo):
+    # Lê o arquivo Feather (sem compressão) via memory map, evitando o parse do CSV.
+    # As colunas de texto (str do pandas, guardadas em Arrow) continuam apontando para o arquivo
+    # mapeado; as numéricas são copiadas para arrays numpy, para que o DataFrame possa ser alterado
+    # (arrays sem cópia seriam somente leitura e df.loc[...] = ... falharia).
+    from pyarrow import feather
+    tabela = feather.read_table(arquivo, memory_map=True)
+    return tabela.to_pandas()
+
+
+def _gravar_cache(df, arquivo, base):
+    # Grava o dataframe em Feather sem compressão (necessário para o memory map ser útil)
+    # e remove versões antigas do mesmo CSV/opções
+    from pyarrow import feather
+    os.makedirs(os.path.dirname(arquivo), exist_ok=True)
+    temporario = f'{arquivo}.{os.getpid()}.tmp'
+    feather.write_feather(df, temporario, compression='uncompressed')
+    os.replace(temporario, arquivo)
+    for antigo in glob.glob(f'{glob.escape(base)}-*.feather'):
+        if antigo != arquivo:
+            try:
+                os.remove(antigo)
+            except OSError:
+                pass
+
+
+def estatisticas_cache():
+    """
+    Retorna as estatísticas acumuladas do cache colunar de import_data.
+
+    Returns:
+        dict: hits, misses, gravações, erros e o tempo total (s) gasto em cada caso.
+    """
+    return dict(_estatisticas_cache)
+
+
+def limpar_estatisticas_cache():
+    # Zera os contadores do cache (útil para comparar execução fria e quente)
+    for chave in _estatisticas_cache:
+        _estatisticas_cache[chave] = 0.0 if chave.startswith('tempo') else 0
+
+
+@instrumentar
+def import_data(path,separador = ',', encoding = 'utf-8', cache = False, dir_cache = None):
+    #Importa arquivos csv
+    #Parâmetros: path = caminho do arquivo, separador = separador do arquivo, encoding = codificação do arquivo
+    #cache = se True, grava/lê uma cópia colunar (Feather) do dataframe, chaveada por caminho, tamanho,
+    #mtime, separador e encoding; dir_cache = pasta do cache (padrão: '.cache' ao lado do arquivo)
+    #retorna um dataframe
+    try:
+        if cache:
+            inicio = time.perf_counter()
+            try:
+                arquivo, base = _caminho_cache(path, separador, encoding, dir_cache)
+                if os.path.exists(arquivo):
+                    df = _ler_cache(arquivo)
+                    _estatisticas_cache['hits'] += 1
+                    registrar_cache(True)
+                    _estatisticas_cache['tempo_hits_s'] += time.perf_counter() - inicio
+                    print("Arquivo importado com sucesso! (cache)")
+                    return df
+            except FileNotFoundError:
+                raise
+            except (ImportError, OSError) as erro:
+                # Sem pyarrow ou cache ilegível: segue com a leitura normal do CSV
+                _estatisticas_cache['erros'] += 1
+                print(f"Cache indisponível ({erro}). Lendo o CSV.")
+                cache = False
+        df = pd.read_csv(path, sep=separador, encoding=encoding)
+        if cache:
+            _estatisticas_cache['misses'] += 1
+            registrar_cache(False)
+            try:
+                _gravar_cache(df, arquivo, base)
+                _estatisticas_cache['gravacoes'] += 1
+            except Exception as erro:
+                _estatisticas_cache['erros'] += 1
+                print(f"Não foi possível gravar o cache: {erro}")
+            _estatisticas_cache['tempo_misses_s'] += time.perf_counter() - inicio
+        print("Arquivo importado com sucesso!")
+        return df
+    except UnicodeDecodeError as ue:
+        print(f"Erro de codificação: {ue}. Tente outro encoding.")
+    except FileNotFoundError as fnf:
+        print(f"Arquivo não encontrado: {fnf}. Verifique o caminho.")
+    except Exception as e:
+        print(f"Erro ao importar o arquivo: {e}")
@@ -0,0 +1,189 @@
+"""Indicadores derivados do painel: crescimento, CAGR, médias móveis e ranking por continente."""
+
+import numpy as np
+import pandas as pd
+
+from .painel import chave_pais_ano
+from .instrumentacao import instrumentar, registrar_cache
+
+
+class IndicadoresPainel:
+    """
+    Calcula indicadores para todos os países de uma vez sobre o painel ordenado por (país, ano).
+
+    O painel é ordenado uma única vez na criação; crescimento, médias móveis e CAGR usam
+    operações vetorizadas sobre essa ordem (sem laços por país) e consideram a distância real
+    em anos entre as observações, então séries quinquenais (gapminder) e anuais (OWID) são
+    tratadas corretamente. Cada resultado fica memorizado por (indicador, variável, parâmetros).
+
+    Args:
+        df (pd.DataFrame): Painel com colunas de país e ano, ou indexado por (country, year).
+        coluna_pais (str): Nome da coluna de país. Padrão é 'country'.
+        coluna_ano (str): Nome da coluna de ano. Padrão é 'year'.
+        coluna_continente (str): Nome da coluna de continente (usada no ranking). Padrão é 'continent'.
+    """
+
+    def __init__(self, df, coluna_pais='country', coluna_ano='year', coluna_continente='continent'):
+        if coluna_pais in (df.index.names or []):
+            df = df.reset_index()
+        self.coluna_pais = coluna_pais
+        self.coluna_ano = coluna_ano
+        self.coluna_continente = coluna_continente
+        self.dados = df.sort_values([coluna_pais, coluna_ano], kind='stable').reset_index(drop=True)
+        self.grupos = pd.factorize(self.dados[coluna_pais], sort=True)[0]
+        self.anos = self.dados[coluna_ano].to_numpy(dtype='int64')
+        self.indice = pd.MultiIndex.from_arrays(
+            [self.dados[coluna_pais], self.dados[coluna_ano]], names=[coluna_pais, coluna_ano]
+        )
+        self._memo = {}
+
+    def _memorizado(self, chave, calcular):
+        registrar_cache(chave in self._memo)
+        if chave not in self._memo:
+            self._memo[chave] = calcular()
+        return self._memo[chave]
+
+    def _valores(self, variavel):
+        return self.dados[variavel].to_numpy(dtype='float64', na_value=np.nan)
+
+    def _observacao_anterior(self, variavel):
+        # Para cada linha com valor, posição da observação anterior (não nula) do mesmo país; -1 se não houver
+        valores = self._valores(variavel)
+        validas = np.flatnonzero(~np.isnan(valores))
+        anterior = np.full(len(valores), -1)
+        if len(validas) > 1:
+            mesmo_pais = self.grupos[validas[1:]] == self.grupos[validas[:-1]]
+            anterior[validas[1:][mesmo_pais]] = validas[:-1][mesmo_pais]
+        return valores, anterior
+
+    @instrumentar
+    def crescimento(self, variavel: str, anualizado: bool = True):
+        """
+        Taxa de crescimento entre observações consecutivas de cada país.
+
+        Args:
+            variavel (str): Coluna analisada (ex.: 'gdpPercap').
+            anualizado (bool): Se True, converte a variação para taxa anual usando a distância
+                real em anos ((v1/v0) ** (1/anos) - 1), o que torna comparáveis séries de 5 em 5
+                anos e anuais. Se False, retorna a variação simples entre observações.
+
+        Returns:
+            pd.Series: Taxa (0.05 = 5%) indexada por (país, ano); NaN na primeira observação.
+        """
+        def calcular():
+            valores, anterior = self._observacao_anterior(variavel)
+            tem = anterior >= 0
+            taxa = np.full(len(valores), np.nan)
+            razao = valores[tem] / valores[anterior[tem]]
+            if anualizado:
+                distancia = self.anos[tem] - self.anos[anterior[tem]]
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    taxa[tem] = np.power(razao, 1.0 / distancia) - 1
+            else:
+                taxa[tem] = razao - 1
+            return pd.Series(taxa, index=self.indice, name=f'crescimento_{variavel}')
+        return self._memorizado(('crescimento', variavel, anualizado), calcular)
+
+    @instrumentar
+    def cagr(self, variavel: str, ano_inicial: int, ano_final: int):
+        """
+        Taxa de crescimento anual composta entre a primeira e a última observação de cada país
+        dentro do intervalo [ano_inicial, ano_final].
+
+        Returns:
+            pd.DataFrame: Por país: ano_inicial, ano_final (anos efetivamente usados), valor_inicial,
+            valor_final e cagr.
+        """
+        def calcular():
+            valores = self._valores(variavel)
+            filtro = ~np.isnan(valores) & (self.anos >= ano_inicial) & (self.anos <= ano_final)
+            sub = pd.DataFrame({
+                'grupo': self.grupos[filtro],
+                'ano': self.anos[filtro],
+                'valor': valores[filtro],
+            })
+            por_pais = sub.groupby('grupo', sort=True)
+            primeiro, ultimo = por_pais.first(), por_pais.last()
+            anos = ultimo['ano'] - primeiro['ano']
+            with np.errstate(invalid='ignore', divide='ignore'):
+                taxa = np.power(ultimo['valor'] / primeiro['valor'], 1.0 / anos.where(anos > 0)) - 1
+            paises = self.dados[self.coluna_pais].to_numpy()[
+                np.searchsorted(self.grupos, primeiro.index.to_numpy())
+            ]
+            return pd.DataFrame({
+                'ano_inicial': primeiro['ano'].to_numpy(),
+                'ano_final': ultimo['ano'].to_numpy(),
+                'valor_inicial': primeiro['valor'].to_numpy(),
+                'valor_final': ultimo['valor'].to_numpy(),
+                'cagr': taxa.to_numpy(),
+            }, index=pd.Index(paises, name=self.coluna_pais))
+        return self._memorizado(('cagr', variavel, ano_inicial, ano_final), calcular)
+
+    @instrumentar
+    def media_movel(self, variavel: str, janela: int, min_observacoes: int = 1):
+        """
+        Média móvel por país sobre uma janela de anos (e não de linhas).
+
+        A janela de uma linha do ano t cobre as observações do mesmo país em (t - janela, t].
+        Com dados quinquenais, uma janela de 10 anos usa 2 observações; com dados anuais, 10.
+
+        Args:
+            variavel (str): Coluna analisada (ex.: 'Life expectation').
+            janela (int): Tamanho da janela em anos.
+            min_observacoes (int): Mínimo de observações não nulas na janela. Padrão é 1.
+
+        Returns:
+            pd.Series: Média móvel indexada por (país, ano).
+        """
+        def calcular():
+            valores = self._valores(variavel)
+            validos = ~np.isnan(valores)
+            soma = np.concatenate([[0.0], np.cumsum(np.where(validos, valores, 0.0))])
+            contagem = np.concatenate([[0], np.cumsum(validos)])
+            chaves = chave_pais_ano(self.grupos, self.anos)
+            inicio = np.searchsorted(chaves, chave_pais_ano(self.grupos, self.anos - janela + 1), side='left')
+            fim = np.arange(1, len(valores) + 1)
+            n = contagem[fim] - contagem[inicio]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                media = (soma[fim] - soma[inicio]) / n
+            media[n < max(min_observacoes, 1)] = np.nan
+            return pd.Series(media, index=self.indice, name=f'media_movel_{janela}_{variavel}')
+        return self._memorizado(('media_movel', variavel, janela, min_observacoes), calcular)
+
+    @instrumentar
+    def ranking_continente(self, variavel: str, maior_primeiro: bool = True):
+        """
+        Posição de cada país dentro do seu continente em cada ano (1 = melhor).
+
+        Returns:
+            pd.Series: Ranking indexado por (país, ano); NaN onde a variável é nula.
+        """
+        def calcular():
+            grupos = self.dados.groupby([self.coluna_continente, self.coluna_ano], observed=True, sort=False)
+            ranking = grupos[variavel].rank(method='min', ascending=not maior_primeiro)
+            return pd.Series(ranking.to_numpy(), index=self.indice, name=f'ranking_{variavel}')
+        return self._memorizado(('ranking', variavel, maior_primeiro), calcular)
+
+    def calcular(self, pedidos: list):
+        """
+        Calcula vários indicadores e retorna só as colunas pedidas, lado a lado.
+
+        Args:
+            pedidos (list): Tuplas (indicador, variavel, *parâmetros), com indicador em
+                'crescimento', 'media_movel' ou 'ranking_continente'.
+                Ex.: [('crescimento', 'gdpPercap'), ('media_movel', 'Life expectation', 10)].
+
+        Returns:
+            pd.DataFrame: Uma coluna por pedido, indexado por (país, ano).
+        """
+        series = []
+        for indicador, variavel, *parametros in pedidos:
+            if indicador not in ('crescimento', 'media_movel', 'ranking_continente'):
+                print(f"Indicador inválido: {indicador}")
+                continue
+            series.append(getattr(self, indicador)(variavel, *parametros))
+        return pd.concat(series, axis=1) if series else pd.DataFrame(index=self.indice)
+
+    def limpar_memoria(self):
+        # Descarta os resultados memorizados (ex.: depois de alterar self.dados)
+        self._memo.clear()
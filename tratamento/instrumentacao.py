@@ -0,0 +1,251 @@
+"""
+Instrumentação das chamadas de tratamento e graficos: tempo, linhas, memória e cache.
+
+Desligada por padrão: cada função decorada com @instrumentar custa apenas um teste de
+variável global por chamada. Com ativar(...), cada chamada gera um registro (dict) enviado
+aos destinos configurados (logging, arquivo JSON lines, buffer em memória).
+
+Uso:
+    from tratamento import instrumentacao
+    memoria = instrumentacao.DestinoMemoria()
+    instrumentacao.ativar(memoria, instrumentacao.DestinoJSONL('execucao.jsonl'))
+    ...
+    print(memoria.resumo())
+    instrumentacao.desativar()
+"""
+
+import collections
+import functools
+import json
+import logging
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+_ativo = False
+_destinos = []
+_medir_memoria = False
+_pilha = threading.local()  # registros abertos na thread atual (chamadas aninhadas)
+_trava_destinos = threading.Lock()
+
+
+class DestinoLogging:
+    """Envia cada registro ao módulo logging (logger 'puc.instrumentacao' por padrão)."""
+
+    def __init__(self, logger='puc.instrumentacao', nivel=logging.INFO):
+        self.logger = logging.getLogger(logger) if isinstance(logger, str) else logger
+        self.nivel = nivel
+
+    def __call__(self, registro):
+        self.logger.log(
+            self.nivel,
+            '%s%s %.4f s linhas %s -> %s',
+            '  ' * registro['profundidade'], registro['nome'], registro['segundos'],
+            registro['linhas_entrada'], registro['linhas_saida'],
+            extra={'instrumentacao': registro},
+        )
+
+
+class DestinoJSONL:
+    """Acrescenta cada registro como uma linha JSON no arquivo informado."""
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        self._trava = threading.Lock()
+
+    def __call__(self, registro):
+        linha = json.dumps(registro, ensure_ascii=False, default=str)
+        with self._trava, open(self.caminho, 'a', encoding='utf-8') as arquivo:
+            arquivo.write(linha + '\n')
+
+
+class DestinoMemoria:
+    """Guarda os últimos 'capacidade' registros em um buffer circular."""
+
+    def __init__(self, capacidade=10_000):
+        self.buffer = collections.deque(maxlen=capacidade)
+
+    def __call__(self, registro):
+        self.buffer.append(registro)
+
+    def registros(self):
+        return list(self.buffer)
+
+    def limpar(self):
+        self.buffer.clear()
+
+    def resumo(self):
+        """
+        Tempo total, número de chamadas e linhas por função, da mais cara para a mais barata.
+
+        Returns:
+            pd.DataFrame: nome, chamadas, segundos, segundos_medio, linhas_entrada, linhas_saida,
+            bytes_alocados (máximo), acertos_cache e falhas_cache.
+        """
+        import pandas as pd
+        df = pd.DataFrame(self.registros(), columns=[
+            'nome', 'segundos', 'linhas_entrada', 'linhas_saida', 'bytes_alocados', 'acertos_cache', 'falhas_cache',
+        ])
+        resumo = df.groupby('nome').agg(
+            chamadas=('segundos', 'size'),
+            segundos=('segundos', 'sum'),
+            segundos_medio=('segundos', 'mean'),
+            linhas_entrada=('linhas_entrada', 'sum'),
+            linhas_saida=('linhas_saida', 'sum'),
+            bytes_alocados=('bytes_alocados', 'max'),
+            acertos_cache=('acertos_cache', 'sum'),
+            falhas_cache=('falhas_cache', 'sum'),
+        )
+        return resumo.sort_values('segundos', ascending=False).reset_index()
+
+
+def ativar(*destinos, memoria=False):
+    """
+    Liga a instrumentação.
+
+    Args:
+        *destinos: Funções que recebem cada registro (ex.: DestinoMemoria()). Sem destinos, usa DestinoLogging().
+        memoria (bool): Se True, mede o pico de memória alocada em cada chamada com tracemalloc
+            (deixa a execução sensivelmente mais lenta).
+    """
+    global _ativo, _medir_memoria
+    with _trava_destinos:
+        _destinos[:] = list(destinos) or [DestinoLogging()]
+    _medir_memoria = memoria
+    if memoria and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    _ativo = True
+
+
+def desativar():
+    # Desliga a instrumentação e remove os destinos
+    global _ativo, _medir_memoria
+    _ativo = False
+    if _medir_memoria and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _medir_memoria = False
+    with _trava_destinos:
+        _destinos.clear()
+
+
+def ativo():
+    return _ativo
+
+
+def _linhas(objeto):
+    # Número de linhas de um DataFrame/Series/array, soma para tuplas e listas deles; None para o resto
+    if isinstance(objeto, (tuple, list)):
+        partes = [_linhas(parte) for parte in objeto]
+        partes = [parte for parte in partes if parte is not None]
+        return sum(partes) if partes else None
+    forma = getattr(objeto, 'shape', None)
+    if isinstance(forma, tuple) and forma:
+        return int(forma[0])
+    return None
+
+
+def _abertos():
+    if not hasattr(_pilha, 'registros'):
+        _pilha.registros = []
+    return _pilha.registros
+
+
+def registrar_cache(acerto):
+    """Conta um acerto (True) ou falha (False) de cache na chamada instrumentada em andamento."""
+    if not _ativo:
+        return
+    abertos = _abertos()
+    if abertos:
+        abertos[-1]['acertos_cache' if acerto else 'falhas_cache'] += 1
+
+
+def _emitir(registro):
+    with _trava_destinos:
+        destinos = list(_destinos)
+    for destino in destinos:
+        try:
+            destino(registro)
+        except Exception as erro:
+            logging.getLogger('puc.instrumentacao').warning('Falha no destino %r: %s', destino, erro)
+
+
+@contextmanager
+def medir(nome, linhas_entrada=None, **campos):
+    """
+    Instrumenta um bloco de código. O registro (dict) é entregue ao bloco e pode ser completado
+    (ex.: registro['linhas_saida'] = len(df)). Sem instrumentação ativa, entrega None.
+
+    Args:
+        nome (str): Nome do registro (ex.: 'pipeline.painel').
+        linhas_entrada (int): Linhas de entrada, se conhecidas.
+        **campos: Campos extras copiados para o registro.
+    """
+    if not _ativo:
+        yield None
+        return
+    abertos = _abertos()
+    registro = {
+        'nome': nome,
+        'inicio': time.time(),
+        'segundos': None,
+        'profundidade': len(abertos),
+        'linhas_entrada': linhas_entrada,
+        'linhas_saida': None,
+        'bytes_alocados': None,
+        'acertos_cache': 0,
+        'falhas_cache': 0,
+        'erro': None,
+        **campos,
+    }
+    memoria = _medir_memoria and tracemalloc.is_tracing()
+    if memoria:
+        atual, pico = tracemalloc.get_traced_memory()
+        if abertos:
+            abertos[-1]['_pico'] = max(abertos[-1]['_pico'], pico)
+        tracemalloc.reset_peak()
+        registro['_base'] = registro['_pico'] = atual
+    abertos.append(registro)
+    inicio = time.perf_counter()
+    try:
+        yield registro
+    except BaseException as erro:
+        registro['erro'] = f'{type(erro).__name__}: {erro}'
+        raise
+    finally:
+        registro['segundos'] = time.perf_counter() - inicio
+        abertos.pop()
+        if memoria:
+            pico = max(registro.pop('_pico'), tracemalloc.get_traced_memory()[1])
+            registro['bytes_alocados'] = pico - registro.pop('_base')
+            if abertos and '_pico' in abertos[-1]:
+                abertos[-1]['_pico'] = max(abertos[-1]['_pico'], pico)
+            tracemalloc.reset_peak()
+        _emitir(registro)
+
+
+def instrumentar(funcao=None, *, nome=None):
+    """
+    Decorador: registra tempo, linhas de entrada (DataFrames/Series nos argumentos), linhas de
+    saída, memória e acertos de cache de cada chamada quando a instrumentação está ativa.
+
+    Uso: @instrumentar ou @instrumentar(nome='graficos.comparando_cont').
+    """
+    if funcao is None:
+        return functools.partial(instrumentar, nome=nome)
+    rotulo = nome or f'{funcao.__module__.split(".")[0]}.{funcao.__qualname__}'
+
+    @functools.wraps(funcao)
+    def envoltorio(*args, **kwargs):
+        if not _ativo:
+            return funcao(*args, **kwargs)
+        entrada = _linhas([*args, *kwargs.values()])
+        with medir(rotulo, linhas_entrada=entrada) as registro:
+            resultado = funcao(*args, **kwargs)
+            # desativar() em outra thread entre o teste acima e o de medir: o registro vem None
+            if registro is not None:
+                registro['linhas_saida'] = _linhas(resultado)
+            return resultado
+
+    return envoltorio
@@ -0,0 +1,368 @@
+"""Montagem e alinhamento de anos do painel (country, year)."""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from .esquemas import import_data_otimizado
+from .instrumentacao import instrumentar
+from .paises import resolvedor_padrao
+
+
+# --- Montagem do painel (country, year) a partir de várias bases ---
+# Chave inteira única (ID do país, ano): ID * _BASE_ANO + (ano + _DESLOCAMENTO_ANO).
+# Suporta anos entre -524288 e 524287 (o OWID chega a -10000).
+_BASE_ANO = 1 << 20
+_DESLOCAMENTO_ANO = 1 << 19
+
+# Bases do projeto: arquivo, colunas de chave e colunas de interesse (original -> nome no painel).
+# 'atributos' são colunas constantes por país (ex.: continente), propagadas para todos os anos;
+# 'recodificar' ({atributo: {valor original: valor no painel}}) traduz os valores de um atributo.
+# Continentes do OWID -> taxonomia do gapminder (Americas única, sem Antarctica), para que o
+# atributo 'continent' tenha uma só classificação em todas as fontes.
+MAPA_CONTINENTES_OWID = {'North America': 'Americas', 'South America': 'Americas', 'Antarctica': None}
+
+FONTES_PROJETO = {
+    'gapminder': {
+        'arquivo': 'gapminder_full.csv',
+        'pais': 'country',
+        'ano': 'year',
+        'colunas': {'pop': 'population', 'lifeExp': 'Life expectation', 'gdpPercap': 'gdpPercap'},
+        'atributos': {'continent': 'continent'},
+    },
+    'idh': {
+        'arquivo': 'human-development-index.csv',
+        'pais': 'Entity',
+        'ano': 'Year',
+        'codigo': 'Code',
+        'colunas': {'Human Development Index (UNDP)': 'IDH'},
+    },
+    'escolaridade_esperada': {
+        'arquivo': 'expected-years-of-schooling.csv',
+        'pais': 'Entity',
+        'ano': 'Year',
+        'codigo': 'Code',
+        'colunas': {'Expected Years of Schooling (years)': 'Anos estudo'},
+    },
+    'escolaridade_media': {
+        'arquivo': 'mean-years-of-schooling-long-run.csv',
+        'pais': 'Entity',
+        'ano': 'Year',
+        'codigo': 'Code',
+        'colunas': {
+            'Average Total Years of Schooling for Adult Population (Lee-Lee (2016), Barro-Lee (2018) and UNDP (2018))':
+                'Media anos estudo',
+        },
+    },
+    'renda_nacional': {
+        'arquivo': 'gross-national-income-per-capita.csv',
+        'pais': 'Entity',
+        'ano': 'Year',
+        'codigo': 'Code',
+        'colunas': {'GNI per capita, PPP (constant 2017 international $)': 'RNB per capita'},
+    },
+    'idh_historico': {
+        'arquivo': 'human-development-index-escosura.csv',
+        'pais': 'Entity',
+        'ano': 'Year',
+        'codigo': 'Code',
+        'colunas': {'Historical Index of Human Development (Prados de la Escosura)': 'IDH historico'},
+    },
+    'idh_vs_pib': {
+        'arquivo': 'hdi-vs-gdp-per-capita.csv',
+        'pais': 'Entity',
+        'ano': 'Year',
+        'codigo': 'Code',
+        'colunas': {
+            'Historical Index of Human Development (Prados de la Escosura)': 'IDH historico',
+            'GDP per capita': 'PIB per capita',
+            'Population (historical estimates)': 'Populacao historica',
+        },
+        'atributos': {'Continent': 'continent'},
+        'recodificar': {'continent': MAPA_CONTINENTES_OWID},
+    },
+    'idh_sem_pib_vs_pib': {
+        'arquivo': 'hihd-without-gdp-vs-gdp-per-capita.csv',
+        'pais': 'Entity',
+        'ano': 'Year',
+        'codigo': 'Code',
+        'colunas': {
+            'Historical Index of Human Development (without GDP metric)': 'IDH historico sem PIB',
+            'GDP per capita': 'PIB per capita',
+            'Population (historical estimates)': 'Populacao historica',
+        },
+        'atributos': {'Continent': 'continent'},
+        'recodificar': {'continent': MAPA_CONTINENTES_OWID},
+    },
+    'idh_vs_idh_historico': {
+        'arquivo': 'hdi-vs-hihd.csv',
+        'pais': 'Entity',
+        'ano': 'Year',
+        'codigo': 'Code',
+        'colunas': {
+            'Human Development Index (UNDP)': 'IDH',
+            'Historical Index of Human Development (Prados de la Escosura)': 'IDH historico',
+            'Population (historical estimates)': 'Populacao historica',
+        },
+        'atributos': {'Continent': 'continent'},
+        'recodificar': {'continent': MAPA_CONTINENTES_OWID},
+    },
+    'comparacao_idh': {
+        'arquivo': 'human-development-index-comparison.csv',
+        'pais': 'Entity',
+        'ano': 'Year',
+        'codigo': 'Code',
+        'colunas': {
+            'Historical Index of Human Development (Prados de la Escosura)': 'IDH historico',
+            'Historical Index of Human Development (without GDP metric)': 'IDH historico sem PIB',
+            'Population (historical estimates)': 'Populacao historica',
+        },
+        'atributos': {'Continent': 'continent'},
+        'recodificar': {'continent': MAPA_CONTINENTES_OWID},
+    },
+}
+
+
+def fontes_projeto(nomes=None, pasta='.'):
+    """
+    Monta a lista de fontes de montar_painel a partir de FONTES_PROJETO.
+
+    Args:
+        nomes (list): Nomes das fontes em FONTES_PROJETO. Padrão: todas.
+        pasta (str): Pasta onde estão os CSVs. Padrão é '.'.
+
+    Returns:
+        list: Lista de dicionários de fonte, com 'dados' apontando para o caminho do CSV.
+    """
+    fontes = []
+    for nome in (nomes or FONTES_PROJETO):
+        fonte = dict(FONTES_PROJETO[nome])
+        fonte['dados'] = os.path.join(pasta, fonte.pop('arquivo'))
+        fonte['nome'] = nome
+        fontes.append(fonte)
+    return fontes
+
+
+def chave_pais_ano(ids, anos):
+    # Codifica (ID do país, ano) em um único int64; a ordem da chave é a ordem (ID, ano)
+    return np.asarray(ids, dtype=np.int64) * _BASE_ANO + (np.asarray(anos, dtype=np.int64) + _DESLOCAMENTO_ANO)
+
+
+def decodificar_chave(chaves):
+    # Inverso de chave_pais_ano: retorna (ids, anos)
+    chaves = np.asarray(chaves, dtype=np.int64)
+    return chaves // _BASE_ANO, chaves % _BASE_ANO - _DESLOCAMENTO_ANO
+
+
+def _preparar_fonte(fonte, resolvedor, anos, cache):
+    # Carrega uma fonte e devolve (medidas indexadas pela chave, {atributo: Série por ID})
+    dados = fonte['dados']
+    if isinstance(dados, str):
+        dados = import_data_otimizado(dados, cache=cache)
+    colunas = fonte['colunas']
+    if not isinstance(colunas, dict):
+        colunas = {c: c for c in colunas}
+
+    ids = resolvedor.resolver(dados[fonte['pais']], dados[fonte['codigo']] if fonte.get('codigo') else None)
+    ano = pd.to_numeric(dados[fonte['ano']], errors='coerce').to_numpy(dtype='float64')
+    validas = (ids >= 0) & ~np.isnan(ano)
+    if anos is not None:
+        validas &= (ano >= anos[0]) & (ano <= anos[1])
+
+    chaves = chave_pais_ano(ids[validas], ano[validas])
+    medidas = dados.loc[validas, list(colunas)].rename(columns=colunas)
+    medidas.index = pd.Index(chaves, name='chave')
+    medidas = medidas[~medidas.index.duplicated(keep='first')]
+
+    atributos = {}
+    for original, nome in fonte.get('atributos', {}).items():
+        serie = pd.Series(dados[original].to_numpy()[validas], index=ids[validas])
+        recodificacao = fonte.get('recodificar', {}).get(nome)
+        if recodificacao:
+            serie = serie.map(lambda valor: recodificacao.get(valor, valor))
+        serie = serie.dropna()
+        atributos[nome] = serie[~serie.index.duplicated(keep='first')]
+    return medidas, atributos
+
+
+@instrumentar
+def montar_painel(fontes, resolvedor=None, como='outer', anos=None, cache=False):
+    """
+    Junta várias bases em um único painel largo indexado por (country, year).
+
+    Cada fonte é resolvida para a chave inteira (ID do país, ano) com o ResolvedorPaises e todas
+    são unidas em um único join de N vias (pd.concat sobre a chave), sem cópias intermediárias
+    de merges dois a dois. Colunas com o mesmo nome em fontes diferentes são combinadas: vale o
+    valor da primeira fonte e as lacunas são preenchidas pelas seguintes.
+
+    Args:
+        fontes (list): Lista de dicionários com as chaves:
+            'dados' (pd.DataFrame ou caminho do CSV), 'pais' (coluna de país), 'ano' (coluna de ano),
+            'colunas' (lista ou dict original -> nome no painel), 'codigo' (coluna ISO3, opcional),
+            'atributos' (dict de colunas constantes por país, ex.: {'continent': 'continent'}, opcional) e
+            'recodificar' (dict {atributo: {valor original: valor no painel}}, opcional).
+            Veja fontes_projeto para as bases do projeto.
+        resolvedor (ResolvedorPaises): Índice de harmonização. Padrão é resolvedor_padrao().
+        como (str): 'outer' (todas as combinações país/ano) ou 'inner' (apenas as presentes em todas).
+        anos (tuple): (ano_inicial, ano_final) para filtrar as fontes antes do join, opcional.
+        cache (bool): Repassado para import_data quando 'dados' é um caminho.
+
+    Returns:
+        pd.DataFrame: Painel com MultiIndex ordenado (country, year), atributos e medidas como colunas.
+    """
+    if como not in ('outer', 'inner'):
+        print("Parâmetro 'como' inválido. Use 'outer' ou 'inner'.")
+        return
+    if resolvedor is None:
+        resolvedor = resolvedor_padrao()
+    preparadas = [_preparar_fonte(fonte, resolvedor, anos, cache) for fonte in fontes]
+    return _juntar_fontes(preparadas, resolvedor, como)
+
+
+def _juntar_fontes(preparadas, resolvedor, como):
+    # Join das fontes já preparadas [(medidas, atributos), ...] no painel (country, year)
+    partes = []
+    atributos = {}
+    vistas = {}
+    repetidas = []
+    for medidas, atributos_fonte in preparadas:
+        renomear = {}
+        for coluna in medidas.columns:
+            if coluna in vistas:
+                temporaria = f'{coluna}__{len(repetidas)}'
+                renomear[coluna] = temporaria
+                repetidas.append((coluna, temporaria))
+            vistas[coluna] = True
+        partes.append(medidas.rename(columns=renomear) if renomear else medidas)
+        for nome, serie in atributos_fonte.items():
+            atributos[nome] = serie if nome not in atributos else atributos[nome].combine_first(serie)
+
+    # Join único de N vias sobre a chave (ID, ano)
+    painel = pd.concat(partes, axis=1, join=como, sort=True)
+    for coluna, temporaria in repetidas:
+        painel[coluna] = painel[coluna].fillna(painel.pop(temporaria))
+
+    ids, anos_painel = decodificar_chave(painel.index.to_numpy())
+    for nome, serie in atributos.items():
+        painel.insert(0, nome, pd.Categorical(serie.reindex(ids).to_numpy()))
+
+    nomes = np.asarray(resolvedor.nomes, dtype=object)
+    painel.index = pd.MultiIndex.from_arrays(
+        [pd.Categorical(nomes[ids]), anos_painel.astype('int16')],
+        names=['country', 'year'],
+    )
+    return painel.sort_index()
+
+
+# --- Alinhamento de anos (reamostragem do painel para uma grade comum) ---
+def _vizinhos(chaves_obs, grupos_obs, chaves_alvo, grupos_alvo):
+    # Para cada chave alvo, posição da observação à esquerda (<=) e à direita (>=) no mesmo grupo.
+    # Retorna (esq, dir) com -1 quando não há vizinho no mesmo país.
+    direita = np.searchsorted(chaves_obs, chaves_alvo, side='left')
+    esquerda = np.searchsorted(chaves_obs, chaves_alvo, side='right') - 1
+    n = len(chaves_obs)
+    dir_ok = direita < n
+    dir_ok[dir_ok] = grupos_obs[direita[dir_ok]] == grupos_alvo[dir_ok]
+    esq_ok = esquerda >= 0
+    esq_ok[esq_ok] = grupos_obs[esquerda[esq_ok]] == grupos_alvo[esq_ok]
+    return np.where(esq_ok, esquerda, -1), np.where(dir_ok, direita, -1)
+
+
+@instrumentar
+def alinhar_anos(df, anos_alvo, metodo='linear', colunas=None, coluna_pais='country', coluna_ano='year',
+                 tolerancia=None):
+    """
+    Reamostra um painel país/ano para uma grade de anos comum, para todos os países de uma vez.
+
+    A interpolação é feita com searchsorted sobre a chave (país, ano) ordenada, sem laços por país:
+    para cada (país, ano alvo) localiza as observações vizinhas do mesmo país e calcula o valor.
+    Não há extrapolação: fora do intervalo observado de um país o resultado é NaN
+    (exceto 'step', que repete o último valor observado).
+
+    Args:
+        df (pd.DataFrame): Painel com colunas de país e ano, ou indexado por (country, year)
+            como o retornado por montar_painel.
+        anos_alvo (iterable): Anos da grade de destino (ex.: range(1952, 2008, 5)).
+        metodo (str): 'linear', 'nearest' (observação mais próxima) ou 'step' (último valor observado).
+        colunas (list): Colunas numéricas a reamostrar. Padrão: todas as numéricas.
+        coluna_pais (str): Nome da coluna (ou nível do índice) de país. Padrão é 'country'.
+        coluna_ano (str): Nome da coluna (ou nível do índice) de ano. Padrão é 'year'.
+        tolerancia (int): Distância máxima, em anos, até a observação usada. Padrão: sem limite.
+
+    Returns:
+        pd.DataFrame: Painel na grade de anos, no mesmo formato (colunas ou índice) da entrada.
+            Colunas não numéricas (ex.: continente) recebem o primeiro valor de cada país.
+    """
+    if metodo not in ('linear', 'nearest', 'step'):
+        print("Método inválido. Use 'linear', 'nearest' ou 'step'.")
+        return
+
+    indexado = coluna_pais in (df.index.names or []) and coluna_ano in (df.index.names or [])
+    dados = df.reset_index() if indexado else df
+    if colunas is None:
+        colunas = [c for c in dados.select_dtypes('number').columns if c != coluna_ano]
+
+    # Ordena uma única vez por (país, ano)
+    grupos_linhas, paises = pd.factorize(dados[coluna_pais], sort=True)
+    paises = np.asarray(paises, dtype=object)
+    anos = dados[coluna_ano].to_numpy(dtype='int64')
+    chaves = chave_pais_ano(grupos_linhas, anos)
+    ordem = np.argsort(chaves, kind='stable')
+    chaves, grupos, anos = chaves[ordem], grupos_linhas[ordem], anos[ordem]
+
+    # Grade de destino: todos os países x todos os anos alvo
+    anos_alvo = np.unique(np.asarray(list(anos_alvo), dtype='int64'))
+    grupos_alvo = np.repeat(np.arange(len(paises)), len(anos_alvo))
+    anos_grade = np.tile(anos_alvo, len(paises))
+    chaves_alvo = chave_pais_ano(grupos_alvo, anos_grade)
+
+    resultado = {}
+    for coluna in colunas:
+        valores = dados[coluna].to_numpy(dtype='float64', na_value=np.nan)[ordem]
+        validos = ~np.isnan(valores)
+        if not validos.any():
+            # Coluna sem nenhuma observação: não há vizinhos para indexar
+            resultado[coluna] = np.full(len(chaves_alvo), np.nan)
+            continue
+        ch, gr, an, va = chaves[validos], grupos[validos], anos[validos], valores[validos]
+        esq, dir_ = _vizinhos(ch, gr, chaves_alvo, grupos_alvo)
+        tem_esq, tem_dir = esq >= 0, dir_ >= 0
+        dist_esq = np.where(tem_esq, anos_grade - an[esq], np.inf)
+        dist_dir = np.where(tem_dir, an[dir_] - anos_grade, np.inf)
+        v_esq = np.where(tem_esq, va[esq], np.nan)
+        v_dir = np.where(tem_dir, va[dir_], np.nan)
+
+        if metodo == 'step':
+            saida, distancia = v_esq, dist_esq
+        elif metodo == 'nearest':
+            usar_dir = dist_dir < dist_esq
+            saida = np.where(usar_dir, v_dir, v_esq)
+            distancia = np.minimum(dist_esq, dist_dir)
+        else:
+            intervalo = dist_esq + dist_dir
+            with np.errstate(invalid='ignore', divide='ignore'):
+                peso = np.where(intervalo > 0, dist_esq / intervalo, 0.0)
+            saida = v_esq + (v_dir - v_esq) * peso  # NaN se faltar um dos lados
+            distancia = np.minimum(dist_esq, dist_dir)
+        if tolerancia is not None:
+            saida = np.where(distancia <= tolerancia, saida, np.nan)
+        resultado[coluna] = saida
+
+    alinhado = pd.DataFrame(resultado)
+    # Colunas não numéricas (constantes por país) recebem o primeiro valor de cada país
+    outras = [
+        c for c in dados.columns
+        if c not in (coluna_pais, coluna_ano) and not pd.api.types.is_numeric_dtype(dados[c])
+    ]
+    for coluna in outras:
+        primeiro = dados[coluna].groupby(grupos_linhas, observed=True).first()
+        alinhado.insert(0, coluna, primeiro.reindex(grupos_alvo).to_numpy())
+        if isinstance(dados[coluna].dtype, pd.CategoricalDtype):
+            alinhado[coluna] = alinhado[coluna].astype(dados[coluna].dtype)
+    alinhado.insert(0, coluna_ano, anos_grade.astype(dados[coluna_ano].dtype))
+    alinhado.insert(0, coluna_pais, pd.Categorical.from_codes(grupos_alvo, paises))
+
+    if indexado:
+        return alinhado.set_index([coluna_pais, coluna_ano])
+    return alinhado
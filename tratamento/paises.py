@@ -0,0 +1,262 @@
+"""Harmonização de nomes de países e integração de bases por país."""
+
+import numpy as np
+import pandas as pd
+
+from .instrumentacao import instrumentar
+
+
+def substituir_por_unicos(serie, mapa: dict):
+    # Equivalente a serie.replace(mapa), mas aplica o mapa apenas aos valores distintos
+    # e depois reconstrói a série a partir dos códigos (custo proporcional ao nº de valores únicos)
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        categorias = serie.cat.categories.to_series().replace(mapa)
+        if categorias.is_unique:
+            return serie.cat.rename_categories(categorias.to_numpy())
+        codigos, unicos = serie.cat.codes.to_numpy(), categorias.to_numpy()
+    else:
+        codigos, unicos = pd.factorize(serie, use_na_sentinel=True)
+        unicos = pd.Series(unicos).replace(mapa).to_numpy()
+    valores = unicos.take(codigos, mode='clip').astype(object)
+    valores[codigos < 0] = np.nan
+    novo = pd.Series(valores, index=serie.index, name=serie.name)
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        novo = novo.astype('category')
+    return novo
+
+
+@instrumentar
+def renomeando_gp (df, nomes:dict):
+    df.rename(columns={'pop' : 'population', 'lifeExp' : 'Life expectation', 'gdpPercap' : 'Gold per capta'}, inplace= True)
+    df['country'] = substituir_por_unicos(df['country'], nomes)
+    return df
+
+
+# --- Harmonização de nomes de países ---
+# Mapeamento de correção de nomes (harmonização manual): apelido -> nome canônico
+MAPA_PAISES = {
+    'Congo Dem. Rep' : 'Congo Democratic Republic',
+    'Democratic Republic of Congo' : 'Congo Democratic Republic',
+    'Korea' : 'North Korea',
+    'Congo Rep' : 'Congo Republic',
+    'Hong Kong China' : 'Hong Kong',
+    ' Korea Dem. Rep.' : 'North Korea',  # grafia original, com espaço (usada por renomeando_gp)
+    'Korea Dem. Rep.' : 'North Korea',
+    'Korea Rep.' : 'South Korea',
+    'Yemen Rep.' : 'Yemen Republic',
+    'Yemen' : 'Yemen Republic'
+}
+
+
+def _normalizar_nome(nome):
+    # Padronização de case (minúsculas) e limpeza de espaços
+    return str(nome).lower().strip()
+
+
+class ResolvedorPaises:
+    """
+    Índice de harmonização de países: resolve nomes (e códigos ISO3) para um ID inteiro canônico.
+
+    O índice é montado uma única vez a partir do mapa de apelidos. A resolução de uma coluna
+    consulta o dicionário apenas para os valores distintos e depois espalha o ID para as linhas,
+    então o custo depende do número de países, não do número de registros. Nomes novos recebem
+    um ID novo; quando o código ISO3 é informado, nomes diferentes com o mesmo código (ex.:
+    'Korea, Rep.' no WDI e 'South Korea' no OWID) recebem o mesmo ID.
+
+    Args:
+        mapa (dict): Apelido -> nome canônico. Padrão é MAPA_PAISES.
+        codigos (dict): Código ISO3 -> nome canônico, opcional.
+    """
+
+    def __init__(self, mapa=None, codigos=None):
+        self.nomes = []        # ID -> nome canônico (grafia da primeira ocorrência)
+        self._por_nome = {}    # nome normalizado -> ID
+        self._por_codigo = {}  # código ISO3 -> ID
+        for apelido, canonico in (MAPA_PAISES if mapa is None else mapa).items():
+            self.adicionar_apelido(apelido, canonico)
+        for codigo, canonico in (codigos or {}).items():
+            self._por_codigo[str(codigo).strip().upper()] = self.registrar(canonico)
+
+    def __len__(self):
+        return len(self.nomes)
+
+    def copiar(self):
+        # Cópia independente: nomes e apelidos registrados nela não alteram o original
+        copia = type(self)(mapa={})
+        copia.nomes = list(self.nomes)
+        copia._por_nome = dict(self._por_nome)
+        copia._por_codigo = dict(self._por_codigo)
+        return copia
+
+    def registrar(self, nome):
+        # Retorna o ID do nome, criando um novo ID se ele ainda não existir
+        chave = _normalizar_nome(nome)
+        pais_id = self._por_nome.get(chave)
+        if pais_id is None:
+            pais_id = len(self.nomes)
+            self.nomes.append(str(nome).strip())
+            self._por_nome[chave] = pais_id
+        return pais_id
+
+    def adicionar_apelido(self, apelido, canonico):
+        # Faz o apelido apontar para o mesmo ID do nome canônico
+        pais_id = self.registrar(canonico)
+        self._por_nome[_normalizar_nome(apelido)] = pais_id
+        return pais_id
+
+    def id_de(self, nome, codigo=None):
+        """
+        Resolve um único nome (e código, se houver) para o ID canônico, registrando-o se for novo.
+
+        O registro (inclusive o apelido criado quando o código ISO3 já é conhecido) fica neste
+        resolvedor; use resolvedor_padrao() ou copiar() para não afetar outras integrações.
+        """
+        if codigo is not None and not pd.isna(codigo):
+            codigo = str(codigo).strip().upper()
+            pais_id = self._por_codigo.get(codigo)
+            if pais_id is not None:
+                self._por_nome.setdefault(_normalizar_nome(nome), pais_id)
+                return pais_id
+        pais_id = self._por_nome.get(_normalizar_nome(nome))
+        if pais_id is None:
+            pais_id = self.registrar(nome)
+        if codigo is not None and not pd.isna(codigo):
+            self._por_codigo.setdefault(codigo, pais_id)
+        return pais_id
+
+    @instrumentar
+    def resolver(self, nomes, codigos=None):
+        """
+        Resolve uma coluna de nomes de país para IDs canônicos.
+
+        Args:
+            nomes (pd.Series): Coluna com os nomes dos países.
+            codigos (pd.Series): Coluna com os códigos ISO3 correspondentes, opcional.
+
+        Returns:
+            np.ndarray: Array int32 com o ID de cada linha (-1 para nomes ausentes).
+        """
+        if isinstance(nomes.dtype, pd.CategoricalDtype):
+            posicoes, unicos = nomes.cat.codes.to_numpy(), nomes.cat.categories.to_numpy()
+        else:
+            posicoes, unicos = pd.factorize(nomes, use_na_sentinel=True)
+        codigos_unicos = [None] * len(unicos)
+        if codigos is not None:
+            # Código da primeira linha de cada nome distinto
+            validas = posicoes >= 0
+            presentes, primeiras = np.unique(posicoes[validas], return_index=True)
+            valores_codigo = np.asarray(codigos)[validas][primeiras]
+            for posicao, codigo in zip(presentes, valores_codigo):
+                codigos_unicos[posicao] = codigo
+        ids_unicos = np.fromiter(
+            (self.id_de(nome, codigo) for nome, codigo in zip(unicos, codigos_unicos)),
+            dtype=np.int32,
+            count=len(unicos),
+        )
+        ids = np.append(ids_unicos, np.int32(-1)).take(posicoes)  # posição -1 (NaN) -> ID -1
+        return ids
+
+    def nomes_de(self, ids):
+        # Converte IDs para os nomes canônicos
+        return [self.nomes[i] for i in ids]
+
+
+_resolvedor_base = None
+
+
+def resolvedor_padrao():
+    # Resolvedor usado quando nenhum outro é informado: cópia do índice montado uma vez a partir
+    # de MAPA_PAISES, para que nomes e apelidos registrados em uma integração não mudem as seguintes
+    global _resolvedor_base
+    if _resolvedor_base is None:
+        _resolvedor_base = ResolvedorPaises()
+    return _resolvedor_base.copiar()
+
+
+# Função verifica se o pais esta presente em ambas as bases
+@instrumentar
+def integrar_dataframes_por_pais(df1, df2, coluna_pais_df1='country', coluna_pais_df2='country',
+                                 resolvedor=None, coluna_codigo_df1=None, coluna_codigo_df2=None, sugerir=False):
+    """
+    Harmoniza nomes de países, compara, imprime os ausentes/extras e retorna
+    ambos os DataFrames (df1 e df2) filtrados para conter APENAS os países que
+    estão na interseção de ambos.
+
+    Args:
+        df1 (pd.DataFrame): O DataFrame base.
+        df2 (pd.DataFrame): O DataFrame a ser integrado.
+        coluna_pais_df1 (str): Nome da coluna de país no df1. Padrão é 'country'.
+        coluna_pais_df2 (str): Nome da coluna de país no df2. Padrão é 'country'.
+        resolvedor (ResolvedorPaises): Índice de harmonização. Padrão é resolvedor_padrao().
+        coluna_codigo_df1 (str): Coluna com o código ISO3 no df1 (ex.: 'Code'), opcional.
+        coluna_codigo_df2 (str): Coluna com o código ISO3 no df2 (ex.: 'Country Code'), opcional.
+        sugerir (bool): Se True, imprime também candidatos de correspondência para os países do
+            DF2 ausentes no DF1 e os agregados (regiões) a descartar. Veja sugerir_correspondencias.
+
+    Returns:
+        (pd.DataFrame, pd.DataFrame): Uma tupla com (df1_filtrado, df2_filtrado).
+    """
+    if resolvedor is None:
+        resolvedor = resolvedor_padrao()
+
+    # --- 1. Resolução dos nomes para IDs canônicos (apenas sobre os valores distintos) ---
+    ids_df1 = resolvedor.resolver(
+        df1[coluna_pais_df1], df1[coluna_codigo_df1] if coluna_codigo_df1 else None
+    )
+    ids_df2 = resolvedor.resolver(
+        df2[coluna_pais_df2], df2[coluna_codigo_df2] if coluna_codigo_df2 else None
+    )
+
+    # --- 2. Criação de Conjuntos (Sets) de IDs ---
+    paises_df1 = set(np.unique(ids_df1[ids_df1 >= 0]).tolist())
+    paises_df2 = set(np.unique(ids_df2[ids_df2 >= 0]).tolist())
+
+    # --- 3. Cálculo da Interseção e Diferença ---
+    interc = paises_df1 & paises_df2
+    ausentes_df2 = paises_df1 - paises_df2  # Países em df1, mas não em df2
+    extras_df2 = paises_df2 - paises_df1    # Países em df2, mas não em df1
+
+    # --- 4. Impressão dos Países Ausentes/Extras ---
+    print("-" * 50)
+    print("ANÁLISE DE DATASETS PARA INTEGRAÇÃO")
+    print("-" * 50)
+    print(f"Número de Países na Interseção: {len(interc)}")
+
+    if ausentes_df2:
+        print(f"\nPaíses presentes no DF1, mas AUSENTES no DF2 ({len(ausentes_df2)}):")
+        print(sorted(resolvedor.nomes_de(ausentes_df2)))
+    else:
+        print("\n✅ Todos os países do DF1 estão presentes no DF2.")
+
+    if extras_df2:
+        print(f"\nPaíses presentes no DF2, mas AUSENTES no DF1 ({len(extras_df2)}):")
+        print(sorted(resolvedor.nomes_de(extras_df2)))
+    else:
+        print("\n✅ Todos os países do DF2 estão presentes no DF1.")
+
+    if sugerir and extras_df2:
+        from .correspondencia import sugerir_correspondencias
+        sugestoes = sugerir_correspondencias(
+            df2[coluna_pais_df2], df1[coluna_pais_df1], resolvedor=resolvedor,
+            codigos_origem=df2[coluna_codigo_df2] if coluna_codigo_df2 else None,
+        )
+        agregados = sugestoes.loc[sugestoes['agregado'], 'nome'].tolist()
+        candidatos = sugestoes[sugestoes['sugerido']]
+        if agregados:
+            print(f"\nAgregados/regiões no DF2 (podem ser descartados) ({len(agregados)}):")
+            print(agregados)
+        if not candidatos.empty:
+            print("\nCorrespondências sugeridas (DF2 -> DF1):")
+            for linha in candidatos.itertuples(index=False):
+                print(f"  {linha.nome} -> {linha.candidato} ({linha.pontuacao:.2f})")
+
+    print("-" * 50)
+
+    # --- 5. Filtragem de AMBOS os DataFrames (Usando a Interseção de IDs) ---
+    ids_interc = np.fromiter(interc, dtype=np.int32, count=len(interc))
+    df1_filtrado = df1[np.isin(ids_df1, ids_interc)].copy()
+    df2_filtrado = df2[np.isin(ids_df2, ids_interc)].copy()
+
+    print(f"Conclusão: DF1 e DF2 foram filtrados para a Interseção.")
+
+    return df1_filtrado, df2_filtrado
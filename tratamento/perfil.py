@@ -0,0 +1,198 @@
+"""Perfil dos dados: metadados, valores ausentes e duplicados."""
+
+import numpy as np
+import pandas as pd
+
+from .instrumentacao import instrumentar
+
+
+# --- Perfil dos dados (metadados, NaN e duplicados em uma passada) ---
+# Multiplicador usado para combinar os hashes das colunas em um hash por linha
+_MULT_HASH = np.uint64(0x100000001B3)
+# Número de menores hashes guardados pela estimativa aproximada de cardinalidade (KMV)
+_K_CARDINALIDADE = 2048
+# Estatísticas opcionais do perfil (tipo e nulos são sempre calculados)
+ESTATISTICAS = ('cardinalidade', 'extremos', 'memoria', 'duplicados')
+
+
+def _hash_coluna(serie):
+    # Hash uint64 por linha (categóricas são hasheadas pelas categorias e expandidas pelos códigos)
+    return pd.util.hash_pandas_object(serie, index=False).to_numpy()
+
+
+def _cardinalidade(serie, hashes, aproximado):
+    # Conta valores distintos; 'hashes' são os hashes da coluna já sem os nulos (só no modo aproximado)
+    if not aproximado or len(hashes) <= _K_CARDINALIDADE:
+        return int(serie.nunique())
+    # Estimativa KMV: com os k menores hashes distintos, n ~ (k - 1) / (k-ésimo hash / 2^64)
+    menores = np.unique(np.partition(hashes, _K_CARDINALIDADE)[:_K_CARDINALIDADE * 4])
+    if len(menores) < _K_CARDINALIDADE:
+        # Poucos valores distintos entre os menores hashes: a contagem exata por tabela de hash
+        # é linear e barata (sem ordenar todos os hashes)
+        return len(pd.unique(hashes))
+    kesimo = float(menores[_K_CARDINALIDADE - 1]) / 2.0 ** 64
+    return int(round((_K_CARDINALIDADE - 1) / kesimo))
+
+
+def _duplicados_por_hash(dataframe, hashes):
+    # Marca linhas repetidas a partir do hash por linha. Só as linhas cujo hash se repete
+    # são comparadas de fato, então o resultado é exato mesmo havendo colisão de hash.
+    candidatas = pd.Series(hashes).duplicated(keep=False).to_numpy()
+    duplicados = np.zeros(len(dataframe), dtype=bool)
+    if candidatas.any():
+        duplicados[candidatas] = dataframe[candidatas].duplicated().to_numpy()
+    return pd.Series(duplicados, index=dataframe.index)
+
+
+@instrumentar
+def perfilar_dataframe(dataframe, chaves=('country', 'year'), aproximado=False, estatisticas=ESTATISTICAS):
+    """
+    Gera o perfil do dataframe percorrendo cada coluna uma única vez.
+
+    Para cada coluna calcula tipo e nulos e, conforme 'estatisticas', cardinalidade, mínimo/máximo
+    e memória. Quando os duplicados são pedidos, o hash de cada coluna é calculado uma vez e
+    reaproveitado para a cardinalidade, para os registros duplicados e para as chaves duplicadas.
+    Estatísticas não pedidas não são calculadas (nem o hash das linhas, nem a memória profunda).
+
+    Args:
+        dataframe (pd.DataFrame): O DataFrame original.
+        chaves (tuple): Colunas que identificam um registro (ex.: país e ano). Colunas ausentes são ignoradas.
+        aproximado (bool): Se True, estima a cardinalidade (KMV) em vez de contar exatamente.
+            Útil em dataframes grandes.
+        estatisticas (tuple): Subconjunto de ESTATISTICAS a calcular ('cardinalidade', 'extremos',
+            'memoria', 'duplicados'). Por padrão, todas.
+
+    Returns:
+        dict: 'metadados' (tabela por coluna, no formato de gerar_metadados com as colunas extras
+        pedidas) e 'nan' (no formato de verificar_NaN). Com 'duplicados', também 'duplicados'
+        (máscara booleana das linhas repetidas), 'qtd_duplicados' e 'qtd_duplicados_chave'.
+
+    Raises:
+        ValueError: Se 'estatisticas' tiver um nome fora de ESTATISTICAS.
+    """
+    desconhecidas = set(estatisticas) - set(ESTATISTICAS)
+    if desconhecidas:
+        raise ValueError(f"Estatísticas desconhecidas: {sorted(desconhecidas)}. Use {ESTATISTICAS}.")
+    com_cardinalidade = 'cardinalidade' in estatisticas
+    com_extremos = 'extremos' in estatisticas
+    com_memoria = 'memoria' in estatisticas
+    com_duplicados = 'duplicados' in estatisticas
+
+    total = len(dataframe)
+    chaves = [c for c in chaves if c in dataframe.columns]
+    if com_duplicados:
+        hash_linha = np.zeros(total, dtype=np.uint64)
+        hash_chave = np.zeros(total, dtype=np.uint64)
+    linhas = []
+    for coluna in dataframe.columns:
+        serie = dataframe[coluna]
+        nulos = serie.isna().to_numpy()
+        qt_nulos = int(nulos.sum())
+        linha = {
+            'nome_variavel': coluna,
+            'tipo': serie.dtype,
+            'qt_nulos': qt_nulos,
+            'percent_nulos': round(qt_nulos / total * 100, 2) if total else 0.0,
+        }
+        hashes = None
+        if com_duplicados or (com_cardinalidade and aproximado):
+            hashes = _hash_coluna(serie)
+        if com_duplicados:
+            hash_linha = hash_linha * _MULT_HASH ^ hashes
+            if coluna in chaves:
+                hash_chave = hash_chave * _MULT_HASH ^ hashes
+        if com_cardinalidade:
+            linha['cardinalidade'] = _cardinalidade(serie, hashes[~nulos] if aproximado else None, aproximado)
+        if com_extremos:
+            minimo = maximo = None
+            if pd.api.types.is_numeric_dtype(serie) and not pd.api.types.is_bool_dtype(serie) and qt_nulos < total:
+                valores = serie.to_numpy(dtype='float64', na_value=np.nan)
+                minimo, maximo = np.nanmin(valores), np.nanmax(valores)
+            linha['minimo'], linha['maximo'] = minimo, maximo
+        if com_memoria:
+            linha['memoria_kb'] = round(serie.memory_usage(deep=True, index=False) / 1024, 2)
+        linhas.append(linha)
+    colunas = ['nome_variavel', 'tipo', 'qt_nulos', 'percent_nulos']
+    colunas += ['cardinalidade'] if com_cardinalidade else []
+    colunas += ['minimo', 'maximo'] if com_extremos else []
+    colunas += ['memoria_kb'] if com_memoria else []
+    metadados = pd.DataFrame(linhas, columns=colunas)
+
+    perfil = {'metadados': metadados, 'nan': _tabela_NaN(metadados)}
+    if com_duplicados:
+        duplicados = _duplicados_por_hash(dataframe, hash_linha)
+        qtd_duplicados_chave = 0
+        if chaves:
+            qtd_duplicados_chave = int(_duplicados_por_hash(dataframe[chaves], hash_chave).sum())
+        perfil.update({
+            'duplicados': duplicados,
+            'qtd_duplicados': int(duplicados.sum()),
+            'qtd_duplicados_chave': qtd_duplicados_chave,
+        })
+    return perfil
+
+
+def _contar_nulos(dataframe):
+    # Tabela mínima (nome_variavel, qt_nulos, percent_nulos) com uma única chamada a isna()
+    qt_nulos = dataframe.isna().sum()
+    return pd.DataFrame({
+        'nome_variavel': dataframe.columns,
+        'qt_nulos': qt_nulos.values,
+        'percent_nulos': round((qt_nulos / len(dataframe)) * 100, 2).values,
+    })
+
+
+def _tabela_NaN(metadados):
+    # Converte a tabela de metadados para o formato de verificar_NaN
+    df_NaN = metadados[metadados['qt_nulos'] > 0][['nome_variavel', 'qt_nulos', 'percent_nulos']]
+    df_NaN = df_NaN.rename(columns={'nome_variavel': 'coluna', 'qt_nulos': 'qnt_NaN', 'percent_nulos': 'percentual_NaN'})
+    df_NaN['percentual_NaN'] = df_NaN['percentual_NaN'].apply(lambda x: f'{x:.2f}%')
+    df_NaN = df_NaN.sort_values(by='qnt_NaN', ascending=False).reset_index(drop=True)
+    return df_NaN
+
+
+@instrumentar
+def verificar_NaN (dataframe: pd.DataFrame):
+    #Verifica a quantidade de valores NaN em cada coluna do dataframe
+    #Retorna colunas com NaN, a quantidade de NaN em cada coluna e o percentual de NaN em cada coluna
+    return _tabela_NaN(_contar_nulos(dataframe))
+
+
+@instrumentar
+def verificar_duplicados (dataframe, aproximado=False):
+    #Verifica a quantidade de valores duplicados em cada coluna do dataframe
+    #Retorna colunas com duplicados, a quantidade de duplicados em cada coluna e o percentual de duplicados em cada coluna
+    #(valores repetidos = valores não nulos - cardinalidade)
+    metadados = perfilar_dataframe(dataframe, aproximado=aproximado, estatisticas=('cardinalidade',))['metadados']
+    quantidade_duplicados = (len(dataframe) - metadados['qt_nulos'] - metadados['cardinalidade']).clip(lower=0)
+    if quantidade_duplicados.sum() == 0:
+        print("Não há valores duplicados no dataframe.")
+    else:
+        df_dup = pd.DataFrame({'coluna': metadados['nome_variavel'], 'qnt_dup': quantidade_duplicados})
+        df_dup = df_dup[df_dup['qnt_dup'] > 0]
+        df_dup['percentual_dup'] = ((df_dup['qnt_dup'] / len(dataframe)) * 100).round(2)
+        df_dup['percentual_dup'] = df_dup['percentual_dup'].apply(lambda x: f'{x:.2f}%') 
+        df_dup = df_dup.sort_values(by='qnt_dup', ascending=False).reset_index(drop=True)
+        return df_dup
+
+@instrumentar
+def gerar_metadados(dataframe, aproximado=False):
+    # Gera um dataframe com metadados do dataframe original
+    # Parâmetros: dataframe = dataframe original, aproximado = estima a cardinalidade (dataframes grandes)
+    # Retorna um dataframe com os metadados
+
+    metadados = perfilar_dataframe(dataframe, aproximado=aproximado, estatisticas=('cardinalidade',))['metadados']
+    metadados = metadados[['nome_variavel', 'tipo', 'qt_nulos', 'percent_nulos', 'cardinalidade']]
+
+    # Não reordena as colunas
+    metadados = metadados.reset_index(drop=True)
+
+    return metadados
+
+@instrumentar
+def verifica_dados_duplicados(dataframe):
+    filtro = dataframe.duplicated()  # cada linha é hasheada uma única vez
+    qtd = filtro.sum()
+    print(f'Foram encontrados {qtd} de registros duplicados\n')
+    print('Prévia dos dados')
+    return dataframe[filtro]
@@ -0,0 +1,111 @@
+"""Leitor do export largo do World Bank WDI."""
+
+import re
+
+import pandas as pd
+
+from .instrumentacao import instrumentar
+
+
+# --- Leitor do export largo do World Bank WDI (ex.: arquivo1.csv) ---
+# Colunas de chave do export e o nome usado no restante do projeto
+COLUNAS_CHAVE_WDI = {'Time': 'year', 'Country Name': 'country', 'Country Code': 'code'}
+_CODIGO_WDI = re.compile(r'\[([^\[\]]+)\]\s*$')
+
+
+def indicadores_wdi(path, encoding = 'utf-8'):
+    """
+    Lê apenas o cabeçalho do export WDI e lista os indicadores disponíveis.
+
+    Args:
+        path (str): Caminho do arquivo.
+        encoding (str): Codificação do arquivo. Padrão é 'utf-8'.
+
+    Returns:
+        pd.DataFrame: codigo (ex.: 'EG.ELC.ACCS.ZS'), descricao (rótulo longo) e coluna (nome original).
+    """
+    colunas = pd.read_csv(path, nrows=0, encoding=encoding).columns
+    linhas = []
+    for coluna in colunas:
+        achado = _CODIGO_WDI.search(coluna)
+        if achado:
+            linhas.append({
+                'codigo': achado.group(1),
+                'descricao': coluna[:achado.start()].strip(),
+                'coluna': coluna,
+            })
+    return pd.DataFrame(linhas, columns=['codigo', 'descricao', 'coluna'])
+
+
+@instrumentar
+def import_wdi(path, indicadores = None, formato = 'largo', encoding = 'utf-8', tipo_valor = 'float64',
+               chunksize = None):
+    """
+    Importa o export largo do WDI tratando '..' como ausente já no parse.
+
+    As colunas de indicador passam a ser chamadas pelo código entre colchetes e o rótulo longo
+    fica em df.attrs['indicadores'] ({codigo: descricao}). As chaves viram 'country', 'code' e 'year';
+    as linhas de rodapé do export (sem ano) são descartadas.
+
+    Args:
+        path (str): Caminho do arquivo.
+        indicadores (list): Códigos (ou rótulos completos) a carregar. Padrão: todos.
+            Carregar só o necessário evita o parse das demais colunas.
+        formato (str): 'largo' (uma coluna por indicador) ou 'longo' (country, code, year, indicador, valor).
+        encoding (str): Codificação do arquivo. Padrão é 'utf-8'.
+        tipo_valor (str): Tipo numérico dos indicadores. Padrão é 'float64'.
+        chunksize (int): Se informado, lê o arquivo em blocos (útil no formato 'longo' para
+            converter cada bloco sem montar o dataframe largo inteiro).
+
+    Returns:
+        pd.DataFrame: O DataFrame no formato pedido.
+    """
+    if formato not in ('largo', 'longo'):
+        print("Formato inválido. Use 'largo' ou 'longo'.")
+        return
+
+    catalogo = indicadores_wdi(path, encoding)
+    if indicadores is not None:
+        pedidos = set(indicadores)
+        selecionados = catalogo[catalogo['codigo'].isin(pedidos) | catalogo['coluna'].isin(pedidos)]
+        faltando = pedidos - set(selecionados['codigo']) - set(selecionados['coluna'])
+        if faltando:
+            print(f"Indicadores não encontrados no arquivo: {sorted(faltando)}")
+        catalogo = selecionados
+
+    renomear = dict(COLUNAS_CHAVE_WDI)
+    renomear.update(zip(catalogo['coluna'], catalogo['codigo']))
+    descricoes = dict(zip(catalogo['codigo'], catalogo['descricao']))
+
+    leitor = pd.read_csv(
+        path,
+        encoding=encoding,
+        usecols=list(COLUNAS_CHAVE_WDI) + list(catalogo['coluna']),
+        na_values=['..'],
+        dtype={coluna: tipo_valor for coluna in catalogo['coluna']} | {'Time': 'str'},
+        chunksize=chunksize,
+    )
+    blocos = [leitor] if chunksize is None else leitor
+
+    partes = []
+    for bloco in blocos:
+        bloco = bloco.rename(columns=renomear)
+        # Rodapé do export ('Data from database...', 'Last Updated...') não tem ano numérico
+        bloco['year'] = pd.to_numeric(bloco['year'], errors='coerce')
+        bloco = bloco[bloco['year'].notna()]
+        bloco = bloco.astype({'year': 'int16'})
+        if formato == 'longo':
+            bloco = bloco.melt(
+                id_vars=['country', 'code', 'year'],
+                var_name='indicador',
+                value_name='valor',
+            ).dropna(subset=['valor'])
+        partes.append(bloco)
+
+    df = pd.concat(partes, ignore_index=True) if len(partes) > 1 else partes[0].reset_index(drop=True)
+    df = df.astype({'country': 'category', 'code': 'category'})
+    if formato == 'longo':
+        df['indicador'] = pd.Categorical(df['indicador'], categories=list(catalogo['codigo']))
+    df.attrs['indicadores'] = descricoes
+    print("Arquivo importado com sucesso!")
+    return df